@@ -1,4 +1,28 @@
+import array
+import atexit
+import bisect
+import collections
+import csv
+import functools
+import gzip
+import hashlib
+import json
+import mmap
 import os
+import re
+import shutil
+import sqlite3
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait as concurrentWait
+from fractions import Fraction
+from xml.etree import ElementTree
+from urllib.parse import unquote
 from shift.core.workflow import SOperator
 from shift.core.workflow import SPlug
 from shift.core.constants import SType
@@ -18,14 +42,23 @@ except:
     logger.warning("The DaVinciResolveScript API could not be imported during the loading of 'shift_resolve' catalog. "
                    "You won't be able to execute the operators from this catalog.")
 
+try:
+    import numpy
+except ImportError:
+    # NumPy is optional, the columnar utilities use the array module when it's not available
+    numpy = None
+
 
 def getHost():
-    """Method to check the current host. If Davinci Resolve is available the result will be resolve.
+    """Method to check the current host. If Davinci Resolve is available, or a recorded session is replayed,
+    the result will be resolve.
 
     @return str: The name of the Host.
 
     """
     host = None
+    if dvrReplay is not None:
+        return "resolve"
     try:
         import DaVinciResolveScript as dvr_script
         host = "resolve"
@@ -35,159 +68,3796 @@ def getHost():
     return host
 
 
-class DVR_Base(SOperator):
-    """Base Davinci Resolve Operator class with utility methods."""
-    # Define operator constants
-    if resolve is not None:
-        timelineTypes = {
-            "FCP7 XML": {"suffix": ".xml", "type": resolve.EXPORT_FCP_7_XML},
-            "EDL - CMX 3600": {"suffix": ".edl", "type": [resolve.EXPORT_EDL, resolve.EXPORT_NONE]},
-            "FCPXML 1.3": {"suffix": ".fcpxml", "type": resolve.EXPORT_FCPXML_1_3},
-            "FCPXML 1.4": {"suffix": ".fcpxml", "type": resolve.EXPORT_FCPXML_1_4},
-            "FCPXML 1.5": {"suffix": ".fcpxml", "type": resolve.EXPORT_FCPXML_1_5},
-            "FCPXML 1.6": {"suffix": ".fcpxml", "type": resolve.EXPORT_FCPXML_1_6},
-            "FCPXML 1.7": {"suffix": ".fcpxml", "type": resolve.EXPORT_FCPXML_1_7},
-            "FCPXML 1.8": {"suffix": ".fcpxml", "type": resolve.EXPORT_FCPXML_1_8},
-            "AAF": {"suffix": ".aaf", "type": [resolve.EXPORT_AAF, resolve.EXPORT_AAF_NEW]},
-            "DaVinci Resolve Timeline": {"suffix": ".drt", "type": resolve.EXPORT_DRT},
-            "EDL - CDL": {"suffix": ".edl", "type": [resolve.EXPORT_EDL, resolve.EXPORT_CDL]},
-            "EDL - SDL": {"suffix": ".edl", "type": [resolve.EXPORT_EDL, resolve.EXPORT_SDL]},
-            "EDL - Missing Clips": {"suffix": ".edl", "type": [resolve.EXPORT_EDL, resolve.EXPORT_MISSING_CLIPS]},
-            "HDR10 Profile A": {"suffix": ".xml", "type": resolve.EXPORT_HDR_10_PROFILE_A},
-            "HDR10 Profile B": {"suffix": ".xml", "type": resolve.EXPORT_HDR_10_PROFILE_B},
-            "Dolby Vision 2.9": {"suffix": ".xml", "type": resolve.EXPORT_DOLBY_VISION_VER_2_9},
-            "Dolby Vision 4.0": {"suffix": ".xml", "type": resolve.EXPORT_DOLBY_VISION_VER_4_0},
-            "CSV": {"suffix": ".csv", "type": resolve.EXPORT_TEXT_CSV},
-            "Tabbed Text": {"suffix": ".txt", "type": resolve.EXPORT_TEXT_TAB},
-        }
+# Frame rates supported by the timecode utilities. The drop frame timecodes are only valid for 29.97 and 59.94.
+timecodeRates = ["23.976", "24", "25", "29.97", "30", "50", "59.94", "60"]
+timecodeNominalFps = {"23.976": 24, "24": 24, "25": 25, "29.97": 30, "30": 30, "50": 50, "59.94": 60, "60": 60}
+timecodePattern = re.compile(r"^\s*(\d{1,2})[:;.](\d{2})[:;.](\d{2})([:;.])(\d{2,3})\s*$")
+timecodeSeparators = ":;."
+
+
+def timecodeToFrames(timecode, fps, dropFrame=None):
+    """Converts a timecode string like "01:00:00:00" to a frame number.
+
+    @param timecode str: The timecode to convert.
+    @param fps str: The frame rate of the timecode. One of the timecodeRates values.
+    @param dropFrame bool: True if the timecode is drop frame. If it's None, the timecode is considered drop frame
+        when the frames separator is ';' or '.'. (Default=None)
+
+    @return int: The frame number for the timecode.
+
+    @raises ValueError: Raise an error if the timecode or the frame rate are not valid.
+
+    """
+    match = timecodePattern.match(timecode)
+    if match is None:
+        raise ValueError("The value '{0}' is not a valid timecode.".format(timecode))
+    hours, minutes, seconds, separator, frames = match.groups()
+    if fps not in timecodeNominalFps:
+        raise ValueError("The frame rate '{0}' is not supported. Use one of {1}.".format(fps, timecodeRates))
+    nominalFps = timecodeNominalFps[fps]
+    if dropFrame is None:
+        dropFrame = separator != ":"
+    totalMinutes = int(hours) * 60 + int(minutes)
+    result = (totalMinutes * 60 + int(seconds)) * nominalFps + int(frames)
+    if dropFrame and fps in ("29.97", "59.94"):
+        dropCount = nominalFps // 15  # 2 frames at 29.97, 4 frames at 59.94
+        result -= dropCount * (totalMinutes - totalMinutes // 10)
+    return result
+
+
+def timecodesToFrames(timecodes, fps, dropFrame=None):
+    """Converts a sequence of timecode strings to frame numbers.
+    With NumPy available, the timecodes with the "HH:MM:SS:FF" layout are converted all at once operating over
+    their characters like an array. Any other timecode is converted with timecodeToFrames.
+    Empty values are converted to -1.
+
+    @param timecodes list: The timecodes to convert.
+    @param fps str: The frame rate of the timecodes. One of the timecodeRates values.
+    @param dropFrame bool: True if the timecodes are drop frame. If it's None, each timecode is considered
+        drop frame when its frames separator is ';' or '.'. (Default=None)
+
+    @return numpy.ndarray|array.array: The frame numbers, like int64 values.
+
+    @raises ValueError: Raise an error if any of the timecodes or the frame rate are not valid.
+
+    """
+    if fps not in timecodeNominalFps:
+        raise ValueError("The frame rate '{0}' is not supported. Use one of {1}.".format(fps, timecodeRates))
+    if numpy is None:
+        return array.array("q", (timecodeToFrames(timecode, fps, dropFrame) if timecode else -1
+                                 for timecode in timecodes))
+    values = numpy.asarray(timecodes, dtype="U")
+    frames = numpy.full(len(values), -1, dtype=numpy.int64)
+    if not len(values):
+        return frames
+    lengths = numpy.char.str_len(values)
+    fixed = numpy.flatnonzero(lengths == 11)
+    if len(fixed):
+        # The characters like unicode code points, minus the code of '0'. The unsigned subtraction makes the
+        # characters below '0' very big values, so the digits are the values up to 9.
+        fixedValues = values[fixed]
+        if fixedValues.dtype.itemsize != 44:
+            fixedValues = fixedValues.astype("U11")
+        chars = fixedValues.view(numpy.uint32).reshape(-1, 11) - numpy.uint32(48)
+        separators = numpy.array([ord(separator) for separator in timecodeSeparators], dtype=numpy.uint32) - 48
+        valid = (numpy.all(chars[:, [0, 1, 3, 4, 6, 7, 9, 10]] <= 9, axis=1) &
+                 numpy.all(numpy.isin(chars[:, [2, 5, 8]], separators), axis=1))
+        fixed = fixed[valid]
+        chars = chars[valid].astype(numpy.int64)
+        nominalFps = timecodeNominalFps[fps]
+        totalMinutes = (chars[:, 0] * 10 + chars[:, 1]) * 60 + chars[:, 3] * 10 + chars[:, 4]
+        result = ((totalMinutes * 60 + chars[:, 6] * 10 + chars[:, 7]) * nominalFps +
+                  chars[:, 9] * 10 + chars[:, 10])
+        if fps in ("29.97", "59.94"):
+            if dropFrame is None:
+                isDrop = chars[:, 8] != ord(":") - 48
+            else:
+                isDrop = numpy.full(len(chars), bool(dropFrame))
+            dropCount = nominalFps // 15
+            result -= isDrop * dropCount * (totalMinutes - totalMinutes // 10)
+        frames[fixed] = result
+    # Convert the remaining values one by one
+    pending = numpy.ones(len(values), dtype=bool)
+    if len(fixed):
+        pending[fixed] = False
+    for idx in numpy.flatnonzero(pending & (lengths > 0)):
+        frames[idx] = timecodeToFrames(str(values[idx]), fps, dropFrame)
+    return frames
+
+
+def _timecodeRate(fps, dropFrame):
+    """Returns the values required to convert frames of a frame rate to timecodes.
+
+    @param fps str: The frame rate. One of the timecodeRates values.
+    @param dropFrame bool: True for drop frame timecodes.
+
+    @return tuple: The nominal frame rate, the frames dropped each minute (0 if it's not drop frame), the frames
+        in 10 minutes and the frames in a minute that is not multiple of 10.
+
+    @raises ValueError: Raise an error if the frame rate is not supported.
+
+    """
+    if fps not in timecodeNominalFps:
+        raise ValueError("The frame rate '{0}' is not supported. Use one of {1}.".format(fps, timecodeRates))
+    nominalFps = timecodeNominalFps[fps]
+    dropCount = nominalFps // 15 if dropFrame and fps in ("29.97", "59.94") else 0
+    return nominalFps, dropCount, nominalFps * 600 - dropCount * 9, nominalFps * 60 - dropCount
+
+
+def framesToTimecode(frame, fps, dropFrame=False):
+    """Converts a frame number to a timecode string like "01:00:00:00", the inverse of timecodeToFrames.
+    The drop frame timecodes use ';' like frames separator. The frame numbers of more than 24 hours wrap around.
+
+    @param frame int: The frame number.
+    @param fps str: The frame rate of the timecode. One of the timecodeRates values.
+    @param dropFrame bool: True to return a drop frame timecode. Only valid for 29.97 and 59.94. (Default=False)
+
+    @return str: The timecode.
+
+    @raises ValueError: Raise an error if the frame rate is not supported.
+
+    """
+    nominalFps, dropCount, tenMinuteFrames, minuteFrames = _timecodeRate(fps, dropFrame)
+    frame = int(frame) % (tenMinuteFrames * 144)
+    if dropCount:
+        tenMinutes, remainder = divmod(frame, tenMinuteFrames)
+        frame += dropCount * 9 * tenMinutes
+        if remainder > dropCount:
+            frame += dropCount * ((remainder - dropCount) // minuteFrames)
+    seconds, frames = divmod(frame, nominalFps)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return "{0:02d}:{1:02d}:{2:02d}{3}{4:02d}".format(hours, minutes, seconds, ";" if dropCount else ":", frames)
+
+
+def framesToTimecodes(frames, fps, dropFrame=False):
+    """Converts a sequence of frame numbers to timecode strings.
+    With NumPy available, the frames are converted all at once operating over arrays, if not they are converted
+    with framesToTimecode.
+
+    @param frames list: The frame numbers to convert.
+    @param fps str: The frame rate of the timecodes. One of the timecodeRates values.
+    @param dropFrame bool: True to return drop frame timecodes. Only valid for 29.97 and 59.94. (Default=False)
+
+    @return list: The timecodes.
+
+    @raises ValueError: Raise an error if the frame rate is not supported.
+
+    """
+    nominalFps, dropCount, tenMinuteFrames, minuteFrames = _timecodeRate(fps, dropFrame)
+    if numpy is None:
+        return [framesToTimecode(frame, fps, dropFrame) for frame in frames]
+    values = numpy.asarray(frames, dtype=numpy.int64) % (tenMinuteFrames * 144)
+    if not len(values):
+        return []
+    if dropCount:
+        tenMinutes, remainder = numpy.divmod(values, tenMinuteFrames)
+        values = values + dropCount * 9 * tenMinutes + \
+            (remainder > dropCount) * dropCount * ((remainder - dropCount) // minuteFrames)
+    seconds, frameDigits = numpy.divmod(values, nominalFps)
+    minutes, seconds = numpy.divmod(seconds, 60)
+    hours, minutes = numpy.divmod(minutes, 60)
+    # Build the characters of all the timecodes like a (n, 11) array of bytes
+    chars = numpy.empty((len(values), 11), dtype=numpy.uint8)
+    for column, field in ((0, hours), (3, minutes), (6, seconds), (9, frameDigits)):
+        chars[:, column] = field // 10 + 48
+        chars[:, column + 1] = field % 10 + 48
+    chars[:, 2] = chars[:, 5] = ord(":")
+    chars[:, 8] = ord(";") if dropCount else ord(":")
+    return chars.view("S11").ravel().astype("U11").tolist()
+
+
+EdlEvent = collections.namedtuple(
+    "EdlEvent",
+    ["event", "reel", "track", "transition", "srcIn", "srcOut", "recIn", "recOut", "clipName", "comments", "cdl"])
+
+
+def _parseCdlValues(text):
+    """Returns the float values inside the parenthesis groups of an ASC_SOP comment.
+
+    @param text str: The text after the ASC_SOP key, like "(1.0 1.0 1.0)(0.0 0.0 0.0)(1.0 1.0 1.0)".
+
+    @return list: A tuple of 3 floats for each group.
+
+    """
+    values = [float(value) for value in text.replace("(", " ").replace(")", " ").split()]
+    return [tuple(values[idx:idx + 3]) for idx in range(0, len(values), 3)]
+
+
+def iterEdlEvents(filepath, fps="24"):
+    """Generator that reads a CMX 3600, CDL or SDL EDL file and yields one EdlEvent record for each event line.
+    The file is read line by line, so only the event being read is kept in memory.
+    The source and record times are returned like frame numbers. The comment lines of each event, starting with
+    '*' or '|' like the marker comments of Resolve, are returned in the comments tuple, and the ASC_SOP and ASC_SAT
+    values, if any, in the cdl dictionary.
+
+    The comment lines before the first event belong to the header of the file and are ignored.
+
+    @param filepath str: The path to the EDL file.
+    @param fps str: The frame rate of the EDL timecodes. One of the timecodeRates values. (Default="24")
+
+    @return generator: The EdlEvent records of the file.
+
+    @raises ValueError: Raise an error with the file and line number if an event line can't be parsed.
+
+    """
+    dropFrame = None
+    current = None
+    comments = []
+    cdl = {}
+    clipName = ""
+    with open(filepath, "r", errors="replace") as edlFile:
+        for lineNumber, line in enumerate(edlFile, 1):
+            if line.startswith("*") or line.lstrip().startswith("|"):
+                if current is None:
+                    continue
+                comment = line.strip().lstrip("*").strip()
+                key, _, value = comment.partition(" ")
+                try:
+                    if comment.startswith("FROM CLIP NAME:"):
+                        clipName = comment.partition(":")[2].strip()
+                    elif key == "ASC_SOP":
+                        sop = _parseCdlValues(value)
+                        if len(sop) == 3:
+                            cdl["slope"], cdl["offset"], cdl["power"] = sop
+                    elif key == "ASC_SAT":
+                        cdl["saturation"] = float(value)
+                except ValueError as e:
+                    raise ValueError("{0}, line {1}: {2}".format(filepath, lineNumber, str(e)))
+                comments.append(comment)
+                continue
+            tokens = line.split()
+            if not tokens:
+                continue
+            first = tokens[0]
+            if first.isdigit() and len(tokens) >= 8 and timecodePattern.match(tokens[-1]):
+                if current is not None:
+                    yield EdlEvent(*current, clipName=clipName, comments=tuple(comments), cdl=cdl or None)
+                    comments = []
+                    cdl = {}
+                    clipName = ""
+                try:
+                    current = (
+                        int(first), tokens[1], tokens[2], " ".join(tokens[3:-4]),
+                        timecodeToFrames(tokens[-4], fps, dropFrame), timecodeToFrames(tokens[-3], fps, dropFrame),
+                        timecodeToFrames(tokens[-2], fps, dropFrame), timecodeToFrames(tokens[-1], fps, dropFrame))
+                except ValueError as e:
+                    raise ValueError("{0}, line {1}: {2}".format(filepath, lineNumber, str(e)))
+            elif first == "FCM:":
+                dropFrame = "NON" not in line.upper()
+        if current is not None:
+            yield EdlEvent(*current, clipName=clipName, comments=tuple(comments), cdl=cdl or None)
+
+
+# Columns of the timeline tables converted to integers, and the pattern of the columns always kept like text
+timelineTableIntegerColumns = frozenset(["#", "Event", "Frames", "Duration Frames", "Start Frame", "End Frame",
+                                         "Track", "V", "Clip Count"])
+timelineTableTextPattern = re.compile(r"name|reel|clip$|comment|note|keyword", re.IGNORECASE)
+
+
+def readTimelineTable(filepath, fps="24"):
+    """Reads a CSV or Tabbed Text timeline file, like the ones exported by DVR_TimelineExport, into columns.
+    The columns where every value is a timecode are converted to frame numbers and the known frame and count
+    columns, the timelineTableIntegerColumns, are converted to integers. The name, reel and clip columns are
+    always kept like text, so values like "001" keep their leading zeros. With NumPy available every column is
+    returned like a numpy array, if not, the numeric columns are returned like array.array and the text columns
+    like lists.
+    The Tabbed Text format is used for the files with the .txt suffix.
+
+    @param filepath str: The path to the CSV or Tabbed Text file.
+    @param fps str: The frame rate of the timecodes. One of the timecodeRates values. (Default="24")
+
+    @return dict: The values of each column by the column name.
+    @return list: The names of the columns converted from timecodes to frames.
+
+    """
+    delimiter = "\t" if filepath.lower().endswith(".txt") else ","
+    with open(filepath, "r", newline="", encoding="utf-8-sig", errors="replace") as tableFile:
+        reader = csv.reader(tableFile, delimiter=delimiter)
+        header = next(reader, [])
+        columns = [[] for _ in header]
+        appenders = [column.append for column in columns]
+        width = len(header)
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row.extend([""] * (width - len(row)))
+            for append, value in zip(appenders, row):
+                append(value)
+
+    table = {}
+    timecodeColumns = []
+    for name, values in zip(header, columns):
+        nonEmpty = [value for value in values if value]
+        if timelineTableTextPattern.search(name):
+            table[name] = numpy.array(values) if numpy is not None else values
+        elif nonEmpty and all(timecodePattern.match(value) for value in nonEmpty):
+            table[name] = timecodesToFrames(values, fps)
+            timecodeColumns.append(name)
+        elif name in timelineTableIntegerColumns and nonEmpty and \
+                all(value.lstrip("-").isdigit() for value in nonEmpty):
+            if numpy is not None:
+                table[name] = numpy.array([int(value) if value else -1 for value in values], dtype=numpy.int64)
+            else:
+                table[name] = array.array("q", (int(value) if value else -1 for value in values))
+        else:
+            table[name] = numpy.array(values) if numpy is not None else values
+    return table, timecodeColumns
+
+
+TimelineXmlClip = collections.namedtuple(
+    "TimelineXmlClip", ["name", "track", "recIn", "recOut", "srcIn", "srcOut", "assetId", "assetName", "src"])
+
+
+def _fileUrlToPath(url):
+    """Converts a file url from a timeline XML file to a filesystem path.
+
+    @param url str: The url, like "file:///Volumes/Media/A001.mov" or "file://localhost/C:/Media/A001.mov".
+
+    @return str: The filesystem path.
+
+    """
+    if not url or not url.startswith("file:"):
+        return url or ""
+    path = unquote(url[len("file:"):])
+    if path.startswith("//localhost/"):
+        path = path[len("//localhost"):]
+    elif path.startswith("//"):
+        path = path[2:]
+    if re.match(r"^/[A-Za-z]:", path):  # Windows drive paths
+        path = path[1:]
+    return path
+
+
+def _rationalToSeconds(value):
+    """Converts a FCPXML rational time like "1001/24000s" or "3600s" to seconds.
+
+    @param value str: The rational time.
+
+    @return fractions.Fraction: The time in seconds. 0 if the value is empty.
+
+    """
+    if not value:
+        return Fraction(0)
+    return Fraction(value.rstrip("s"))
+
+
+def _iterFcpxmlClips(context, events):
+    """Generator that yields the TimelineXmlClip records from the iterparse events of a FCPXML file.
+    The times of the clips are converted to frames using the frame duration of the sequence format.
+    The record times of the connected clips and the secondary storylines are converted to the timeline time
+    using the offset and start of their parent clips. Only the clips of the project sequence are yielded, in
+    document order, the sequences of the compound clips inside the resources are skipped.
+
+    @param context tuple: The (event, element) of the root element.
+    @param events iterator: The iterparse iterator, after the root element.
+
+    @return generator: The TimelineXmlClip records.
+
+    """
+    clipTags = ("asset-clip", "clip", "ref-clip", "mc-clip", "sync-clip")
+    formats = {}
+    assets = {}
+    frameDuration = None
+    elements = [context[1]]
+    # Number of open resources and project sequence elements around the current element
+    resourcesDepth = 0
+    sequenceDepth = 0
+    # Each clip context stores the timeline time of the clip local time 0 and the lane. The clips without ref take
+    # it from their first video or audio child, with the shift from the clip local time to the media time.
+    clipContexts = [{"origin": Fraction(0), "lane": 0, "ref": None, "mediaShift": Fraction(0)}]
+    # The records of a spine clip and its connected clips are kept until the spine clip ends,
+    # so they can be yielded in document order
+    pending = []
+    for event, elem in events:
+        tag = elem.tag
+        if event == "start":
+            elements.append(elem)
+            if tag == "resources":
+                resourcesDepth += 1
+            elif resourcesDepth:
+                continue
+            elif tag == "sequence":
+                sequenceDepth += 1
+                sequenceFormat = formats.get(elem.get("format"))
+                if sequenceFormat is not None:
+                    frameDuration = sequenceFormat
+            elif sequenceDepth and elem.get("offset") is not None:
+                parent = clipContexts[-1]
+                offset = parent["origin"] + _rationalToSeconds(elem.get("offset"))
+                lane = int(elem.get("lane", parent["lane"]))
+                if tag in ("video", "audio") and parent["ref"] is None and len(clipContexts) > 1:
+                    parent["ref"] = elem.get("ref")
+                    parent["mediaShift"] = _rationalToSeconds(elem.get("start")) - \
+                        _rationalToSeconds(elem.get("offset"))
+                clipContexts.append({"origin": offset - _rationalToSeconds(elem.get("start")), "offset": offset,
+                                     "lane": lane, "ref": elem.get("ref"), "mediaShift": Fraction(0),
+                                     "index": len(pending) if tag in clipTags else None})
+                if tag in clipTags:
+                    pending.append(None)
+            continue
+
+        elements.pop()
+        if tag == "resources":
+            resourcesDepth -= 1
+            continue
+        elif tag == "format":
+            if elem.get("frameDuration"):
+                formats[elem.get("id")] = _rationalToSeconds(elem.get("frameDuration"))
+        elif tag == "asset":
+            src = elem.get("src")
+            if not src:
+                mediaRep = elem.find("media-rep")
+                src = mediaRep.get("src") if mediaRep is not None else ""
+            assets[elem.get("id")] = (elem.get("name", ""), _fileUrlToPath(src))
+        elif tag == "media":
+            # The compound clips are referenced like assets, without media path
+            assets[elem.get("id")] = (elem.get("name", ""), "")
+        elif resourcesDepth:
+            continue
+        elif tag == "sequence":
+            sequenceDepth -= 1
+            continue
+        elif sequenceDepth and elem.get("offset") is not None and len(clipContexts) > 1:
+            clipContext = clipContexts.pop()
+            if tag in clipTags:
+                if frameDuration is None:
+                    raise ValueError("The sequence format of the FCPXML file could not be found.")
+                duration = _rationalToSeconds(elem.get("duration"))
+                srcIn = _rationalToSeconds(elem.get("start")) + clipContext["mediaShift"]
+                assetName, src = assets.get(clipContext["ref"], ("", ""))
+                pending[clipContext["index"]] = TimelineXmlClip(
+                    elem.get("name", assetName), "L{0}".format(clipContext["lane"]),
+                    int(round(clipContext["offset"] / frameDuration)),
+                    int(round((clipContext["offset"] + duration) / frameDuration)),
+                    int(round(srcIn / frameDuration)), int(round((srcIn + duration) / frameDuration)),
+                    clipContext["ref"], assetName, src)
+            if len(clipContexts) == 1:
+                for record in pending:
+                    yield record
+                pending = []
+        else:
+            continue
+        # The processed elements are removed from the tree to keep the memory flat
+        elem.clear()
+        if elements:
+            elements[-1].remove(elem)
+
+
+def _iterFcp7XmlClips(context, events):
+    """Generator that yields the TimelineXmlClip records from the iterparse events of a FCP7 XML (xmeml) file.
+    The files are defined the first time they are used, so the file name and path are stored by id to resolve
+    the next references to the same file.
+
+    @param context tuple: The (event, element) of the root element.
+    @param events iterator: The iterparse iterator, after the root element.
+
+    @return generator: The TimelineXmlClip records.
+
+    """
+    files = {}
+    elements = [context[1]]
+    trackCounts = {"video": 0, "audio": 0}
+    track = ""
+    for event, elem in events:
+        tag = elem.tag
+        if event == "start":
+            if tag == "track" and elements[-1].tag in trackCounts:
+                mediaType = elements[-1].tag
+                trackCounts[mediaType] += 1
+                track = "{0}{1}".format(mediaType[0].upper(), trackCounts[mediaType])
+            elements.append(elem)
+            continue
+
+        elements.pop()
+        if tag != "clipitem" or elements[-1].tag != "track":
+            continue
+        fileElem = elem.find("file")
+        fileId = None
+        if fileElem is not None:
+            fileId = fileElem.get("id")
+            if len(fileElem):
+                files[fileId] = (fileElem.findtext("name", ""), _fileUrlToPath(fileElem.findtext("pathurl", "")))
+        assetName, src = files.get(fileId, ("", ""))
+        yield TimelineXmlClip(
+            elem.findtext("name", assetName), track,
+            int(elem.findtext("start", "-1")), int(elem.findtext("end", "-1")),
+            int(elem.findtext("in", "-1")), int(elem.findtext("out", "-1")),
+            fileId, assetName, src)
+        # The processed elements are removed from the tree to keep the memory flat
+        elem.clear()
+        elements[-1].remove(elem)
+
+
+def iterTimelineXmlClips(filepath):
+    """Generator that reads a FCP7 XML or FCPXML (1.3 to 1.8) timeline file and yields one TimelineXmlClip record
+    for each clip of the timeline. The file is parsed incrementally and the processed elements are removed from
+    the tree, so big timelines can be read without loading the full document in memory.
+    The record and source times are returned like frame numbers and the asset references are resolved to the
+    asset name and the filesystem path of the media.
+
+    @param filepath str: The path to the XML file.
+
+    @return generator: The TimelineXmlClip records.
+
+    """
+    events = ElementTree.iterparse(filepath, events=("start", "end"))
+    context = next(events)
+    rootTag = context[1].tag
+    if rootTag == "fcpxml":
+        return _iterFcpxmlClips(context, events)
+    elif rootTag == "xmeml":
+        return _iterFcp7XmlClips(context, events)
+    raise ValueError("The XML root '{0}' is not a FCP7 XML or FCPXML timeline.".format(rootTag))
+
+
+TimelineEvent = collections.namedtuple("TimelineEvent", ["clip", "track", "srcIn", "srcOut", "recIn", "recOut"])
+
+
+def iterTimelineEvents(filepath, fps="24"):
+    """Generator that reads an exported timeline file in any of the text formats supported by the catalog readers
+    (EDL, FCP7 XML, FCPXML, CSV or Tabbed Text) and yields one TimelineEvent record for each clip event.
+    The clip of each event is the clip name or reel in the EDL files, the media path in the XML files and the
+    name or reel column in the CSV and Tabbed Text files.
+
+    @param filepath str: The path to the timeline file.
+    @param fps str: The frame rate of the timecodes. One of the timecodeRates values. Not used by the XML files
+        that define their own frame rate. (Default="24")
+
+    @return generator: The TimelineEvent records.
+
+    @raises ValueError: Raise an error if the file format is not supported.
+
+    """
+    suffix = os.path.splitext(filepath)[1].lower()
+    if suffix == ".edl":
+        for event in iterEdlEvents(filepath, fps):
+            yield TimelineEvent(event.clipName or event.reel, event.track,
+                                event.srcIn, event.srcOut, event.recIn, event.recOut)
+    elif suffix in (".xml", ".fcpxml"):
+        for clip in iterTimelineXmlClips(filepath):
+            yield TimelineEvent(clip.src or clip.assetName or clip.name, clip.track,
+                                clip.srcIn, clip.srcOut, clip.recIn, clip.recOut)
+    elif suffix in (".csv", ".txt"):
+        table, _ = readTimelineTable(filepath, fps)
+        clipColumn = next((name for name in ("Name", "Clip Name", "EDL Clip Name", "Reel", "Reel Name")
+                           if name in table), None)
+        timeColumns = ("Source In", "Source Out", "Record In", "Record Out")
+        if clipColumn is None or any(name not in table for name in timeColumns):
+            raise ValueError("The timeline table '{0}' doesn't have the name and the source and record "
+                             "timecode columns.".format(filepath))
+        trackColumn = table.get("V", table.get("Track"))
+        columns = [table[clipColumn]] + [table[name] for name in timeColumns]
+        for idx, (clip, srcIn, srcOut, recIn, recOut) in enumerate(zip(*columns)):
+            track = str(trackColumn[idx]) if trackColumn is not None else ""
+            yield TimelineEvent(str(clip), track, int(srcIn), int(srcOut), int(recIn), int(recOut))
     else:
-        # If Resolve it's not available we don't want the OP creation fail, we create a dummy constant
-        timelineTypes = {
-            "FCP7 XML": {"suffix": ".xml", "type": None},
-            "EDL - CMX 3600": {"suffix": ".edl", "type": None},
-            "FCPXML 1.3": {"suffix": ".fcpxml", "type": None},
-            "FCPXML 1.4": {"suffix": ".fcpxml", "type": None},
-            "FCPXML 1.5": {"suffix": ".fcpxml", "type": None},
-            "FCPXML 1.6": {"suffix": ".fcpxml", "type": None},
-            "FCPXML 1.7": {"suffix": ".fcpxml", "type": None},
-            "FCPXML 1.8": {"suffix": ".fcpxml", "type": None},
-            "AAF": {"suffix": ".aaf", "type": None},
-            "DaVinci Resolve Timeline": {"suffix": ".drt", "type": None},
-            "EDL - CDL": {"suffix": ".edl", "type": None},
-            "EDL - SDL": {"suffix": ".edl", "type": None},
-            "EDL - Missing Clips": {"suffix": ".edl", "type": None},
-            "HDR10 Profile A": {"suffix": ".xml", "type": None},
-            "HDR10 Profile B": {"suffix": ".xml", "type": None},
-            "Dolby Vision 2.9": {"suffix": ".xml", "type": None},
-            "Dolby Vision 4.0": {"suffix": ".xml", "type": None},
-            "CSV": {"suffix": ".csv", "type": None},
-            "Tabbed Text": {"suffix": ".txt", "type": None},
-        }
+        raise ValueError("The timeline file format '{0}' is not supported. Please use an EDL, XML, FCPXML, "
+                         "CSV or Tabbed Text file.".format(suffix))
 
-    def checkDvr(self):
-        """Method that checks if drv module is available and ready to use. If not raises an error."""
-        if getHost() != "resolve":
-            raise EnvironmentError("This operator can be executed only inside Davinci Resolve with "
-                                   "Python installed and the API configured.")
 
-    def getDrvIdx(self, value, objTypeName, lenght):
-        """Converts the given value to a integer index and checks that is a valid index for the obj.
-        If the index is not valid, the functions raise and error or log a warning.
+ScannedFile = collections.namedtuple("ScannedFile", ["path", "size", "mtime"])
 
-        @param value str: The string that should contain an integer to be converted.
-        @param objTypeName str: The type name of the object where the index will be used.
-        @param lenght int: The maximum index value that can be accepted in the object.
 
-        @return int: The index verified and ready to use.
+def normalizeMediaPath(path):
+    """Normalizes a media file path to compare it with other paths, like the "File Path" of the clips.
+
+    @param path str: The file path.
+
+    @return str: The normalized path.
+
+    """
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _scanDirectory(directory, extensions):
+    """Reads the entries of one directory.
+
+    @param directory str: The directory to read.
+    @param extensions set: The lower case extensions of the files to return, without the dot. None for all.
+
+    @return tuple: The list of ScannedFile of the directory and the list of its subdirectories.
+
+    """
+    files = []
+    subDirectories = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    subDirectories.append(entry.path)
+                elif entry.is_file():
+                    if extensions is not None and \
+                            os.path.splitext(entry.name)[1][1:].lower() not in extensions:
+                        continue
+                    stat = entry.stat()
+                    files.append(ScannedFile(entry.path, stat.st_size, stat.st_mtime))
+    except OSError as e:
+        logger.warning("The directory '{0}' could not be read: \n {1}".format(directory, str(e)))
+    return files, subDirectories
+
+
+def scanFiles(directories, recursive=True, extensions=None, workers=8):
+    """Lists the files of the given directories, reading the directories in parallel with a pool of threads.
+    The hidden files and directories, the ones starting with a dot, are skipped.
+
+    @param directories list: The directories to scan.
+    @param recursive bool: True to scan the subdirectories too. (Default=True)
+    @param extensions list: The extensions of the files to return, like "mov" or ".mov". If it's empty or None
+        all the files are returned. (Default=None)
+    @param workers int: The number of threads reading directories. (Default=8)
+
+    @return list: The ScannedFile of each file, sorted by path.
+
+    """
+    if extensions:
+        extensions = set(extension.strip().lstrip(".").lower() for extension in extensions if extension.strip())
+    else:
+        extensions = None
+    files = []
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        pending = set(executor.submit(_scanDirectory, directory, extensions) for directory in directories)
+        while pending:
+            done, pending = concurrentWait(pending, return_when="FIRST_COMPLETED")
+            for future in done:
+                directoryFiles, subDirectories = future.result()
+                files.extend(directoryFiles)
+                if recursive:
+                    pending.update(executor.submit(_scanDirectory, subDirectory, extensions)
+                                   for subDirectory in subDirectories)
+    files.sort()
+    return files
+
+
+def hashFile(filepath, chunkSize=8 * 1024 * 1024):
+    """Computes the BLAKE2b hash of the content of a file, reading it memory-mapped by chunks.
+    The hashing releases the GIL, so several files can be hashed in parallel with threads.
+
+    @param filepath str: The path of the file.
+    @param chunkSize int: The number of bytes hashed in each step. (Default=8MB)
+
+    @return str: The hexadecimal digest of the file content.
+
+    """
+    digest = hashlib.blake2b()
+    with open(filepath, "rb") as mediaFile:
+        size = os.fstat(mediaFile.fileno()).st_size
+        if size == 0:
+            return digest.hexdigest()
+        with mmap.mmap(mediaFile.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                for offset in range(0, size, chunkSize):
+                    digest.update(view[offset:offset + chunkSize])
+    return digest.hexdigest()
+
+
+# Image formats stored like one file per frame, and the patterns of the frame numbers in their file names and of
+# the "File Path" of the sequence clips in Resolve, like "/plates/shot.[1001-1100].exr"
+sequenceExtensions = frozenset(["ari", "bmp", "cin", "dng", "dpx", "exr", "j2c", "jpeg", "jpg", "png", "tga", "tif",
+                                "tiff"])
+sequenceFramePattern = re.compile(r"^(.*?)(\d+)(\.([A-Za-z0-9]+))$")
+sequenceClipPattern = re.compile(r"^(.*)\[(\d+)-(\d+)\](.*)$")
+
+ImageSequence = collections.namedtuple("ImageSequence", ["directory", "prefix", "padding", "suffix", "ranges",
+                                                         "frameCount"])
+
+
+def sequencePath(sequence):
+    """Returns the printf style path of an image sequence, like "/plates/shot.%04d.exr".
+
+    @param sequence ImageSequence: The sequence.
+
+    @return str: The path of the sequence.
+
+    """
+    return os.path.join(sequence.directory, "{0}%0{1}d{2}".format(sequence.prefix, sequence.padding,
+                                                                  sequence.suffix))
+
+
+def sequenceRangePath(sequence, start, end):
+    """Returns the "File Path" shown by Resolve for the clip of a range of frames of an image sequence, like
+    "/plates/shot.[1001-1100].exr".
+
+    @param sequence ImageSequence: The sequence.
+    @param start int: The first frame of the range.
+    @param end int: The last frame of the range.
+
+    @return str: The path of the range.
+
+    """
+    return os.path.join(sequence.directory, "{0}[{1:0{3}d}-{2:0{3}d}]{4}".format(
+        sequence.prefix, start, end, sequence.padding, sequence.suffix))
+
+
+def sequenceDescriptors(sequence):
+    """Returns the ImportMedia descriptors of an image sequence, one for each range of consecutive frames.
+
+    @param sequence ImageSequence: The sequence.
+
+    @return list: The {"FilePath", "StartIndex", "EndIndex"} dictionaries.
+
+    """
+    filePath = sequencePath(sequence)
+    return [{"FilePath": filePath, "StartIndex": start, "EndIndex": end} for start, end in sequence.ranges]
+
+
+def sequenceClipPath(filePath):
+    """Converts the "File Path" of a sequence clip of Resolve, like "/plates/shot.[1001-1100].exr", to the printf
+    style path of the sequence.
+
+    @param filePath str: The "File Path" of the clip.
+
+    @return str: The path of the sequence, or None if the clip is not a sequence.
+
+    """
+    match = sequenceClipPattern.match(filePath)
+    if match is None:
+        return None
+    return "{0}%0{1}d{2}".format(match.group(1), len(match.group(2)), match.group(4))
+
+
+def _frameRanges(frames):
+    """Finds the ranges of consecutive frames without sorting, marking the frames in a bitmap.
+
+    @param frames list: The frame numbers, in any order.
+
+    @return list: The (start, end) tuples of the ranges, both inclusive.
+
+    """
+    first = min(frames)
+    last = max(frames)
+    if last - first > 16 * len(frames) + 1024:
+        # Very sparse frames, the bitmap would be bigger than sorting them
+        ordered = sorted(set(frames))
+    else:
+        bitmap = bytearray(last - first + 1)
+        for frame in frames:
+            bitmap[frame - first] = 1
+        ordered = [first + offset for offset, present in enumerate(bitmap) if present]
+    ranges = []
+    start = previous = ordered[0]
+    for frame in ordered[1:]:
+        if frame != previous + 1:
+            ranges.append((start, previous))
+            start = frame
+        previous = frame
+    ranges.append((start, previous))
+    return ranges
+
+
+def detectSequences(paths, minFrames=2):
+    """Groups the numbered frames of the image formats in sequenceExtensions into image sequences, in one pass
+    over the paths. The frames are bucketed by directory, prefix, number of digits and extension, so the
+    frames of a sequence can be in any order.
+
+    @param paths list: The file paths.
+    @param minFrames int: The minimum number of frames of a sequence. The buckets with less frames are returned
+        like single files. (Default=2)
+
+    @return tuple: The list of ImageSequence, sorted by path, and the list of paths that are not part of any
+        sequence.
+
+    """
+    buckets = {}
+    files = []
+    for path in paths:
+        directory, name = os.path.split(path)
+        match = sequenceFramePattern.match(name)
+        if match is None or match.group(4).lower() not in sequenceExtensions:
+            files.append(path)
+            continue
+        digits = match.group(2)
+        key = (directory, match.group(1), len(digits), match.group(3))
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = buckets[key] = ([], [])
+        bucket[0].append(int(digits))
+        bucket[1].append(path)
+    sequences = []
+    for (directory, prefix, padding, suffix), (frames, framePaths) in buckets.items():
+        if len(frames) < minFrames:
+            files.extend(framePaths)
+            continue
+        sequences.append(ImageSequence(directory, prefix, padding, suffix, _frameRanges(frames), len(frames)))
+    sequences.sort(key=sequencePath)
+    return sequences, files
+
+
+class DvrRecorder(object):
+    """Records the Resolve API calls of a session in a gzip compressed JSON lines file, to replay them later
+    with DvrReplay. Each line has the id of the called object, the method, the arguments, the result and the
+    latency of the call. The Resolve objects in the arguments and results are stored like references with their
+    id and class name, and they are wrapped in DvrRecordedObject instances so their calls are recorded too.
+    The recording is enabled with the SHIFT_RESOLVE_RECORD environment variable, set to the path of the file.
+
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.lock = threading.Lock()
+        self.nextId = 0
+        self.recordFile = gzip.open(filepath, "wt")
+        atexit.register(self.close)
+
+    def wrap(self, obj):
+        """Wraps a Resolve object to record its calls.
+
+        @param obj obj: The Resolve object.
+
+        @return DvrRecordedObject: The wrapped object.
+
+        """
+        try:
+            className = obj.ClassName
+        except Exception:
+            className = type(obj).__name__
+        with self.lock:
+            objId = self.nextId
+            self.nextId += 1
+        return DvrRecordedObject(self, obj, objId, className)
+
+    def encode(self, value, wrapObjects=False):
+        """Converts a value to a JSON compatible value. The Resolve objects are replaced by references, and
+        the dictionaries with keys that are not strings are stored like lists of pairs.
+
+        @param value obj: The value to encode.
+        @param wrapObjects bool: True to wrap the Resolve objects found in the value. (Default=False)
+
+        @return tuple: The encoded value and the value with the Resolve objects wrapped.
+
+        """
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value, value
+        if isinstance(value, DvrRecordedObject):
+            return {"__dvr__": value._objId, "class": value._className}, value
+        if isinstance(value, (list, tuple)):
+            pairs = [self.encode(element, wrapObjects) for element in value]
+            return [pair[0] for pair in pairs], type(value)(pair[1] for pair in pairs)
+        if isinstance(value, dict):
+            pairs = [(key, self.encode(element, wrapObjects)) for key, element in value.items()]
+            wrapped = {key: pair[1] for key, pair in pairs}
+            if all(isinstance(key, str) for key in value):
+                return {key: pair[0] for key, pair in pairs}, wrapped
+            return {"__items__": [[key, pair[0]] for key, pair in pairs]}, wrapped
+        if wrapObjects:
+            return self.encode(self.wrap(value))
+        return str(value), value
+
+    def write(self, record):
+        """Writes a record in the file.
+
+        @param record dict: The record.
+
+        """
+        line = json.dumps(record, separators=(",", ":"))
+        with self.lock:
+            if self.recordFile is not None:
+                self.recordFile.write(line + "\n")
+
+    def close(self):
+        """Closes the recording file."""
+        with self.lock:
+            if self.recordFile is not None:
+                self.recordFile.close()
+                self.recordFile = None
+
+
+def _unwrapRecorded(value):
+    """Replaces the DvrRecordedObject instances of a value by the Resolve objects they wrap.
+
+    @param value obj: The value.
+
+    @return obj: The value with the Resolve objects.
+
+    """
+    if isinstance(value, DvrRecordedObject):
+        return value._obj
+    if isinstance(value, (list, tuple)):
+        return type(value)(_unwrapRecorded(element) for element in value)
+    if isinstance(value, dict):
+        return {key: _unwrapRecorded(element) for key, element in value.items()}
+    return value
+
+
+class DvrRecordedObject(object):
+    """Wrapper of a Resolve object that records its calls and attribute reads in a DvrRecorder."""
+
+    def __init__(self, recorder, obj, objId, className):
+        self._recorder = recorder
+        self._obj = obj
+        self._objId = objId
+        self._className = className
+
+    @property
+    def ClassName(self):
+        return self._className
+
+    def __getattr__(self, name):
+        value = getattr(self._obj, name)
+        if not callable(value):
+            self._recorder.write({"obj": self._objId, "attr": name, "result": self._recorder.encode(value)[0]})
+            return value
+
+        def recordedCall(*args):
+            encodedArgs = self._recorder.encode(args)[0]
+            start = time.perf_counter()
+            result = value(*_unwrapRecorded(args))
+            latency = time.perf_counter() - start
+            encodedResult, result = self._recorder.encode(result, wrapObjects=True)
+            self._recorder.write({"obj": self._objId, "method": name, "args": encodedArgs,
+                                  "result": encodedResult, "latency": round(latency, 6)})
+            return result
+        return recordedCall
+
+
+class DvrReplay(object):
+    """Serves the Resolve API calls recorded by DvrRecorder, so the operators can be executed and profiled
+    without Davinci Resolve. The calls of each object, method and arguments are answered in the recorded order.
+    When the recorded results of a call run out, the last one is repeated.
+    The replay is enabled with the SHIFT_RESOLVE_REPLAY environment variable, set to the path of the recording.
+    If SHIFT_RESOLVE_REPLAY_LATENCY is "1", each call waits the recorded latency.
+
+    """
+
+    def __init__(self, filepath, useLatency=False):
+        self.filepath = filepath
+        self.useLatency = useLatency
+        self.lock = threading.Lock()
+        self.calls = collections.defaultdict(collections.deque)
+        self.attributes = {}
+        self.objects = {}
+        with gzip.open(filepath, "rt") as recordFile:
+            for line in recordFile:
+                record = json.loads(line)
+                if "attr" in record:
+                    self.attributes[(record["obj"], record["attr"])] = record["result"]
+                else:
+                    key = (record["obj"], record["method"], json.dumps(record["args"]))
+                    self.calls[key].append((record["result"], record["latency"]))
+
+    def getObject(self, objId, className=None):
+        """Returns the replay object for a recorded object id.
+
+        @param objId int: The id of the recorded object.
+        @param className str: The class name of the object. (Default=None)
+
+        @return DvrReplayObject: The replay object.
+
+        """
+        if objId not in self.objects:
+            self.objects[objId] = DvrReplayObject(self, objId, className)
+        return self.objects[objId]
+
+    def encodeArgs(self, value):
+        """Converts the arguments of a call like the recorder does, to find the recorded call.
+
+        @param value obj: The arguments.
+
+        @return obj: The encoded arguments.
+
+        """
+        if isinstance(value, DvrReplayObject):
+            return {"__dvr__": value._objId, "class": value._className}
+        if isinstance(value, (list, tuple)):
+            return [self.encodeArgs(element) for element in value]
+        if isinstance(value, dict):
+            if all(isinstance(key, str) for key in value):
+                return {key: self.encodeArgs(element) for key, element in value.items()}
+            return {"__items__": [[key, self.encodeArgs(element)] for key, element in value.items()]}
+        return value
+
+    def decode(self, value):
+        """Converts a recorded value to the value returned by the replay, with the Resolve objects references
+        replaced by replay objects.
+
+        @param value obj: The recorded value.
+
+        @return obj: The decoded value.
+
+        """
+        if isinstance(value, list):
+            return [self.decode(element) for element in value]
+        if isinstance(value, dict):
+            if "__dvr__" in value:
+                return self.getObject(value["__dvr__"], value["class"])
+            if "__items__" in value:
+                return {key: self.decode(element) for key, element in value["__items__"]}
+            return {key: self.decode(element) for key, element in value.items()}
+        return value
+
+    def call(self, objId, method, args):
+        """Returns the next recorded result of the call.
+
+        @param objId int: The id of the recorded object.
+        @param method str: The name of the method.
+        @param args tuple: The arguments of the call.
+
+        @return obj: The recorded result.
+
+        @raises RuntimeError: If there are no more recorded results for the call.
+
+        """
+        key = (objId, method, json.dumps(self.encodeArgs(args)))
+        with self.lock:
+            results = self.calls.get(key)
+            if not results:
+                raise RuntimeError("The call {0}{1} of the object {2} is not in the recording "
+                                   "'{3}'.".format(method, tuple(args), objId, self.filepath))
+            result, latency = results.popleft() if len(results) > 1 else results[0]
+        if self.useLatency:
+            time.sleep(latency)
+        return self.decode(result)
+
+
+class DvrReplayObject(object):
+    """Replacement of a Resolve object that answers its calls from a DvrReplay."""
+
+    def __init__(self, replay, objId, className):
+        self._replay = replay
+        self._objId = objId
+        self._className = className
+
+    @property
+    def ClassName(self):
+        return self._className
+
+    def __getattr__(self, name):
+        attributeKey = (self._objId, name)
+        if attributeKey in self._replay.attributes:
+            return self._replay.decode(self._replay.attributes[attributeKey])
+
+        def replayedCall(*args):
+            return self._replay.call(self._objId, name, args)
+        return replayedCall
+
+
+# Record or replay the Resolve API calls of the session
+dvrReplay = None
+if os.environ.get("SHIFT_RESOLVE_REPLAY"):
+    dvrReplay = DvrReplay(os.environ["SHIFT_RESOLVE_REPLAY"],
+                          useLatency=os.environ.get("SHIFT_RESOLVE_REPLAY_LATENCY", "0") == "1")
+    resolve = dvrReplay.getObject(0, "Resolve")
+    projectManager = resolve.GetProjectManager()
+elif os.environ.get("SHIFT_RESOLVE_RECORD") and resolve is not None:
+    resolve = DvrRecorder(os.environ["SHIFT_RESOLVE_RECORD"]).wrap(resolve)
+    projectManager = resolve.GetProjectManager()
+
+
+class DvrCallCache(object):
+    """Bounded LRU cache for the results of the read-only Resolve API getters.
+    The entries are stored by object, method and arguments. The Resolve API can return different handles for the
+    same Resolve object, so the objects are identified by their class and unique id when they have one, and by
+    the id of the handle when they don't. The handles are kept alive by the cache, so their ids are not reused
+    while their entries exist.
+    The invalidation of an object drops the entries of all the cached objects of the same class, since the changes
+    of an object can modify the results of the getters of the related objects.
+
+    """
+
+    def __init__(self, maxEntries=10000):
+        self.maxEntries = maxEntries
+        self.entries = collections.OrderedDict()
+        self.objects = {}
+        self.handles = {}
+        self.hits = collections.Counter()
+        self.misses = collections.Counter()
+
+    def call(self, obj, method, args):
+        """Returns the cached result of the call or calls the API and caches the result.
+
+        @param obj obj: The Resolve object.
+        @param method str: The name of the getter method.
+        @param args tuple: The arguments of the call.
+
+        @return obj: The result of the call. Lists and dictionaries are returned like copies.
+
+        """
+        objectKey = self._objectKey(obj)
+        objectRecord = self.objects.get(objectKey)
+        if objectRecord is None:
+            objectRecord = self.objects[objectKey] = [set(), objectKey[0], set()]
+        objectRecord[0].add(id(obj))
+        key = (objectKey, method, args)
+        try:
+            result = self.entries[key]
+        except KeyError:
+            self.misses[method] += 1
+            try:
+                result = getattr(obj, method)(*args)
+            except Exception:
+                if not objectRecord[2]:
+                    self._dropObject(objectKey)
+                raise
+            objectRecord[2].add(key)
+            self.entries[key] = result
+            if len(self.entries) > self.maxEntries:
+                oldKey, _ = self.entries.popitem(last=False)
+                self._discardKey(oldKey)
+        else:
+            self.hits[method] += 1
+            self.entries.move_to_end(key)
+        if isinstance(result, (list, dict)):
+            return type(result)(result)
+        return result
+
+    def _objectKey(self, obj):
+        """Returns the key that identifies the Resolve object of a handle in the cache entries.
+        The unique id of each handle is only requested the first time the handle is used.
+
+        @param obj obj: The Resolve object.
+
+        @return tuple: The class name and the unique id of the object, or the id of the handle if the object
+            doesn't have a unique id.
+
+        """
+        handleRecord = self.handles.get(id(obj))
+        if handleRecord is not None:
+            return handleRecord[1]
+        try:
+            className = obj.ClassName
+        except Exception:
+            className = type(obj).__name__
+        try:
+            uniqueId = obj.GetUniqueId()
+        except Exception:
+            uniqueId = None
+        objectKey = (className, uniqueId) if uniqueId else (className, id(obj))
+        self.handles[id(obj)] = (obj, objectKey)
+        return objectKey
+
+    def _dropObject(self, objectKey):
+        """Removes the object record and the handles of the object.
+
+        @param objectKey tuple: The key of the object.
+
+        """
+        handleIds, _, _ = self.objects.pop(objectKey)
+        for handleId in handleIds:
+            self.handles.pop(handleId, None)
+
+    def _discardKey(self, key):
+        """Removes the key from its object record, and the object record when it has no more keys.
+
+        @param key tuple: The entry key.
+
+        """
+        objectRecord = self.objects.get(key[0])
+        if objectRecord is not None:
+            objectRecord[2].discard(key)
+            if not objectRecord[2]:
+                self._dropObject(key[0])
+
+    def invalidate(self, obj=None):
+        """Drops the entries of the objects with the same class of the given object, or all the entries.
+
+        @param obj obj: The Resolve object that has been modified. If it's None all the entries are
+            dropped. (Default=None)
+
+        """
+        if obj is None:
+            self.entries.clear()
+            self.objects.clear()
+            self.handles.clear()
+            return
+        try:
+            className = obj.ClassName
+        except Exception:
+            className = type(obj).__name__
+        for objectKey, (_, objectClass, keys) in list(self.objects.items()):
+            if objectClass != className:
+                continue
+            for key in keys:
+                self.entries.pop(key, None)
+            self._dropObject(objectKey)
+
+    def stats(self):
+        """Returns the hits, misses and hit rate of each method and of the full cache.
+
+        @return dict: The statistics by method name, with a "total" entry for all the methods.
+
+        """
+        stats = {}
+        for method in set(self.hits) | set(self.misses):
+            calls = self.hits[method] + self.misses[method]
+            stats[method] = {"hits": self.hits[method], "misses": self.misses[method],
+                             "hitRate": float(self.hits[method]) / calls}
+        hits = sum(self.hits.values())
+        calls = hits + sum(self.misses.values())
+        stats["total"] = {"hits": hits, "misses": calls - hits, "hitRate": float(hits) / calls if calls else 0.0}
+        return stats
+
+
+class DvrMetrics(object):
+    """In memory histograms of the execution of the operators, by operator class.
+    It records the duration of each execute() call, the size of the inputs, like the sum of the lengths of the
+    list inputs, and the number of executions that raised an error.
+    The metrics can be written in the Prometheus text format, to be read by the textfile collector of the node
+    exporter, or in JSON. If the SHIFT_RESOLVE_METRICS_PATH environment variable is defined, the metrics are
+    written to that path every SHIFT_RESOLVE_METRICS_INTERVAL seconds (60 by default) and at exit.
+
+    """
+    durationBuckets = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0]
+    sizeBuckets = [0, 1, 10, 100, 1000, 10000, 100000, 1000000]
+
+    def __init__(self, filepath="", flushInterval=60.0):
+        self.filepath = filepath
+        self.flushInterval = flushInterval
+        self.lastFlush = time.time()
+        self.lock = threading.Lock()
+        self.durations = {}
+        self.sizes = {}
+        self.errors = collections.Counter()
+
+    def _observe(self, histograms, buckets, operator, value):
+        """Adds a value to the histogram of the operator.
+
+        @param histograms dict: The histograms by operator. Each one is a [bucketCounts, sum, count] list.
+        @param buckets list: The upper bounds of the buckets.
+        @param operator str: The operator class name.
+        @param value float: The observed value.
+
+        """
+        histogram = histograms.get(operator)
+        if histogram is None:
+            histogram = histograms[operator] = [[0] * (len(buckets) + 1), 0.0, 0]
+        histogram[0][bisect.bisect_left(buckets, value)] += 1
+        histogram[1] += value
+        histogram[2] += 1
+
+    def record(self, operator, duration, inputSize, failed=False):
+        """Records an execution of an operator, and writes the metrics file if the flush interval has passed.
+
+        @param operator str: The operator class name.
+        @param duration float: The duration of the execution in seconds.
+        @param inputSize int: The size of the inputs of the execution.
+        @param failed bool: True if the execution raised an error. (Default=False)
+
+        """
+        with self.lock:
+            self._observe(self.durations, self.durationBuckets, operator, duration)
+            self._observe(self.sizes, self.sizeBuckets, operator, inputSize)
+            if failed:
+                self.errors[operator] += 1
+        if self.filepath and time.time() - self.lastFlush >= self.flushInterval:
+            self.flush()
+
+    def toDict(self):
+        """Returns the metrics like a dictionary, with the durations, input sizes and errors by operator.
+        The counts of the buckets of the histograms are not cumulative.
+
+        @return dict: The metrics.
+
+        """
+        with self.lock:
+            result = {}
+            for key, histograms, buckets in (("durations", self.durations, self.durationBuckets),
+                                             ("inputSizes", self.sizes, self.sizeBuckets)):
+                result[key] = {operator: {"buckets": dict(zip([str(bound) for bound in buckets] + ["+Inf"],
+                                                              histogram[0])),
+                                          "sum": histogram[1], "count": histogram[2]}
+                               for operator, histogram in histograms.items()}
+            result["errors"] = dict(self.errors)
+        return result
+
+    def toPrometheus(self):
+        """Returns the metrics in the Prometheus text exposition format.
+
+        @return str: The metrics text.
+
+        """
+        lines = []
+        with self.lock:
+            for name, description, histograms, buckets in (
+                    ("shift_resolve_execute_seconds", "Duration of the execution of the operators.",
+                     self.durations, self.durationBuckets),
+                    ("shift_resolve_input_size", "Size of the list inputs of the operators.",
+                     self.sizes, self.sizeBuckets)):
+                lines.append("# HELP {0} {1}".format(name, description))
+                lines.append("# TYPE {0} histogram".format(name))
+                for operator, (counts, total, count) in sorted(histograms.items()):
+                    cumulative = 0
+                    for bound, bucketCount in zip([repr(float(bound)) for bound in buckets] + ["+Inf"], counts):
+                        cumulative += bucketCount
+                        lines.append('{0}_bucket{{operator="{1}",le="{2}"}} {3}'.format(
+                            name, operator, bound, cumulative))
+                    lines.append('{0}_sum{{operator="{1}"}} {2!r}'.format(name, operator, float(total)))
+                    lines.append('{0}_count{{operator="{1}"}} {2}'.format(name, operator, count))
+            lines.append("# HELP shift_resolve_execute_errors_total Executions of the operators that failed.")
+            lines.append("# TYPE shift_resolve_execute_errors_total counter")
+            for operator, count in sorted(self.errors.items()):
+                lines.append('shift_resolve_execute_errors_total{{operator="{0}"}} {1}'.format(operator, count))
+        return "\n".join(lines) + "\n"
+
+    def flush(self, filepath=None):
+        """Writes the metrics file. The format is JSON for the .json files and the Prometheus text format for any
+        other file. The file is replaced atomically, so the readers never get a partial file.
+
+        @param filepath str: The path of the metrics file. If it's None the configured path is used. (Default=None)
+
+        """
+        filepath = filepath or self.filepath
+        self.lastFlush = time.time()
+        if not filepath:
+            return
+        if filepath.lower().endswith(".json"):
+            content = json.dumps(self.toDict(), indent=1, sort_keys=True)
+        else:
+            content = self.toPrometheus()
+        try:
+            with open(filepath + ".tmp", "w") as metricsFile:
+                metricsFile.write(content)
+            os.replace(filepath + ".tmp", filepath)
+        except Exception as e:
+            logger.warning("The operator metrics could not be written to '{0}': \n {1}".format(filepath, str(e)))
+
+
+def _metricsFlushInterval():
+    """Returns the flush interval of the metrics from the SHIFT_RESOLVE_METRICS_INTERVAL environment variable.
+
+    @return float: The interval in seconds. 60 if the variable is not defined or is not a valid number.
+
+    """
+    value = os.environ.get("SHIFT_RESOLVE_METRICS_INTERVAL", "60")
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning("The SHIFT_RESOLVE_METRICS_INTERVAL value '{0}' is not a number of seconds, the "
+                       "metrics will be written every 60 seconds.".format(value))
+        return 60.0
+
+
+def _timedExecute(execute):
+    """Wraps the execute method of an operator class to record its metrics in DVR_Base.metrics.
+
+    @param execute function: The execute method.
+
+    @return function: The wrapped method.
+
+    """
+    @functools.wraps(execute)
+    def timedExecute(self, force=False):
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = execute(self, force=force)
+            failed = False
+            return result
+        finally:
+            inputSize = 0
+            for plug in self.getPlugs(SDirection.kIn):
+                if isinstance(plug.value, (list, tuple, dict)):
+                    inputSize += len(plug.value)
+            DVR_Base.metrics.record(self.__class__.__name__, time.perf_counter() - start, inputSize, failed)
+    return timedExecute
+
+
+class DVR_Base(SOperator):
+    """Base Davinci Resolve Operator class with utility methods."""
+    # Define operator constants
+    if resolve is not None:
+        timelineTypes = {
+            "FCP7 XML": {"suffix": ".xml", "type": resolve.EXPORT_FCP_7_XML},
+            "EDL - CMX 3600": {"suffix": ".edl", "type": [resolve.EXPORT_EDL, resolve.EXPORT_NONE]},
+            "FCPXML 1.3": {"suffix": ".fcpxml", "type": resolve.EXPORT_FCPXML_1_3},
+            "FCPXML 1.4": {"suffix": ".fcpxml", "type": resolve.EXPORT_FCPXML_1_4},
+            "FCPXML 1.5": {"suffix": ".fcpxml", "type": resolve.EXPORT_FCPXML_1_5},
+            "FCPXML 1.6": {"suffix": ".fcpxml", "type": resolve.EXPORT_FCPXML_1_6},
+            "FCPXML 1.7": {"suffix": ".fcpxml", "type": resolve.EXPORT_FCPXML_1_7},
+            "FCPXML 1.8": {"suffix": ".fcpxml", "type": resolve.EXPORT_FCPXML_1_8},
+            "AAF": {"suffix": ".aaf", "type": [resolve.EXPORT_AAF, resolve.EXPORT_AAF_NEW]},
+            "DaVinci Resolve Timeline": {"suffix": ".drt", "type": resolve.EXPORT_DRT},
+            "EDL - CDL": {"suffix": ".edl", "type": [resolve.EXPORT_EDL, resolve.EXPORT_CDL]},
+            "EDL - SDL": {"suffix": ".edl", "type": [resolve.EXPORT_EDL, resolve.EXPORT_SDL]},
+            "EDL - Missing Clips": {"suffix": ".edl", "type": [resolve.EXPORT_EDL, resolve.EXPORT_MISSING_CLIPS]},
+            "HDR10 Profile A": {"suffix": ".xml", "type": resolve.EXPORT_HDR_10_PROFILE_A},
+            "HDR10 Profile B": {"suffix": ".xml", "type": resolve.EXPORT_HDR_10_PROFILE_B},
+            "Dolby Vision 2.9": {"suffix": ".xml", "type": resolve.EXPORT_DOLBY_VISION_VER_2_9},
+            "Dolby Vision 4.0": {"suffix": ".xml", "type": resolve.EXPORT_DOLBY_VISION_VER_4_0},
+            "CSV": {"suffix": ".csv", "type": resolve.EXPORT_TEXT_CSV},
+            "Tabbed Text": {"suffix": ".txt", "type": resolve.EXPORT_TEXT_TAB},
+        }
+    else:
+        # If Resolve it's not available we don't want the OP creation fail, we create a dummy constant
+        timelineTypes = {
+            "FCP7 XML": {"suffix": ".xml", "type": None},
+            "EDL - CMX 3600": {"suffix": ".edl", "type": None},
+            "FCPXML 1.3": {"suffix": ".fcpxml", "type": None},
+            "FCPXML 1.4": {"suffix": ".fcpxml", "type": None},
+            "FCPXML 1.5": {"suffix": ".fcpxml", "type": None},
+            "FCPXML 1.6": {"suffix": ".fcpxml", "type": None},
+            "FCPXML 1.7": {"suffix": ".fcpxml", "type": None},
+            "FCPXML 1.8": {"suffix": ".fcpxml", "type": None},
+            "AAF": {"suffix": ".aaf", "type": None},
+            "DaVinci Resolve Timeline": {"suffix": ".drt", "type": None},
+            "EDL - CDL": {"suffix": ".edl", "type": None},
+            "EDL - SDL": {"suffix": ".edl", "type": None},
+            "EDL - Missing Clips": {"suffix": ".edl", "type": None},
+            "HDR10 Profile A": {"suffix": ".xml", "type": None},
+            "HDR10 Profile B": {"suffix": ".xml", "type": None},
+            "Dolby Vision 2.9": {"suffix": ".xml", "type": None},
+            "Dolby Vision 4.0": {"suffix": ".xml", "type": None},
+            "CSV": {"suffix": ".csv", "type": None},
+            "Tabbed Text": {"suffix": ".txt", "type": None},
+        }
+
+    # Read-only getters cached by the execution session (see DVR_SessionStart)
+    cachedMethods = frozenset([
+        "GetClipList", "GetClipProperty", "GetCurrentTimeline", "GetItemListInTrack", "GetMediaPool",
+        "GetMediaPoolItem", "GetMetadata", "GetName", "GetRootFolder", "GetSubFolderList", "GetTakeByIndex",
+        "GetTakesCount", "GetTimelineByIndex", "GetTimelineCount", "GetTrackCount", "GetTrackName", "GetUniqueId",
+    ])
+    callCache = None
+    # Single thread that executes the Resolve API calls (see dvrSubmit). It's disabled by default, so the calls are
+    # executed in the thread of each operator. Set SHIFT_RESOLVE_API_WORKER=1 in the environment to enable it.
+    apiWorker = None
+    apiWorkerLock = threading.Lock()
+    apiWorkerName = "DvrApiWorker"
+    useApiWorker = os.environ.get("SHIFT_RESOLVE_API_WORKER", "0") != "0"
+    # Version suffix of the timeline names, like "_v002" in "EP101_cut_v002"
+    timelineVersionPattern = re.compile(r"^(.*?)[_ .-]?[vV](\d+)$")
+    # Execution metrics of all the operators (see DvrMetrics)
+    metrics = DvrMetrics(os.environ.get("SHIFT_RESOLVE_METRICS_PATH", ""), _metricsFlushInterval())
+    atexit.register(metrics.flush)
+
+    def __init_subclass__(cls, **kwargs):
+        """Wraps the execute method of each operator class to record its execution metrics."""
+        super(DVR_Base, cls).__init_subclass__(**kwargs)
+        if "execute" in cls.__dict__:
+            cls.execute = _timedExecute(cls.__dict__["execute"])
+
+    def checkDvr(self):
+        """Method that checks if drv module is available and ready to use. If not raises an error."""
+        if getHost() != "resolve":
+            raise EnvironmentError("This operator can be executed only inside Davinci Resolve with "
+                                   "Python installed and the API configured.")
+
+    def getDrvIdx(self, value, objTypeName, lenght):
+        """Converts the given value to a integer index and checks that is a valid index for the obj.
+        If the index is not valid, the functions raise and error or log a warning.
+
+        @param value str: The string that should contain an integer to be converted.
+        @param objTypeName str: The type name of the object where the index will be used.
+        @param lenght int: The maximum index value that can be accepted in the object.
+
+        @return int: The index verified and ready to use.
+
+        @raises ValueError: Raise an error if the value is not a valid index.
+
+        """
+        try:
+            idx = int(value)
+        except Exception as e:
+            raise ValueError("The key value cannot be converted into a valid index as it is not an integer.")
+        if idx > lenght or idx < 0:
+            raise ValueError("{0} index out of range. "
+                             "There are {0} items available.".format(objTypeName, idx))
+        elif idx == 0:
+            logger.warning("The resolve lists for {0} starts at index 1.".format(objTypeName))
+        return idx
+
+    def getObjClass(self, objIn):
+        """Gets the class name of the given object.
+
+        @param objIn obj: An object that should be a Resolve BlackmagicFusion.PyRemoteObject.
+
+        return str: The name of the class.
+
+        """
+        objInClass = None
+        if objIn is None:
+            return objInClass
+        try:
+            objInClass = objIn.ClassName
+        except:
+            objInClass = None
+        if objInClass is None:
+            try:
+                objInClass = type(objIn).__name__
+            except:
+                objInClass = None
+        return objInClass
+
+    def checkIndividualClass(self, objIn, objExpected):
+        """Check the given object class individually, not list expected.
+
+        @param objIn obj: An object that should be a Resolve BlackmagicFusion.PyRemoteObject instance.
+        @param objExpected str: The name of the class object expected.
+
+        @return bool: True if the class is not the same.
+        @return str: The name of the class of the objIn.
+
+        """
+        raiseError = False
+        objClass = self.getObjClass(objIn)
+        if objExpected == "clip" and objClass != "Media pool item":
+            raiseError = True
+        elif objExpected == "item" and objClass != "Timeline item":
+            raiseError = True
+        elif objExpected == "timeline" and objClass != "Timeline":
+            raiseError = True
+        elif objExpected == "project" and objClass != "Project":
+            raiseError = True
+        elif objExpected == "folder" and objClass != "Folder":
+            raiseError = True
+        return raiseError, objClass
+
+    def checkClass(self, objIn, objExpected, isList=False):
+        """Checks the given object class and raise and error if is not correct.
+
+        @param objIn obj: An object that should be a Resolve BlackmagicFusion.PyRemoteObject instance.
+        @param objExpected str: The name of the class object expected.
+        @param isList bool: True if the objIn is a list of objects. False if it's only 1 object. (Default=False)
+
+        """
+        if not isList:
+            raiseError, objClass = self.checkIndividualClass(objIn, objExpected)
+            if raiseError:
+                raise ValueError("The {0} input is not valid, got {1}".format(objExpected, objClass))
+        else:
+            if not isinstance(objIn, list):
+                raise ValueError("The input has to be a list of {0} instances, "
+                                 "not {1}.".format(objExpected, self.getObjClass(objIn)))
+            for element in objIn:
+                raiseError, objClass = self.checkIndividualClass(element, objExpected)
+                if raiseError:
+                    raise ValueError("One element from the list is not "
+                                     "a {0}, is a {1}".format(objExpected, objClass))
+
+    def getApiWorker(self):
+        """Returns the Resolve API worker, creating it the first time.
+        The worker is a single thread that owns the access to the Resolve API, so all the calls made through
+        dvrCall and dvrSubmit are executed one after the other, in the order they were submitted.
+
+        @return concurrent.futures.ThreadPoolExecutor: The API worker.
+
+        """
+        with DVR_Base.apiWorkerLock:
+            if DVR_Base.apiWorker is None:
+                DVR_Base.apiWorker = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.apiWorkerName)
+        return DVR_Base.apiWorker
+
+    def runOnApiWorker(self, function, *args):
+        """Runs the given function in the Resolve API worker.
+        If the worker is disabled or the function is submitted from the worker itself, the function is executed
+        immediately and a finished future is returned.
+
+        @param function callable: The function to run.
+        @param args list: The arguments of the function.
+
+        @return concurrent.futures.Future: The future with the result of the function.
+
+        """
+        if self.useApiWorker and not threading.current_thread().name.startswith(self.apiWorkerName):
+            return self.getApiWorker().submit(function, *args)
+        future = Future()
+        try:
+            future.set_result(function(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def _dvrCallNow(self, obj, method, args):
+        """Calls a method of a Resolve object in the current thread. If an execution session is active and the
+        method is a read-only getter, the result is taken from the session cache when possible.
+
+        @param obj obj: The Resolve object.
+        @param method str: The name of the method to call.
+        @param args tuple: The arguments of the method.
+
+        @return obj: The result of the call.
+
+        """
+        callCache = DVR_Base.callCache
+        if callCache is not None and method in self.cachedMethods:
+            try:
+                hash(args)
+            except TypeError:  # Not hashable arguments can't be cached
+                pass
+            else:
+                return callCache.call(obj, method, args)
+        return getattr(obj, method)(*args)
+
+    def dvrSubmit(self, obj, method, *args):
+        """Submits a call to a method of a Resolve object to the API worker and returns without waiting for it.
+        This allows the operators to do local work, like reading files or hashing, while the Resolve calls are
+        executed, or to submit several calls in a row without waiting between them.
+        While the returned futures are pending, the operator must not call the Resolve API directly, only through
+        dvrCall or dvrSubmit.
+
+        @param obj obj: The Resolve object.
+        @param method str: The name of the method to call.
+        @param args list: The arguments of the method.
+
+        @return concurrent.futures.Future: The future with the result of the call.
+
+        """
+        return self.runOnApiWorker(self._dvrCallNow, obj, method, args)
+
+    def dvrCall(self, obj, method, *args):
+        """Calls a method of a Resolve object through the API worker and waits for the result.
+        If an execution session is active and the method is a read-only getter, the result is taken from the
+        session cache when possible.
+
+        @param obj obj: The Resolve object.
+        @param method str: The name of the method to call.
+        @param args list: The arguments of the method.
+
+        @return obj: The result of the call.
+
+        """
+        return self.dvrSubmit(obj, method, *args).result()
+
+    def invalidateCache(self, obj=None):
+        """Drops the cached results of the execution session for the given object, or for all the objects.
+        The operators that modify Resolve objects have to call this method.
+
+        @param obj obj: The Resolve object that has been modified. If it's None all the results are
+            dropped. (Default=None)
+
+        """
+        callCache = DVR_Base.callCache
+        if callCache is not None:
+            self.runOnApiWorker(callCache.invalidate, obj).result()
+
+    def walkFolders(self, folder, folderPath=""):
+        """Generator that walks the given folder and all its subfolders, depth first.
+        The paths are relative to the given folder, using "/" like separator, so the given folder has an
+        empty path and its direct subfolders their names.
+
+        @param folder Resolve.Folder: The folder to walk.
+        @param folderPath str: The path of the given folder. (Default="")
+
+        @return generator: A (folder, folderPath) tuple for each folder, starting with the given one.
+
+        """
+        pending = [(folder, folderPath)]
+        while pending:
+            currentFolder, currentPath = pending.pop()
+            yield currentFolder, currentPath
+            subFolders = self.dvrCall(currentFolder, "GetSubFolderList") or []
+            for subFolder in reversed(subFolders):
+                subFolderName = self.dvrCall(subFolder, "GetName")
+                pending.append((subFolder, currentPath + "/" + subFolderName if currentPath else subFolderName))
+
+    def getDeadline(self, timeBudget):
+        """Returns the time when an execution with the given time budget has to stop.
+
+        @param timeBudget int: The time budget in milliseconds. 0 or less means that there is no limit.
+
+        @return float: The deadline like a time.time() value, or None if there is no limit.
+
+        """
+        if not timeBudget or timeBudget <= 0:
+            return None
+        return time.time() + timeBudget / 1000.0
+
+    def isExpired(self, deadline):
+        """Checks if the deadline of a time budgeted execution has been reached.
+
+        @param deadline float: The deadline returned by getDeadline.
+
+        @return bool: True if the execution has to stop.
+
+        """
+        return deadline is not None and time.time() >= deadline
+
+    def makeCursor(self, key, state):
+        """Creates the continuation cursor of a time budgeted execution, to resume it in the next execution.
+
+        @param key obj: A value that identifies the inputs of the execution, like the searched name.
+        @param state obj: The state required to resume the execution. Lists are stored like copies.
+
+        @return dict: The cursor.
+
+        """
+        if isinstance(state, list):
+            state = list(state)
+        return {"operator": self.__class__.__name__, "key": key, "state": state}
+
+    def readCursor(self, cursor, key):
+        """Validates the continuation cursor of a previous execution and returns its state.
+
+        @param cursor dict: The cursor created by makeCursor, or None to start from the beginning.
+        @param key obj: The value that identifies the inputs of the current execution.
+
+        @return obj: The state stored in the cursor, or None if there is no cursor. Lists are returned like
+            copies, so the execution can consume them without modifying the cursor.
+
+        @raises ValueError: Raise an error if the cursor is from another operator type or other inputs.
+
+        """
+        if not cursor:
+            return None
+        if not isinstance(cursor, dict) or cursor.get("operator") != self.__class__.__name__:
+            raise ValueError("The cursor is not valid for a {0} operator.".format(self.__class__.__name__))
+        if cursor.get("key") != key:
+            raise ValueError("The cursor was created with different inputs. Please, clear the cursor to start "
+                             "from the beginning.")
+        state = cursor.get("state")
+        if isinstance(state, list):
+            return list(state)
+        return state
+
+    def getMediaPathIndex(self, mediapool):
+        """Indexes the clips of the media pool by the normalized "File Path" of their media.
+        The "File Path" of all the clips is requested to the API worker before waiting for the first result.
+
+        @param mediapool Resolve.MediaPool: The media pool of the project.
+
+        @return dict: The clip objects by their normalized file path. The image sequence clips are indexed by
+            their printf style path too, like "/plates/shot.%04d.exr". The clips without file are not included.
+
+        """
+        futures = []
+        for folder, _ in self.walkFolders(self.dvrCall(mediapool, "GetRootFolder")):
+            for clip in self.dvrCall(folder, "GetClipList") or []:
+                futures.append((clip, self.dvrSubmit(clip, "GetClipProperty", "File Path")))
+        index = {}
+        for clip, future in futures:
+            filePath = future.result()
+            if filePath:
+                index[normalizeMediaPath(filePath)] = clip
+                filePath = sequenceClipPath(filePath)
+                if filePath:
+                    index[normalizeMediaPath(filePath)] = clip
+        return index
+
+    def getTimelineNames(self, project):
+        """Indexes the timelines of the project by name, to check name collisions without reading all the
+        timelines for each name.
+
+        @param project Resolve.Project: The project.
+
+        @return dict: The timeline objects by name.
+
+        """
+        names = {}
+        for timelineIdx in range(1, self.dvrCall(project, "GetTimelineCount") + 1):
+            timeline = self.dvrCall(project, "GetTimelineByIndex", timelineIdx)
+            names[self.dvrCall(timeline, "GetName")] = timeline
+        return names
+
+    def formatTimelineName(self, template, name, index, date, versionOffset=0):
+        """Applies a name template to a timeline name. The template is a Python format string with the tokens
+        {name}, the current name; {base}, the name without its version suffix; {version}, the version of the name
+        plus one, or 1 if it has no version suffix; {index}; and {date}.
+
+        @param template str: The name template, like "{base}_v{version:03d}".
+        @param name str: The current name of the timeline.
+        @param index int: The position of the timeline in the list.
+        @param date str: The current date.
+        @param versionOffset int: The number added to the next version. (Default=0)
+
+        @return str: The new name.
+
+        @raises ValueError: Raise an error if the template is not valid.
+
+        """
+        match = self.timelineVersionPattern.match(name)
+        base, version = (match.group(1), int(match.group(2)) + 1) if match else (name, 1)
+        try:
+            return template.format(name=name, base=base, version=version + versionOffset, index=index, date=date)
+        except (KeyError, IndexError, ValueError) as e:
+            raise ValueError("The name template '{0}' is not valid: \n {1}".format(template, str(e)))
+
+    def getUniqueTimelineName(self, template, name, index, date, usedNames, onCollision):
+        """Applies a name template to a timeline name and solves the collisions with the used names.
+
+        @param template str: The name template. See formatTimelineName.
+        @param name str: The current name of the timeline.
+        @param index int: The position of the timeline in the list.
+        @param date str: The current date.
+        @param usedNames set: The names of the timelines of the project.
+        @param onCollision str: "Error", "Skip" or "Increment". Increment increments the version, or adds a number
+            to the name if the template has no {version} token, until the name is not used.
+
+        @return str: The new name, or None if the name is used and onCollision is Skip.
+
+        @raises ValueError: Raise an error if the name is used and onCollision is Error.
+
+        """
+        newName = self.formatTimelineName(template, name, index, date)
+        if newName not in usedNames:
+            return newName
+        if onCollision == "Error":
+            raise ValueError("The name '{0}' for the timeline '{1}' is already used by another "
+                             "timeline.".format(newName, name))
+        elif onCollision == "Skip":
+            logger.warning("The name '{0}' for the timeline '{1}' is already used.".format(newName, name))
+            return None
+        attempt = 1
+        while newName in usedNames:
+            if "{version" in template:
+                newName = self.formatTimelineName(template, name, index, date, attempt)
+            else:
+                newName = "{0}_{1}".format(self.formatTimelineName(template, name, index, date), attempt + 1)
+            attempt += 1
+        return newName
+
+    def getClipsById(self, mediapool, clipIds, folderPaths=None):
+        """Gets the live clip objects for the given clip unique ids.
+        The media pool is walked once and, if the folder paths are given, only the clips from those folders
+        are read.
+
+        @param mediapool Resolve.MediaPool: The media pool of the project.
+        @param clipIds set: The unique ids of the clips to get.
+        @param folderPaths set: The paths of the folders that contain the clips, relative to the root folder
+            like in walkFolders. If it's None all the folders are read. (Default=None)
+
+        @return dict: The clip objects by their unique id. The ids not found are not included.
+
+        """
+        clipIds = set(clipIds)
+        clips = {}
+        for folder, folderPath in self.walkFolders(self.dvrCall(mediapool, "GetRootFolder")):
+            if folderPaths is not None and folderPath not in folderPaths:
+                continue
+            for clip in self.dvrCall(folder, "GetClipList") or []:
+                clipId = self.dvrCall(clip, "GetUniqueId")
+                if clipId in clipIds:
+                    clips[clipId] = clip
+            if len(clips) == len(clipIds):
+                break
+        return clips
+
+
+class DVR_ClipPropertyGet(DVR_Base):
+    """Operator to get properties from a clip.
+    Allows the creation of new plugs. It will pick output plug names like property names
+    to be read from the given clip and will store the obtained value inside them.
+    Custom input plugs will be ignored.
+    Works in Davinci Resolve.
+
+    """
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, editable=True, parent=parent)
+        i_clip = SPlug(
+            code="clip",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+
+        self.addPlug(i_clip)
+
+    def execute(self, force=False):
+        """Gets the desired properties from the given clip.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        self.checkDvr()
+        plugsList = [plug for plug in self.getPlugs(SDirection.kOut) if plug.type != SType.kTrigger]
+        clip = self.getPlug("clip").value
+        self.checkClass(clip, "clip")
+        if plugsList:
+            for p in plugsList:
+                try:
+                    fieldValue = self.dvrCall(clip, "GetClipProperty", p.code)
+                    if fieldValue:
+                        p.setValue(fieldValue)
+                except Exception as e:
+                    raise ValueError("The property '{0}' could not be read: \n {1}".format(p.code, str(e)))
+        super(self.__class__, self).execute()
+
+
+class DVR_ClipGet(DVR_Base):
+    """Operator to get a specific Clip from a list of Clips
+    Works in Davinci Resolve.
+
+    """
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_clips = SPlug(
+            code="clips",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_getMethod = SPlug(
+            code="getMethod",
+            value="ByName",
+            type=SType.kEnum,
+            options=["ByName"],
+            direction=SDirection.kIn,
+            parent=self)
+        i_key = SPlug(
+            code="key",
+            value="",
+            type=SType.kString,
+            direction=SDirection.kIn,
+            parent=self)
+        o_clip = SPlug(
+            code="clip",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_clips)
+        self.addPlug(i_getMethod)
+        self.addPlug(i_key)
+        self.addPlug(o_clip)
+
+    def execute(self, force=False):
+        """Gets the desired clip from a list of clips.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        self.checkDvr()
+        clips = self.getPlug("clips", SDirection.kIn).value
+        getMethod = self.getPlug("getMethod", SDirection.kIn).value
+        clipKey = self.getPlug("key", SDirection.kIn).value
+        targetClip = None
+        # Check list instances
+        self.checkClass(clips, "clip", isList=True)
+        if getMethod == "ByName":
+            for clip in clips:
+                if self.dvrCall(clip, "GetClipProperty", "Clip Name") == clipKey:
+                    targetClip = clip
+                    break
+        else:
+            raise ValueError("Get Method '{0}' is not supported. Please choose between: "
+                             "'ByName'.".format(getMethod))
+
+        self.getPlug("clip", SDirection.kOut).setValue(targetClip)
+        super(self.__class__, self).execute()
+
+
+class DVR_ClipQuery(DVR_Base):
+    """Operator to query the clips of a project snapshot, created with DVR_ProjectSnapshot, and get the matching
+    live clip objects. The filters are evaluated in the snapshot database and only the clips that match them are
+    read from Resolve.
+    propertyFilters and metadataFilters: Dictionaries with the values required for each clip property or
+    metadata field. The values can use the wildcards '*' and '?'.
+    folderPath: The path of the folder from the root folder, like "Footage/Day01". The clips of the subfolders
+    are included too.
+    timelineName: Only the clips used in the timeline with this name are returned. The timeline items of those
+    clips are returned in the items output.
+    The empty filters are ignored.
+    Works in Davinci Resolve.
+
+    """
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_project = SPlug(
+            code="project",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_snapshotPath = SPlug(
+            code="snapshotPath",
+            value="",
+            type=SType.kFileIn,
+            direction=SDirection.kIn,
+            parent=self)
+        i_propertyFilters = SPlug(
+            code="propertyFilters",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_metadataFilters = SPlug(
+            code="metadataFilters",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_folderPath = SPlug(
+            code="folderPath",
+            value="",
+            type=SType.kString,
+            direction=SDirection.kIn,
+            parent=self)
+        i_timelineName = SPlug(
+            code="timelineName",
+            value="",
+            type=SType.kString,
+            direction=SDirection.kIn,
+            parent=self)
+        o_clips = SPlug(
+            code="clips",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_items = SPlug(
+            code="items",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_project)
+        self.addPlug(i_snapshotPath)
+        self.addPlug(i_propertyFilters)
+        self.addPlug(i_metadataFilters)
+        self.addPlug(i_folderPath)
+        self.addPlug(i_timelineName)
+        self.addPlug(o_clips)
+        self.addPlug(o_items)
+
+    def _valueCondition(self, column, value):
+        """Builds the SQL condition to compare a column with a filter value, using GLOB for the wildcards.
+
+        @param column str: The column name.
+        @param value str: The filter value.
+
+        @return str: The SQL condition.
+        @return str: The parameter for the condition.
+
+        """
+        value = str(value)
+        if any(char in value for char in "*?["):
+            return "{0} GLOB ?".format(column), value
+        return "{0} = ?".format(column), value
+
+    def _buildQuery(self, propertyFilters, metadataFilters, folderPath, timelineName):
+        """Builds the SQL query to get the id and the folder path of the clips that match the filters.
+
+        @param propertyFilters dict: The required values by clip property.
+        @param metadataFilters dict: The required values by metadata field.
+        @param folderPath str: The path of the folder that contains the clips.
+        @param timelineName str: The name of the timeline where the clips are used.
+
+        @return str: The SQL query.
+        @return list: The parameters of the query.
+
+        """
+        conditions = []
+        parameters = []
+        for table, filters in (("clip_properties", propertyFilters), ("clip_metadata", metadataFilters)):
+            for key, value in (filters or {}).items():
+                valueCondition, valueParameter = self._valueCondition("f.value", value)
+                conditions.append("EXISTS (SELECT 1 FROM {0} f WHERE f.clipId = c.id AND f.key = ? "
+                                  "AND {1})".format(table, valueCondition))
+                parameters.extend([key, valueParameter])
+        if folderPath:
+            conditions.append("(fo.path = ? OR fo.path GLOB ?)")
+            parameters.extend([folderPath, folderPath + "/*"])
+        if timelineName:
+            conditions.append("c.id IN (SELECT ti.clipId FROM timeline_items ti JOIN timelines t "
+                              "ON t.id = ti.timelineId WHERE t.name = ?)")
+            parameters.append(timelineName)
+        query = "SELECT c.id, fo.path FROM clips c JOIN folders fo ON fo.id = c.folderId"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        return query + " ORDER BY fo.path, c.name", parameters
+
+    def _getItems(self, connection, project, timelineName, clipIds):
+        """Gets the live timeline items of the given clips in the timeline with the given name.
+        Only the tracks that contain the clips are read.
+
+        @param connection sqlite3.Connection: The connection to the snapshot database.
+        @param project Resolve.Project: The project of the snapshot.
+        @param timelineName str: The name of the timeline.
+        @param clipIds set: The unique ids of the clips.
+
+        @return list: The timeline items.
+
+        """
+        row = connection.execute("SELECT id, idx FROM timelines WHERE name = ?", (timelineName,)).fetchone()
+        if row is None:
+            return []
+        timelineId, timelineIdx = row
+        timeline = self.dvrCall(project, "GetTimelineByIndex", timelineIdx)
+        if timeline is None or self.dvrCall(timeline, "GetName") != timelineName:
+            raise RuntimeError("The timeline '{0}' has changed since the snapshot was taken. "
+                               "Please, refresh the snapshot.".format(timelineName))
+        itemRows = connection.execute(
+            "SELECT trackType, trackIndex, itemIndex, clipId FROM timeline_items WHERE timelineId = ? "
+            "ORDER BY trackType, trackIndex, itemIndex", (timelineId,)).fetchall()
+        tracks = {}
+        items = []
+        for trackType, trackIdx, itemIdx, clipId in itemRows:
+            if clipId not in clipIds:
+                continue
+            if (trackType, trackIdx) not in tracks:
+                trackItems = self.dvrCall(timeline, "GetItemListInTrack", trackType, trackIdx)
+                tracks[(trackType, trackIdx)] = trackItems or []
+            trackItems = tracks[(trackType, trackIdx)]
+            if itemIdx <= len(trackItems):
+                items.append(trackItems[itemIdx - 1])
+            else:
+                logger.warning("The item {0} of the {1} track {2} was not found. The snapshot may be "
+                               "outdated.".format(itemIdx, trackType, trackIdx))
+        return items
+
+    def execute(self, force=False):
+        """Queries the snapshot with the given filters and gets the matching clips and timeline items.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        self.checkDvr()
+        project = self.getPlug("project", SDirection.kIn).value
+        snapshotPath = self.getPlug("snapshotPath", SDirection.kIn).value
+        propertyFilters = self.getPlug("propertyFilters", SDirection.kIn).value
+        metadataFilters = self.getPlug("metadataFilters", SDirection.kIn).value
+        folderPath = self.getPlug("folderPath", SDirection.kIn).value
+        timelineName = self.getPlug("timelineName", SDirection.kIn).value
+        self.checkClass(project, "project")
+        if not os.path.isfile(snapshotPath):
+            raise ValueError("A valid filepath to a project snapshot is required. Got {0}".format(snapshotPath))
+        for filters in (propertyFilters, metadataFilters):
+            if filters and not isinstance(filters, dict):
+                raise ValueError("The property and metadata filters have to be dictionaries.")
+        folderPath = folderPath.replace("\\", "/").strip("/")
+
+        query, parameters = self._buildQuery(propertyFilters, metadataFilters, folderPath, timelineName)
+        connection = sqlite3.connect(snapshotPath)
+        try:
+            rows = connection.execute(query, parameters).fetchall()
+            clipIds = set(clipId for clipId, _ in rows)
+            items = self._getItems(connection, project, timelineName, clipIds) if timelineName else []
+        except sqlite3.Error as e:
+            raise RuntimeError("The project snapshot could not be queried: \n {0}".format(str(e)))
+        finally:
+            connection.close()
+
+        clipsById = self.getClipsById(self.dvrCall(project, "GetMediaPool"), clipIds, set(path for _, path in rows))
+        if len(clipsById) != len(clipIds):
+            logger.warning("{0} clips from the snapshot were not found in the media pool. The snapshot may be "
+                           "outdated.".format(len(clipIds) - len(clipsById)))
+        clips = [clipsById[clipId] for clipId, _ in rows if clipId in clipsById]
+        self.getPlug("clips", SDirection.kOut).setValue(clips)
+        self.getPlug("items", SDirection.kOut).setValue(items)
+        super(self.__class__, self).execute()
+
+
+class DVR_ClipUsageIndex(DVR_Base):
+    """Operator to build the index of the timelines that use each clip of the media pool.
+    All the timelines of the project are read once, and the usage output has, for each clip unique id, the list of
+    [timelineName, trackType, trackIndex, start, end] of its timeline items. The index is written to the indexFile,
+    and if useIndexFile is enabled and the file is from the same project, it's read from the file instead of
+    reading the timelines again. The project is identified by its unique id, and the index is only reused while the
+    unique id, name, end frame and tracks of every timeline are the same, and every track has the same clips in the
+    same order, so the unused clips are always current, but the start and end of the items can be outdated if they
+    were moved or trimmed without changing the end frame. If a folder is given, the unused output has the clips of the folder (and its subfolders if
+    recursive is enabled) that are not used in any timeline.
+    Works in Davinci Resolve.
+
+    """
+    trackTypes = ["video", "audio", "subtitle"]
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_project = SPlug(
+            code="project",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_folder = SPlug(
+            code="folder",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_recursive = SPlug(
+            code="recursive",
+            value=False,
+            type=SType.kBool,
+            direction=SDirection.kIn,
+            parent=self)
+        i_indexFile = SPlug(
+            code="indexFile",
+            value="",
+            type=SType.kFileOut,
+            direction=SDirection.kIn,
+            parent=self)
+        i_useIndexFile = SPlug(
+            code="useIndexFile",
+            value=False,
+            type=SType.kBool,
+            direction=SDirection.kIn,
+            parent=self)
+        o_usage = SPlug(
+            code="usage",
+            value={},
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_unused = SPlug(
+            code="unused",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_project)
+        self.addPlug(i_folder)
+        self.addPlug(i_recursive)
+        self.addPlug(i_indexFile)
+        self.addPlug(i_useIndexFile)
+        self.addPlug(o_usage)
+        self.addPlug(o_unused)
+
+    def _projectMarker(self, project):
+        """Computes a marker of the state of the timelines of the project, to detect the changes since the index
+        was written. It reads the media pool item of every timeline item, but not its start and end, so it needs
+        half of the calls of building the index.
+
+        @param project Resolve.Project: The project.
+
+        @return str: The hexadecimal digest of the unique id, name and end frame of the timelines, and the unique
+            ids of the clips of each track.
+
+        """
+        digest = hashlib.sha256()
+        for timelineIdx in range(1, self.dvrCall(project, "GetTimelineCount") + 1):
+            timeline = self.dvrCall(project, "GetTimelineByIndex", timelineIdx)
+            futures = [self.dvrSubmit(timeline, "GetUniqueId"), self.dvrSubmit(timeline, "GetName"),
+                       self.dvrSubmit(timeline, "GetEndFrame")]
+            tracks = []
+            for trackType in self.trackTypes:
+                for trackIdx in range(1, self.dvrCall(timeline, "GetTrackCount", trackType) + 1):
+                    items = self.dvrCall(timeline, "GetItemListInTrack", trackType, trackIdx) or []
+                    tracks.append((trackType, [self.dvrSubmit(item, "GetMediaPoolItem") for item in items]))
+            clipIds = []
+            for trackType, clipFutures in tracks:
+                clips = [future.result() for future in clipFutures]
+                idFutures = [self.dvrSubmit(clip, "GetUniqueId") if clip else None for clip in clips]
+                clipIds.append([trackType, len(clips)] +
+                               [future.result() if future else None for future in idFutures])
+            digest.update(json.dumps([future.result() for future in futures] + clipIds).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _readIndex(self, indexFile, projectId, marker):
+        """Reads the usage index written by a previous execution.
+
+        @param indexFile str: The path of the index file.
+        @param projectId str: The unique id of the current project.
+        @param marker str: The marker of the current state of the timelines (see _projectMarker).
+
+        @return dict: The usage by clip unique id, or None if there is no index for the project or the timelines
+            have changed.
+
+        """
+        if not indexFile or not os.path.isfile(indexFile):
+            return None
+        try:
+            with open(indexFile, "r") as usageFile:
+                content = json.load(usageFile)
+        except Exception as e:
+            logger.warning("The clip usage index could not be read, the timelines will be read: "
+                           "\n {0}".format(str(e)))
+            return None
+        if content.get("projectId") != projectId or content.get("marker") != marker:
+            return None
+        return content.get("clips", {})
+
+    def _writeIndex(self, indexFile, projectId, projectName, marker, usage):
+        """Writes the usage index. The file is replaced atomically.
+
+        @param indexFile str: The path of the index file.
+        @param projectId str: The unique id of the project.
+        @param projectName str: The name of the project.
+        @param marker str: The marker of the state of the timelines (see _projectMarker).
+        @param usage dict: The usage by clip unique id.
+
+        """
+        with open(indexFile + ".tmp", "w") as usageFile:
+            json.dump({"projectId": projectId, "project": projectName, "marker": marker,
+                       "time": time.strftime("%Y-%m-%d %H:%M:%S"), "clips": usage}, usageFile, sort_keys=True)
+        os.replace(indexFile + ".tmp", indexFile)
+
+    def _buildIndex(self, project):
+        """Reads the items of all the timelines of the project.
+
+        @param project Resolve.Project: The project.
+
+        @return dict: The [timelineName, trackType, trackIndex, start, end] lists by clip unique id.
+
+        """
+        usage = collections.defaultdict(list)
+        for timelineIdx in range(1, self.dvrCall(project, "GetTimelineCount") + 1):
+            timeline = self.dvrCall(project, "GetTimelineByIndex", timelineIdx)
+            timelineName = self.dvrCall(timeline, "GetName")
+            itemCalls = []
+            for trackType in self.trackTypes:
+                for trackIdx in range(1, self.dvrCall(timeline, "GetTrackCount", trackType) + 1):
+                    for item in self.dvrCall(timeline, "GetItemListInTrack", trackType, trackIdx) or []:
+                        itemCalls.append((trackType, trackIdx, self.dvrSubmit(item, "GetMediaPoolItem"),
+                                          self.dvrSubmit(item, "GetStart"), self.dvrSubmit(item, "GetEnd")))
+            clipCalls = []
+            for trackType, trackIdx, clipFuture, startFuture, endFuture in itemCalls:
+                clip = clipFuture.result()
+                if clip:
+                    clipCalls.append((self.dvrSubmit(clip, "GetUniqueId"), [
+                        timelineName, trackType, trackIdx, startFuture.result(), endFuture.result()]))
+            for idFuture, entry in clipCalls:
+                usage[idFuture.result()].append(entry)
+        return dict(usage)
+
+    def execute(self, force=False):
+        """Builds or reads the clip usage index and finds the unused clips of the folder.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        self.checkDvr()
+        project = self.getPlug("project", SDirection.kIn).value
+        folder = self.getPlug("folder", SDirection.kIn).value
+        recursive = self.getPlug("recursive", SDirection.kIn).value
+        indexFile = self.getPlug("indexFile", SDirection.kIn).value
+        useIndexFile = self.getPlug("useIndexFile", SDirection.kIn).value
+        self.checkClass(project, "project")
+        if folder is not None:
+            self.checkClass(folder, "folder")
+        projectId = self.dvrCall(project, "GetUniqueId")
+        marker = self._projectMarker(project) if indexFile else None
+
+        usage = self._readIndex(indexFile, projectId, marker) if useIndexFile else None
+        if usage is None:
+            try:
+                usage = self._buildIndex(project)
+            except Exception as e:
+                raise RuntimeError("The timelines could not be read: \n {0}".format(str(e)))
+            if indexFile:
+                self._writeIndex(indexFile, projectId, self.dvrCall(project, "GetName"), marker, usage)
+
+        unused = []
+        if folder is not None:
+            folders = [subFolder for subFolder, _ in self.walkFolders(folder)] if recursive else [folder]
+            clipCalls = [(clip, self.dvrSubmit(clip, "GetUniqueId"))
+                         for subFolder in folders for clip in self.dvrCall(subFolder, "GetClipList") or []]
+            unused = [clip for clip, idFuture in clipCalls if idFuture.result() not in usage]
+
+        self.getPlug("usage", SDirection.kOut).setValue(usage)
+        self.getPlug("unused", SDirection.kOut).setValue(unused)
+        super(self.__class__, self).execute()
+
+
+class DVR_ClipsGet(DVR_Base):
+    """Operator to get all the clips from a Resolve folder.
+    Works in Davinci Resolve.
+
+    """
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_folder = SPlug(
+            code="folder",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        o_clips = SPlug(
+            code="clips",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_folder)
+        self.addPlug(o_clips)
+
+    def execute(self, force=False):
+        """Gets the list of clips from the given folder.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        self.checkDvr()
+        folder = self.getPlug("folder", SDirection.kIn).value
+        self.checkClass(folder, "folder")
+        try:
+            clips = self.dvrCall(folder, "GetClipList")
+        except Exception as e:
+            raise RuntimeError("The clips couldn't be get from the folder: \n {0}".format(str(e)))
+
+        self.getPlug("clips", SDirection.kOut).setValue(clips)
+        super(self.__class__, self).execute()
+
+
+class DVR_EdlRead(DVR_Base):
+    """Operator to read the events of an EDL file (CMX 3600, CDL or SDL), like the ones created by DVR_TimelineExport.
+    It returns a list of EdlEvent records with the event number, reel, track, transition, source and record
+    in and out like frame numbers, clip name, comments and the CDL values of each event.
+    Activate the stream flag to get a generator instead of a list, so the events are read from the file
+    while they are consumed.
+    This operator doesn't use the Resolve API, so it can be executed outside Davinci Resolve.
+
+    """
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_filepath = SPlug(
+            code="filepath",
+            value="",
+            type=SType.kFileIn,
+            direction=SDirection.kIn,
+            parent=self)
+        i_fps = SPlug(
+            code="fps",
+            value="24",
+            type=SType.kEnum,
+            options=timecodeRates,
+            direction=SDirection.kIn,
+            parent=self)
+        i_stream = SPlug(
+            code="stream",
+            value=False,
+            type=SType.kBool,
+            direction=SDirection.kIn,
+            parent=self)
+        o_events = SPlug(
+            code="events",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_filepath)
+        self.addPlug(i_fps)
+        self.addPlug(i_stream)
+        self.addPlug(o_events)
+
+    def _streamEvents(self, filepath, fps):
+        """Generator that yields the events of the EDL file, raising the same errors as the non-stream mode.
+
+        @param filepath str: The path to the EDL file.
+        @param fps str: The frame rate of the EDL timecodes.
+
+        @return generator: The EdlEvent records of the file.
+
+        @raises RuntimeError: Raise an error with the file and line number if the EDL file can't be read.
+
+        """
+        try:
+            for event in iterEdlEvents(filepath, fps):
+                yield event
+        except Exception as e:
+            raise RuntimeError("The EDL file could not be read: \n {0}".format(str(e)))
+
+    def execute(self, force=False):
+        """Reads the events from the given EDL file.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        filepath = self.getPlug("filepath", SDirection.kIn).value
+        fps = self.getPlug("fps", SDirection.kIn).value
+        stream = self.getPlug("stream", SDirection.kIn).value
+        if not os.path.isfile(filepath):
+            raise ValueError("A valid filepath to an EDL file is required. Got {0}".format(filepath))
+        if fps not in timecodeRates:
+            raise ValueError("The frame rate '{0}' is not supported. Please choose between: "
+                             "{1}.".format(fps, ", ".join(timecodeRates)))
+        if stream:
+            events = self._streamEvents(filepath, fps)
+        else:
+            try:
+                events = list(iterEdlEvents(filepath, fps))
+            except Exception as e:
+                raise RuntimeError("The EDL file could not be read: \n {0}".format(str(e)))
+        self.getPlug("events", SDirection.kOut).setValue(events)
+        super(self.__class__, self).execute()
+
+
+class DVR_FolderAdd(DVR_Base):
+    """Operator to create a folder inside other folder with the given name in Resolve.
+    Works in Davinci Resolve.
+
+    """
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_project = SPlug(
+            code="project",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_folder = SPlug(
+            code="folder",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_name = SPlug(
+            code="name",
+            value="",
+            type=SType.kString,
+            direction=SDirection.kIn,
+            parent=self)
+        o_folder = SPlug(
+            code="folder",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_project)
+        self.addPlug(i_folder)
+        self.addPlug(i_name)
+        self.addPlug(o_folder)
+
+    def execute(self, force=False):
+        """Add a new subFolder in the given folder with the given name.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        self.checkDvr()
+        currentFolder = self.getPlug("folder", SDirection.kIn).value
+        folderName = self.getPlug("name", SDirection.kIn).value
+        project = self.getPlug("project", SDirection.kIn).value
+        self.checkClass(currentFolder, "folder")
+        self.checkClass(project, "project")
+        try:
+            folder = self.dvrCall(self.dvrCall(project, "GetMediaPool"), "AddSubFolder", currentFolder, folderName)
+        except Exception as e:
+            raise RuntimeError("The folder couldn't be created: \n {0}".format(str(e)))
+        self.invalidateCache(currentFolder)
+
+        self.getPlug("folder", SDirection.kOut).setValue(folder)
+        super(self.__class__, self).execute()
+
+
+class DVR_FolderGet(DVR_Base):
+    """Operator to get a Folder from the media pool of the project.
+    Select the getMethod to return the current active folder, the root folder or a specific folder
+    by a full path to the folder.
+    Works in Davinci Resolve.
+
+    """
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_project = SPlug(
+            code="project",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_getMethod = SPlug(
+            code="getMethod",
+            value="Current",
+            type=SType.kEnum,
+            options=["Current", "Root", "FullPath"],
+            direction=SDirection.kIn,
+            parent=self)
+        i_folderPath = SPlug(
+            code="folderPath",
+            value="",
+            type=SType.kString,
+            direction=SDirection.kIn,
+            parent=self)
+        i_createFolders = SPlug(
+            code="createFolders",
+            value=False,
+            type=SType.kBool,
+            direction=SDirection.kIn,
+            parent=self)
+        o_folder = SPlug(
+            code="folder",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_project)
+        self.addPlug(i_getMethod)
+        self.addPlug(i_folderPath)
+        self.addPlug(i_createFolders)
+        self.addPlug(o_folder)
+
+    def _recursiveFolderResearch(self, currentFolder, currentPath, targetPath, mediapool, createFolders=False):
+        """Recursive function to find a folder object based in the full path of the folder.
+        The Resolve API doesn't allow to get a folder by name or full path, only allows to get the
+        root, current and subfolders. Because of this, this function is a utility to research over a given folder and subfolders
+        to be able to return a folder given a full path from the root folder.
+
+        @param currentFolder Resolve.Folder: The current folder to check the subFolders from.
+        @param currentPath str: The current status of the path that is being research.
+        @param targetPath str: The target result of the path. The full folder path to get.
+        @param mediapool Resolve.MediaPool: The media pool object from the Resolve API.
+        @param createFolders bool: If it's true, any not found folder, will be created. (Default=False)
+
+        @returns Resolve.Folder: The Folder that match the targetPath.
+
+        """
+        subFolders = self.dvrCall(currentFolder, "GetSubFolderList")
+        for subFolder in subFolders:
+            subFolderName = self.dvrCall(subFolder, "GetName")
+            pathCheck = currentPath + "{0}/".format(subFolderName)
+            if pathCheck == targetPath:
+                return subFolder  # Here we end the recursion
+            elif targetPath.startswith(pathCheck):
+                # The folder is correct, but we still need another recursion level at least
+                return self._recursiveFolderResearch(subFolder, pathCheck, targetPath, mediapool, createFolders=createFolders)
+        if createFolders:
+            newFolderName = targetPath.replace(currentPath, "").partition("/")[0]
+            subFolder = self.dvrCall(mediapool, "AddSubFolder", currentFolder, newFolderName)
+            self.invalidateCache(currentFolder)
+            subFolderName = self.dvrCall(subFolder, "GetName")
+            pathCheck = currentPath + "{0}/".format(subFolderName)
+            if pathCheck == targetPath:
+                return subFolder  # Here we end the recursion
+            elif targetPath.startswith(pathCheck):
+                # The folder is correct, but we still need another recursion level at least
+                return self._recursiveFolderResearch(subFolder, pathCheck, targetPath, mediapool,
+                                                     createFolders=createFolders)
+        return  # If we go to this return means that the folder haven't been found.
+
+    def execute(self, force=False):
+        """Gets the requested folder object from the media pool.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        self.checkDvr()
+        project = self.getPlug("project").value
+        getMethod = self.getPlug("getMethod").value
+        folderPath = self.getPlug("folderPath").value
+        createFolders = self.getPlug("createFolders").value
+        self.checkClass(project, "project")
+        mediapool = self.dvrCall(project, "GetMediaPool")
+        if getMethod == "Current":
+            folder = self.dvrCall(mediapool, "GetCurrentFolder")
+        elif getMethod == "Root":
+            folder = self.dvrCall(mediapool, "GetRootFolder")
+        elif getMethod == "FullPath":
+            if not folderPath:
+                raise ValueError("A folder path is required to use the FullPath get method.")
+            folderPath = folderPath.replace("\\", "/")
+            inputFolderPath = folderPath if folderPath.endswith("/") else folderPath + "/"
+            try:
+                folder = self._recursiveFolderResearch(self.dvrCall(mediapool, "GetRootFolder"), "", inputFolderPath,
+                                                       mediapool, createFolders=createFolders)
+            except Exception as e:
+                raise RuntimeError("The folder couldn't be found using the FullPath get method. "
+                                   "Check that the Folder path is correct: \n {0}".format(str(e)))
+        else:
+            raise ValueError("Get Method '{0}' is not supported. Please choose between: "
+                             "'Current', 'Root', 'FullPath'.".format(getMethod))
+
+
+        self.getPlug("folder", SDirection.kOut).setValue(folder)
+        super(self.__class__, self).execute()
+
+
+class DVR_FolderList(DVR_Base):
+    """Operator to get the list of folders within the given folder.
+    It can return only the folders directly under the input folder or make a recursive research to return all
+    subfolders from the given folder activating the recursiveSearch flag.
+    The recursive research can be split in several executions with the timeBudget input, in milliseconds.
+    When the budget runs out, the folders found so far are returned with a cursor output. Connect the cursor
+    output to the cursor input of the next execution to continue the research. The cursor output is None once
+    the research is completed.
+    Works in Davinci Resolve.
+    """
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_folder = SPlug(
+            code="folder",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_recursiveSearch = SPlug(
+            code="recursiveSearch",
+            value=False,
+            type=SType.kBool,
+            direction=SDirection.kIn,
+            parent=self)
+        i_timeBudget = SPlug(
+            code="timeBudget",
+            value=0,
+            type=SType.kInt,
+            direction=SDirection.kIn,
+            parent=self)
+        i_cursor = SPlug(
+            code="cursor",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        o_folders = SPlug(
+            code="folders",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_cursor = SPlug(
+            code="cursor",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_folder)
+        self.addPlug(i_recursiveSearch)
+        self.addPlug(i_timeBudget)
+        self.addPlug(i_cursor)
+        self.addPlug(o_folders)
+        self.addPlug(o_cursor)
+
+    def getFoldersRecursive(self, folder, folders):
+        """Recursive function that returns the full list of subfolders for a specific folder.
+        @param folder Resolve.Folder: The folder to get all the subfolders from.
+        @param folders list: The list of subfolders already found.
+        @return list: The list of subfolders updated.
+        """
+        subFolders = self.dvrCall(folder, "GetSubFolderList")
+        for subFolder in subFolders:
+            folders.append(subFolder)
+            folders = self.getFoldersRecursive(subFolder, folders)
+        return folders
+
+    def getFoldersBudgeted(self, pending, deadline):
+        """Returns the subfolders of the pending folders, depth first, until the deadline is reached.
+        The folders are returned in the same order as getFoldersRecursive. At least one folder is read
+        in each call, so the research always progresses.
+
+        @param pending list: The stack of (folder, isSubFolder) tuples to visit. It's updated in place.
+        @param deadline float: The deadline returned by getDeadline.
+
+        @return list: The list of subfolders found before the deadline.
+
+        """
+        folders = []
+        while pending:
+            folder, isSubFolder = pending.pop()
+            if isSubFolder:
+                folders.append(folder)
+            subFolders = self.dvrCall(folder, "GetSubFolderList") or []
+            pending.extend((subFolder, True) for subFolder in reversed(subFolders))
+            if self.isExpired(deadline):
+                break
+        return folders
+
+    def execute(self, force=False):
+        """Gets the list of subfolders from the given folder.
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+        """
+        self.checkDvr()
+        folder = self.getPlug("folder").value
+        recursiveSearch = self.getPlug("recursiveSearch").value
+        timeBudget = self.getPlug("timeBudget", SDirection.kIn).value
+        cursor = self.getPlug("cursor", SDirection.kIn).value
+
+        # Check inputs
+        self.checkClass(folder, "folder")
+
+        outCursor = None
+        if recursiveSearch and (timeBudget > 0 or cursor):
+            folderId = self.dvrCall(folder, "GetUniqueId")
+            pending = self.readCursor(cursor, folderId) or [(folder, False)]
+            folders = self.getFoldersBudgeted(pending, self.getDeadline(timeBudget))
+            if pending:
+                outCursor = self.makeCursor(folderId, pending)
+                logger.info("Folder research paused after {0} folders, {1} folders pending.".format(
+                    len(folders), len(pending)))
+        elif recursiveSearch:
+            folders = self.getFoldersRecursive(folder, [])
+        else:
+            folders = self.dvrCall(folder, "GetSubFolderList")
+
+        self.getPlug("folders", SDirection.kOut).setValue(folders)
+        self.getPlug("cursor", SDirection.kOut).setValue(outCursor)
+        super(self.__class__, self).execute()
+
+
+class DVR_FolderNameGet(DVR_Base):
+    """Operator to get the name of a given folder.
+    Works in Davinci Resolve.
+
+    """
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_folder = SPlug(
+            code="folder",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        o_name = SPlug(
+            code="name",
+            value="",
+            type=SType.kString,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_folder)
+        self.addPlug(o_name)
+
+    def execute(self, force=False):
+        """Gets the name of the given folder object.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        self.checkDvr()
+        folder = self.getPlug("folder").value
+        self.checkClass(folder, "folder")
+        folderName = self.dvrCall(folder, "GetName")
+        self.getPlug("name", SDirection.kOut).setValue(folderName)
+        super(self.__class__, self).execute()
+
+
+class DVR_FolderSet(DVR_Base):
+    """Operator to set the current active folder in the media pool of the project.
+    Works in Davinci Resolve.
+
+    """
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_project = SPlug(
+            code="project",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_folder = SPlug(
+            code="folder",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+
+        self.addPlug(i_project)
+        self.addPlug(i_folder)
+
+    def execute(self, force=False):
+        """Sets the current active folder in the media pool of the project.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        self.checkDvr()
+        folder = self.getPlug("folder", SDirection.kIn).value
+        project = self.getPlug("project", SDirection.kIn).value
+
+        self.checkClass(folder, "folder")
+        self.checkClass(project, "project")
+        msg = ""
+        try:
+            result = self.dvrCall(self.dvrCall(project, "GetMediaPool"), "SetCurrentFolder", folder)
+        except Exception as e:
+            msg = str(e)
+            result = False
+        if not result:
+            raise RuntimeError("The folder couldn't be set as active: {0}".format(msg))
+
+        super(self.__class__, self).execute()
+
+
+class DVR_MarkersGet(DVR_Base):
+    """Operator to read the markers of a list of timelines and clips.
+    The markers of each timeline or clip are read with a single call and sorted by frame, and only the markers
+    from startFrame to endFrame (both included, -1 for no end limit) with one of the given colors (comma separated,
+    empty for all the colors) are returned. The frames are relative to the start of the timeline or clip.
+    The markers output has a dictionary for each marker with the timeline or clip ("source"), the frame, color,
+    name, note, duration and customData, sorted by source, in the input order, and by frame.
+    Works in Davinci Resolve.
+
+    """
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_sources = SPlug(
+            code="sources",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_startFrame = SPlug(
+            code="startFrame",
+            value=0,
+            type=SType.kInt,
+            direction=SDirection.kIn,
+            parent=self)
+        i_endFrame = SPlug(
+            code="endFrame",
+            value=-1,
+            type=SType.kInt,
+            direction=SDirection.kIn,
+            parent=self)
+        i_colors = SPlug(
+            code="colors",
+            value="",
+            type=SType.kString,
+            direction=SDirection.kIn,
+            parent=self)
+        o_markers = SPlug(
+            code="markers",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_sources)
+        self.addPlug(i_startFrame)
+        self.addPlug(i_endFrame)
+        self.addPlug(i_colors)
+        self.addPlug(o_markers)
+
+    def execute(self, force=False):
+        """Reads, sorts and filters the markers of the timelines and clips.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        self.checkDvr()
+        sources = self.getPlug("sources", SDirection.kIn).value
+        startFrame = self.getPlug("startFrame", SDirection.kIn).value
+        endFrame = self.getPlug("endFrame", SDirection.kIn).value
+        colors = self.getPlug("colors", SDirection.kIn).value
+        if not isinstance(sources, list):
+            sources = [sources]
+        for source in sources:
+            if self.getObjClass(source) not in ("Timeline", "Media pool item"):
+                raise ValueError("The sources have to be timelines or clips, got {0}".format(
+                    self.getObjClass(source)))
+        colors = set(color.strip() for color in colors.split(",") if color.strip()) if colors else None
+
+        futures = [(source, self.dvrSubmit(source, "GetMarkers")) for source in sources]
+        result = []
+        for source, future in futures:
+            markers = {int(frame): marker for frame, marker in (future.result() or {}).items()}
+            frames = sorted(markers)
+            first = bisect.bisect_left(frames, startFrame)
+            last = len(frames) if endFrame < 0 else bisect.bisect_right(frames, endFrame)
+            for frame in frames[first:last]:
+                marker = markers[frame]
+                if colors is not None and marker.get("color") not in colors:
+                    continue
+                result.append({"source": source, "frame": frame, "color": marker.get("color", ""),
+                               "name": marker.get("name", ""), "note": marker.get("note", ""),
+                               "duration": marker.get("duration", 1), "customData": marker.get("customData", "")})
+
+        self.getPlug("markers", SDirection.kOut).setValue(result)
+        super(self.__class__, self).execute()
+
+
+class DVR_MarkersSet(DVR_Base):
+    """Operator to add markers to a timeline or a clip.
+    The markers can be given like a list of dictionaries with the frame, color, name, note, duration and
+    customData, like the ones of DVR_MarkersGet, or read from a file:
+    CSV or Tabbed Text (.txt) file: With a header with a frame or timecode column, and optionally color, name,
+    note, duration and customData columns.
+    EDL file: A marker for each event, at its record in (or its source in for the clips). The markers exported by
+    Resolve in EDL files, with the "|C:ResolveColorBlue |M:Name |D:1" comments, keep their color, name and
+    duration.
+    The timecodes, in the fps frame rate, are converted to frames relative to the start of the timeline or clip.
+    The markers without color use the defaultColor.
+    The existing markers are read once: the markers equal to an existing one are skipped, and the markers in a
+    frame that already has a different marker are skipped too, or replaced if replace is enabled. All the markers
+    are validated before changing the target, and each replaced marker is only deleted right before adding the
+    new one, and restored if the new one can't be added.
+    Works in Davinci Resolve.
+
+    """
+    markerColors = ["Blue", "Cyan", "Green", "Yellow", "Red", "Pink", "Purple", "Fuchsia", "Rose", "Lavender",
+                    "Sky", "Mint", "Lemon", "Sand", "Cocoa", "Cream"]
+    edlMarkerPattern = re.compile(r"\|C:ResolveColor(\w+)\s*\|M:(.*?)\s*\|D:(\d+)")
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_target = SPlug(
+            code="target",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_markers = SPlug(
+            code="markers",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_file = SPlug(
+            code="file",
+            value="",
+            type=SType.kFileIn,
+            direction=SDirection.kIn,
+            parent=self)
+        i_fps = SPlug(
+            code="fps",
+            value="24",
+            type=SType.kEnum,
+            options=timecodeRates,
+            direction=SDirection.kIn,
+            parent=self)
+        i_defaultColor = SPlug(
+            code="defaultColor",
+            value="Blue",
+            type=SType.kEnum,
+            options=self.markerColors,
+            direction=SDirection.kIn,
+            parent=self)
+        i_replace = SPlug(
+            code="replace",
+            value=False,
+            type=SType.kBool,
+            direction=SDirection.kIn,
+            parent=self)
+        o_added = SPlug(
+            code="added",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_skipped = SPlug(
+            code="skipped",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_target)
+        self.addPlug(i_markers)
+        self.addPlug(i_file)
+        self.addPlug(i_fps)
+        self.addPlug(i_defaultColor)
+        self.addPlug(i_replace)
+        self.addPlug(o_added)
+        self.addPlug(o_skipped)
+
+    def _readFile(self, filepath, fps, isTimeline, startOffset):
+        """Reads the markers of a CSV, Tabbed Text or EDL file.
+
+        @param filepath str: The path of the file.
+        @param fps str: The frame rate of the timecodes.
+        @param isTimeline bool: True if the markers are for a timeline, False for a clip.
+        @param startOffset int: The frame of the start of the timeline or clip, subtracted to the timecodes.
+
+        @return list: The marker dictionaries.
+
+        @raises ValueError: Raise an error with the file and line number if a row has more fields than the header.
+
+        """
+        markers = []
+        if filepath.lower().endswith(".edl"):
+            for event in iterEdlEvents(filepath, fps):
+                marker = {"frame": (event.recIn if isTimeline else event.srcIn) - startOffset,
+                          "name": event.clipName or event.reel, "note": ""}
+                for comment in event.comments:
+                    match = self.edlMarkerPattern.search(comment)
+                    if match is not None:
+                        marker.update(color=match.group(1), name=match.group(2), duration=int(match.group(3)))
+                markers.append(marker)
+            return markers
+        with open(filepath, "r", newline="", errors="replace") as tableFile:
+            reader = csv.DictReader(tableFile, delimiter="\t" if filepath.lower().endswith(".txt") else ",")
+            for row in reader:
+                # DictReader stores the fields that have no header column in a list under the None key
+                if None in row:
+                    raise ValueError("{0}, line {1}: The row has more fields than the header: {2}".format(
+                        filepath, reader.line_num, row[None]))
+                row = {key.strip().lower(): (value or "").strip() for key, value in row.items()}
+                if row.get("frame"):
+                    frame = int(row["frame"])
+                elif row.get("timecode"):
+                    frame = timecodeToFrames(row["timecode"], fps) - startOffset
+                else:
+                    raise ValueError("The marker rows require a frame or a timecode. Got {0}".format(row))
+                markers.append({"frame": frame, "color": row.get("color"), "name": row.get("name", ""),
+                                "note": row.get("note", ""), "duration": int(row.get("duration") or 1),
+                                "customData": row.get("customdata", "")})
+        return markers
+
+    def execute(self, force=False):
+        """Compares the markers with the existing ones and adds the new markers.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        self.checkDvr()
+        target = self.getPlug("target", SDirection.kIn).value
+        markers = self.getPlug("markers", SDirection.kIn).value
+        filepath = self.getPlug("file", SDirection.kIn).value
+        fps = self.getPlug("fps", SDirection.kIn).value
+        defaultColor = self.getPlug("defaultColor", SDirection.kIn).value
+        replace = self.getPlug("replace", SDirection.kIn).value
+        targetClass = self.getObjClass(target)
+        if targetClass not in ("Timeline", "Media pool item"):
+            raise ValueError("The target has to be a timeline or a clip, got {0}".format(targetClass))
+        isTimeline = targetClass == "Timeline"
+        markers = list(markers or [])
+        if filepath:
+            if not os.path.isfile(filepath):
+                raise ValueError("The markers file '{0}' does not exist.".format(filepath))
+            if isTimeline:
+                startOffset = self.dvrCall(target, "GetStartFrame")
+            else:
+                startOffset = timecodeToFrames(self.dvrCall(target, "GetClipProperty", "Start TC") or "00:00:00:00",
+                                               fps)
+            try:
+                markers.extend(self._readFile(filepath, fps, isTimeline, startOffset))
+            except (OSError, csv.Error) as e:
+                raise RuntimeError("The markers file could not be read: \n {0}".format(str(e)))
+
+        existing = {int(frame): marker for frame, marker in (self.dvrCall(target, "GetMarkers") or {}).items()}
+        toAdd = {}
+        skipped = []
+        for marker in markers:
+            frame = int(marker["frame"])
+            values = (marker.get("color") or defaultColor, marker.get("name") or "", marker.get("note") or "",
+                      int(marker.get("duration") or 1), marker.get("customData") or "")
+            if values[0] not in self.markerColors:
+                raise ValueError("The marker color '{0}' is not valid. Use one of {1}.".format(values[0],
+                                                                                               self.markerColors))
+            if frame in toAdd:
+                skipped.append(frame)
+                continue
+            current = existing.get(frame)
+            if current is not None:
+                currentValues = (current.get("color"), current.get("name", ""), current.get("note", ""),
+                                 int(current.get("duration", 1)), current.get("customData", ""))
+                if currentValues == values or not replace:
+                    if currentValues != values:
+                        logger.warning("The frame {0} already has a different marker, it's not replaced.".format(
+                            frame))
+                    skipped.append(frame)
+                    continue
+                toAdd[frame] = (values, currentValues)
+            else:
+                toAdd[frame] = (values, None)
+
+        # The replaced markers are deleted right before adding the new ones, in the same submission order
+        futures = []
+        for frame, (values, currentValues) in toAdd.items():
+            deleteFuture = None
+            if currentValues is not None:
+                deleteFuture = self.dvrSubmit(target, "DeleteMarkerAtFrame", frame)
+            futures.append((frame, currentValues, deleteFuture, self.dvrSubmit(target, "AddMarker", frame, *values)))
+        added = []
+        failedFrames = []
+        restores = []
+        msg = ""
+        for frame, currentValues, deleteFuture, addFuture in futures:
+            deleted = False
+            if deleteFuture is not None:
+                try:
+                    deleted = bool(deleteFuture.result())
+                except Exception as e:
+                    msg += "\n " + str(e)
+            try:
+                result = addFuture.result()
+            except Exception as e:
+                msg += "\n " + str(e)
+                result = False
+            if result:
+                added.append(frame)
+                continue
+            failedFrames.append(frame)
+            if deleted:
+                restores.append((frame, self.dvrSubmit(target, "AddMarker", frame, *currentValues)))
+        for frame, future in restores:
+            try:
+                restored = future.result()
+            except Exception:
+                restored = False
+            if not restored:
+                logger.warning("The original marker of the frame {0} could not be restored.".format(frame))
+        self.invalidateCache(target)
+        if failedFrames:
+            raise RuntimeError("The markers of the frames {0} could not be added: {1}".format(failedFrames, msg))
+
+        self.getPlug("added", SDirection.kOut).setValue(sorted(added))
+        self.getPlug("skipped", SDirection.kOut).setValue(skipped)
+        super(self.__class__, self).execute()
+
+
+class DVR_MediaDuplicates(DVR_Base):
+    """Operator to find the clips of the media pool that use the same media, even with different file names.
+    The "File Path" of every clip is read, and the clips with the same file are duplicates. The files are grouped
+    by size and only the files with the same size as another file are hashed, in parallel. The hashes are stored
+    in the cacheFile, by path, size and modification time, so the next executions only hash the new or modified
+    files. The image sequence clips are not compared.
+    Works in Davinci Resolve.
+
+    """
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_project = SPlug(
+            code="project",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_folder = SPlug(
+            code="folder",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_cacheFile = SPlug(
+            code="cacheFile",
+            value="",
+            type=SType.kFileOut,
+            direction=SDirection.kIn,
+            parent=self)
+        i_workers = SPlug(
+            code="workers",
+            value=4,
+            type=SType.kInt,
+            direction=SDirection.kIn,
+            parent=self)
+        o_duplicates = SPlug(
+            code="duplicates",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_stats = SPlug(
+            code="stats",
+            value={},
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_project)
+        self.addPlug(i_folder)
+        self.addPlug(i_cacheFile)
+        self.addPlug(i_workers)
+        self.addPlug(o_duplicates)
+        self.addPlug(o_stats)
+
+    def _readCache(self, cacheFile):
+        """Reads the hash cache of the previous executions.
+
+        @param cacheFile str: The path of the cache file.
+
+        @return dict: The [size, mtime, hash] lists by file path. Empty if there is no cache.
+
+        """
+        if not cacheFile or not os.path.isfile(cacheFile):
+            return {}
+        try:
+            with open(cacheFile, "r") as hashCacheFile:
+                return json.load(hashCacheFile).get("files", {})
+        except Exception as e:
+            logger.warning("The hash cache could not be read, all the files will be hashed: \n {0}".format(str(e)))
+            return {}
+
+    def _writeCache(self, cacheFile, hashes):
+        """Writes the hash cache. The file is replaced atomically.
+
+        @param cacheFile str: The path of the cache file.
+        @param hashes dict: The [size, mtime, hash] lists by file path.
+
+        """
+        with open(cacheFile + ".tmp", "w") as hashCacheFile:
+            json.dump({"files": hashes}, hashCacheFile, indent=1, sort_keys=True)
+        os.replace(cacheFile + ".tmp", cacheFile)
+
+    def execute(self, force=False):
+        """Reads the files of the clips and returns the groups of clips with the same content.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        self.checkDvr()
+        project = self.getPlug("project", SDirection.kIn).value
+        folder = self.getPlug("folder", SDirection.kIn).value
+        cacheFile = self.getPlug("cacheFile", SDirection.kIn).value
+        workers = self.getPlug("workers", SDirection.kIn).value
+        self.checkClass(project, "project")
+        if workers < 1:
+            raise ValueError("The workers value has to be greater than 0.")
+        if folder is None:
+            folder = self.dvrCall(self.dvrCall(project, "GetMediaPool"), "GetRootFolder")
+        self.checkClass(folder, "folder")
+
+        # One bulk property fetch per clip, all submitted before waiting
+        futures = []
+        for subFolder, _ in self.walkFolders(folder):
+            for clip in self.dvrCall(subFolder, "GetClipList") or []:
+                futures.append((clip, self.dvrSubmit(clip, "GetClipProperty")))
+        clipsByPath = collections.defaultdict(list)
+        for clip, future in futures:
+            filePath = (future.result() or {}).get("File Path")
+            if filePath and sequenceClipPath(filePath) is None:
+                clipsByPath[normalizeMediaPath(filePath)].append(clip)
+
+        pathsBySize = collections.defaultdict(list)
+        stats = {}
+        for path in clipsByPath:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                logger.warning("The file '{0}' could not be read.".format(path))
+                continue
+            stats[path] = (stat.st_size, stat.st_mtime)
+            pathsBySize[stat.st_size].append(path)
+
+        cache = self._readCache(cacheFile)
+        hashes = {}
+        toHash = []
+        for paths in pathsBySize.values():
+            if len(paths) < 2:
+                continue
+            for path in paths:
+                cached = cache.get(path)
+                if cached is not None and cached[0] == stats[path][0] and cached[1] == stats[path][1]:
+                    hashes[path] = cached[2]
+                else:
+                    toHash.append(path)
+        cachedCount = len(hashes)
+        hashStart = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            hashFutures = [(path, executor.submit(hashFile, path)) for path in toHash]
+            for path, future in hashFutures:
+                try:
+                    hashes[path] = future.result()
+                except Exception as e:
+                    logger.warning("The file '{0}' could not be hashed: \n {1}".format(path, str(e)))
+        hashTime = time.perf_counter() - hashStart
+        if cacheFile:
+            cache.update((path, [stats[path][0], stats[path][1], digest]) for path, digest in hashes.items())
+            self._writeCache(cacheFile, cache)
+
+        # The clips of the same file are duplicates, and the files with the same hash too
+        pathsByHash = collections.defaultdict(list)
+        for path, digest in hashes.items():
+            pathsByHash[digest].append(path)
+        duplicates = []
+        groupedPaths = set()
+        for paths in pathsByHash.values():
+            clips = [clip for path in sorted(paths) for clip in clipsByPath[path]]
+            groupedPaths.update(paths)
+            if len(clips) > 1:
+                duplicates.append(clips)
+        for path, clips in sorted(clipsByPath.items()):
+            if path not in groupedPaths and len(clips) > 1:
+                duplicates.append(clips)
+
+        self.getPlug("duplicates", SDirection.kOut).setValue(duplicates)
+        self.getPlug("stats", SDirection.kOut).setValue({"clips": len(futures),
+                                                        "files": len(clipsByPath),
+                                                        "hashed": len(toHash),
+                                                        "cached": cachedCount,
+                                                        "hashSeconds": hashTime,
+                                                        "groups": len(duplicates)})
+        super(self.__class__, self).execute()
+
+
+class DVR_MediaImport(DVR_Base):
+    """Operator to import the media files of a directory into a folder of the media pool.
+    The directory is scanned with several threads, and the files already imported in any folder of the media pool,
+    with the same "File Path", are skipped. If sequences is enabled, the numbered frames of the image formats
+    (EXR, DPX, ...) are grouped and imported like image sequences, one clip for each range of consecutive frames.
+    Only the ranges already imported with the same frames are skipped, so the new frames and ranges of a
+    sequence are imported like new clips.
+    The files and sequences are imported in batches of batchSize elements. The stats output has the number of files,
+    the import rate in files per second and the latency of each batch.
+    Works in Davinci Resolve.
+
+    """
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_project = SPlug(
+            code="project",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_folder = SPlug(
+            code="folder",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_directory = SPlug(
+            code="directory",
+            value="",
+            type=SType.kDir,
+            direction=SDirection.kIn,
+            parent=self)
+        i_recursive = SPlug(
+            code="recursive",
+            value=True,
+            type=SType.kBool,
+            direction=SDirection.kIn,
+            parent=self)
+        i_extensions = SPlug(
+            code="extensions",
+            value="",
+            type=SType.kString,
+            direction=SDirection.kIn,
+            parent=self)
+        i_sequences = SPlug(
+            code="sequences",
+            value=True,
+            type=SType.kBool,
+            direction=SDirection.kIn,
+            parent=self)
+        i_batchSize = SPlug(
+            code="batchSize",
+            value=100,
+            type=SType.kInt,
+            direction=SDirection.kIn,
+            parent=self)
+        i_workers = SPlug(
+            code="workers",
+            value=8,
+            type=SType.kInt,
+            direction=SDirection.kIn,
+            parent=self)
+        o_clips = SPlug(
+            code="clips",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_skipped = SPlug(
+            code="skipped",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_stats = SPlug(
+            code="stats",
+            value={},
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_project)
+        self.addPlug(i_folder)
+        self.addPlug(i_directory)
+        self.addPlug(i_recursive)
+        self.addPlug(i_extensions)
+        self.addPlug(i_sequences)
+        self.addPlug(i_batchSize)
+        self.addPlug(i_workers)
+        self.addPlug(o_clips)
+        self.addPlug(o_skipped)
+        self.addPlug(o_stats)
+
+    def _missingPaths(self, batch, clips):
+        """Finds the items of a batch that were not imported, comparing their paths with the "File Path" of the
+        clips returned by ImportMedia.
+
+        @param batch list: The (item, path) tuples of the batch.
+        @param clips list: The clips returned by ImportMedia for the batch.
+
+        @return list: The paths of the items without clip.
+
+        """
+        futures = [self.dvrSubmit(clip, "GetClipProperty", "File Path") for clip in clips]
+        importedPaths = set(normalizeMediaPath(future.result() or "") for future in futures)
+        missing = [path for _, path in batch if normalizeMediaPath(path) not in importedPaths]
+        if len(missing) != len(batch) - len(clips):
+            logger.warning("{0} of the {1} items of the batch were not imported, but the clips could not be matched "
+                           "with their files.".format(len(batch) - len(clips), len(batch)))
+        return missing
+
+    def execute(self, force=False):
+        """Scans the directory and imports the files that are not in the media pool into the given folder.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        self.checkDvr()
+        project = self.getPlug("project", SDirection.kIn).value
+        folder = self.getPlug("folder", SDirection.kIn).value
+        directory = self.getPlug("directory", SDirection.kIn).value
+        recursive = self.getPlug("recursive", SDirection.kIn).value
+        extensions = self.getPlug("extensions", SDirection.kIn).value
+        useSequences = self.getPlug("sequences", SDirection.kIn).value
+        batchSize = self.getPlug("batchSize", SDirection.kIn).value
+        workers = self.getPlug("workers", SDirection.kIn).value
+        self.checkClass(project, "project")
+        self.checkClass(folder, "folder")
+        if not directory or not os.path.isdir(directory):
+            raise ValueError("The directory '{0}' does not exist.".format(directory))
+        if batchSize < 1 or workers < 1:
+            raise ValueError("The batchSize and workers values have to be greater than 0.")
+
+        scanStart = time.perf_counter()
+        files = scanFiles([directory], recursive, extensions.split(",") if extensions else None, workers)
+        scanTime = time.perf_counter() - scanStart
+        mediapool = self.dvrCall(project, "GetMediaPool")
+        pathIndex = self.getMediaPathIndex(mediapool)
+        paths = [scannedFile.path for scannedFile in files]
+        sequences = []
+        if useSequences:
+            sequences, paths = detectSequences(paths)
+        skipped = []
+        # Each import item is stored with the "File Path" of the clip that it creates
+        importItems = []
+        importFiles = 0
+        for sequence in sequences:
+            for descriptor in sequenceDescriptors(sequence):
+                rangePath = sequenceRangePath(sequence, descriptor["StartIndex"], descriptor["EndIndex"])
+                if normalizeMediaPath(rangePath) in pathIndex:
+                    skipped.append(rangePath)
+                else:
+                    importItems.append((descriptor, rangePath))
+                    importFiles += descriptor["EndIndex"] - descriptor["StartIndex"] + 1
+        # The sequence descriptors and the file paths are imported in different batches
+        sequenceItems = len(importItems)
+        for path in paths:
+            if normalizeMediaPath(path) in pathIndex:
+                skipped.append(path)
+            else:
+                importItems.append((path, path))
+                importFiles += 1
+        batches = [importItems[start:min(start + batchSize, sequenceItems)]
+                   for start in range(0, sequenceItems, batchSize)]
+        batches.extend(importItems[start:start + batchSize]
+                       for start in range(sequenceItems, len(importItems), batchSize))
+
+        clips = []
+        batchLatencies = []
+        failedPaths = []
+        msg = ""
+        importStart = time.perf_counter()
+        previousFolder = self.dvrCall(mediapool, "GetCurrentFolder")
+        try:
+            if not self.dvrCall(mediapool, "SetCurrentFolder", folder):
+                raise RuntimeError("The folder could not be set like the current folder of the media pool.")
+            for batch in batches:
+                batchStart = time.perf_counter()
+                try:
+                    result = self.dvrCall(mediapool, "ImportMedia", [item for item, _ in batch])
+                except Exception as e:
+                    msg += "\n " + str(e)
+                    result = None
+                batchLatencies.append(time.perf_counter() - batchStart)
+                if not result:
+                    failedPaths.extend(path for _, path in batch)
+                    continue
+                clips.extend(result)
+                if len(result) < len(batch):
+                    failedPaths.extend(self._missingPaths(batch, result))
+        finally:
+            if previousFolder is not None:
+                self.dvrCall(mediapool, "SetCurrentFolder", previousFolder)
+            self.invalidateCache(folder)
+        importTime = time.perf_counter() - importStart
+
+        stats = {"files": len(files),
+                 "sequences": len(sequences),
+                 "imported": len(clips),
+                 "skipped": len(skipped),
+                 "failed": len(failedPaths),
+                 "scanSeconds": scanTime,
+                 "importSeconds": importTime,
+                 "filesPerSecond": importFiles / importTime if importTime > 0 else 0.0,
+                 "batchLatencies": batchLatencies}
+        logger.info("{0} clips imported and {1} files or sequences skipped, {2:.1f} files/sec.".format(
+            len(clips), len(skipped), stats["filesPerSecond"]))
+        if failedPaths:
+            raise RuntimeError("{0} files could not be imported: \n {1} {2}".format(
+                len(failedPaths), str(failedPaths[:10]), msg))
+
+        self.getPlug("clips", SDirection.kOut).setValue(clips)
+        self.getPlug("skipped", SDirection.kOut).setValue(skipped)
+        self.getPlug("stats", SDirection.kOut).setValue(stats)
+        super(self.__class__, self).execute()
 
-        @raises ValueError: Raise an error if the value is not a valid index.
 
-        """
-        try:
-            idx = int(value)
-        except Exception as e:
-            raise ValueError("The key value cannot be converted into a valid index as it is not an integer.")
-        if idx > lenght or idx < 0:
-            raise ValueError("{0} index out of range. "
-                             "There are {0} items available.".format(objTypeName, idx))
-        elif idx == 0:
-            logger.warning("The resolve lists for {0} starts at index 1.".format(objTypeName))
-        return idx
+class DVR_MediaRelink(DVR_Base):
+    """Operator to relink the offline clips of the media pool to the files found in the search paths.
+    The search paths, separated by os.pathsep (";" in Windows and ":" in Linux and macOS), are scanned once in
+    parallel, and the files and image sequences are indexed by their name. Each offline clip is matched by the name
+    of its file. When several files have the same name, the ones in a directory with the same name as the original
+    directory of the clip are preferred, and if there is still more than one candidate the clip is returned in the
+    ambiguous output, with its candidate paths and sizes, and it's not relinked. The clips are relinked with one
+    RelinkClips call per target directory.
+    Works in Davinci Resolve.
 
-    def getObjClass(self, objIn):
-        """Gets the class name of the given object.
+    """
 
-        @param objIn obj: An object that should be a Resolve BlackmagicFusion.PyRemoteObject.
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_project = SPlug(
+            code="project",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_folder = SPlug(
+            code="folder",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_searchPaths = SPlug(
+            code="searchPaths",
+            value="",
+            type=SType.kString,
+            direction=SDirection.kIn,
+            parent=self)
+        i_workers = SPlug(
+            code="workers",
+            value=8,
+            type=SType.kInt,
+            direction=SDirection.kIn,
+            parent=self)
+        o_relinked = SPlug(
+            code="relinked",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_ambiguous = SPlug(
+            code="ambiguous",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_missing = SPlug(
+            code="missing",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_stats = SPlug(
+            code="stats",
+            value={},
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
 
-        return str: The name of the class.
+        self.addPlug(i_project)
+        self.addPlug(i_folder)
+        self.addPlug(i_searchPaths)
+        self.addPlug(i_workers)
+        self.addPlug(o_relinked)
+        self.addPlug(o_ambiguous)
+        self.addPlug(o_missing)
+        self.addPlug(o_stats)
 
-        """
-        objInClass = None
-        if objIn is None:
-            return objInClass
-        try:
-            objInClass = objIn.ClassName
-        except:
-            objInClass = None
-        if objInClass is None:
-            try:
-                objInClass = type(objIn).__name__
-            except:
-                objInClass = None
-        return objInClass
+    def _indexMedia(self, searchPaths, workers):
+        """Scans the search paths and indexes the files and the image sequences by their name.
 
-    def checkIndividualClass(self, objIn, objExpected):
-        """Check the given object class individually, not list expected.
+        @param searchPaths list: The directories to scan.
+        @param workers int: The number of threads reading directories.
 
-        @param objIn obj: An object that should be a Resolve BlackmagicFusion.PyRemoteObject instance.
-        @param objExpected str: The name of the class object expected.
+        @return dict: The (directory, size) candidates by normalized file name. The image sequences are indexed by
+            their printf style name, like "shot.%04d.exr", and their size is the number of frames.
 
-        @return bool: True if the class is not the same.
-        @return str: The name of the class of the objIn.
+        """
+        sizes = {}
+        for scannedFile in scanFiles(searchPaths, True, None, workers):
+            sizes[scannedFile.path] = scannedFile.size
+        sequences, paths = detectSequences(list(sizes))
+        index = collections.defaultdict(list)
+        for path in paths:
+            directory, name = os.path.split(path)
+            index[os.path.normcase(name)].append((directory, sizes[path]))
+        for sequence in sequences:
+            name = os.path.basename(sequencePath(sequence))
+            index[os.path.normcase(name)].append((sequence.directory, sequence.frameCount))
+        return index
+
+    def _offlineName(self, filePath):
+        """Checks if the media of a clip is offline and returns the name to search.
+
+        @param filePath str: The "File Path" of the clip.
+
+        @return str: The normalized name of the file or sequence to search, or None if the media is online.
 
         """
-        raiseError = False
-        objClass = self.getObjClass(objIn)
-        if objExpected == "clip" and objClass != "Media pool item":
-            raiseError = True
-        elif objExpected == "item" and objClass != "Timeline item":
-            raiseError = True
-        elif objExpected == "timeline" and objClass != "Timeline":
-            raiseError = True
-        elif objExpected == "project" and objClass != "Project":
-            raiseError = True
-        elif objExpected == "folder" and objClass != "Folder":
-            raiseError = True
-        return raiseError, objClass
+        match = sequenceClipPattern.match(filePath)
+        if match is not None:
+            # The first frame of the sequence, like "/plates/shot.1001.exr"
+            if os.path.exists(match.group(1) + match.group(2) + match.group(4)):
+                return None
+            filePath = sequenceClipPath(filePath)
+        elif os.path.exists(filePath):
+            return None
+        return os.path.normcase(os.path.basename(filePath))
 
-    def checkClass(self, objIn, objExpected, isList=False):
-        """Checks the given object class and raise and error if is not correct.
+    def execute(self, force=False):
+        """Finds the files of the offline clips in the search paths and relinks the clips.
 
-        @param objIn obj: An object that should be a Resolve BlackmagicFusion.PyRemoteObject instance.
-        @param objExpected str: The name of the class object expected.
-        @param isList bool: True if the objIn is a list of objects. False if it's only 1 object. (Default=False)
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
 
         """
-        if not isList:
-            raiseError, objClass = self.checkIndividualClass(objIn, objExpected)
-            if raiseError:
-                raise ValueError("The {0} input is not valid, got {1}".format(objExpected, objClass))
-        else:
-            if not isinstance(objIn, list):
-                raise ValueError("The input has to be a list of {0} instances, "
-                                 "not {1}.".format(objExpected, self.getObjClass(objIn)))
-            for element in objIn:
-                raiseError, objClass = self.checkIndividualClass(element, objExpected)
-                if raiseError:
-                    raise ValueError("One element from the list is not "
-                                     "a {0}, is a {1}".format(objExpected, objClass))
+        self.checkDvr()
+        project = self.getPlug("project", SDirection.kIn).value
+        folder = self.getPlug("folder", SDirection.kIn).value
+        searchPaths = self.getPlug("searchPaths", SDirection.kIn).value
+        workers = self.getPlug("workers", SDirection.kIn).value
+        self.checkClass(project, "project")
+        searchPaths = [path for path in (searchPaths or "").split(os.pathsep) if path]
+        if not searchPaths:
+            raise ValueError("At least one search path is required.")
+        for path in searchPaths:
+            if not os.path.isdir(path):
+                raise ValueError("The search path '{0}' does not exist.".format(path))
+        if workers < 1:
+            raise ValueError("The workers value has to be greater than 0.")
+        mediapool = self.dvrCall(project, "GetMediaPool")
+        if folder is None:
+            folder = self.dvrCall(mediapool, "GetRootFolder")
+        self.checkClass(folder, "folder")
 
+        futures = []
+        for subFolder, _ in self.walkFolders(folder):
+            for clip in self.dvrCall(subFolder, "GetClipList") or []:
+                futures.append((clip, self.dvrSubmit(clip, "GetClipProperty", "File Path")))
+        offlineClips = []
+        for clip, future in futures:
+            filePath = future.result()
+            if filePath:
+                name = self._offlineName(filePath)
+                if name is not None:
+                    offlineClips.append((clip, filePath, name))
+
+        scanStart = time.perf_counter()
+        index = self._indexMedia(searchPaths, workers) if offlineClips else {}
+        scanTime = time.perf_counter() - scanStart
+        clipsByDirectory = collections.defaultdict(list)
+        ambiguous = []
+        missing = []
+        for clip, filePath, name in offlineClips:
+            candidates = index.get(name, [])
+            if len(candidates) > 1:
+                originalDirectory = os.path.normcase(os.path.basename(os.path.dirname(filePath)))
+                sameDirectory = [candidate for candidate in candidates
+                                 if os.path.normcase(os.path.basename(candidate[0])) == originalDirectory]
+                if sameDirectory:
+                    candidates = sameDirectory
+            if not candidates:
+                missing.append(clip)
+            elif len(candidates) > 1:
+                ambiguous.append({"clip": clip, "filePath": filePath,
+                                  "candidates": [{"directory": directory, "size": size}
+                                                 for directory, size in candidates]})
+            else:
+                clipsByDirectory[candidates[0][0]].append(clip)
 
-class DVR_ClipPropertyGet(DVR_Base):
-    """Operator to get properties from a clip.
-    Allows the creation of new plugs. It will pick output plug names like property names
-    to be read from the given clip and will store the obtained value inside them.
-    Custom input plugs will be ignored.
+        relinked = []
+        failedDirectories = []
+        msg = ""
+        for directory, clips in sorted(clipsByDirectory.items()):
+            try:
+                result = self.dvrCall(mediapool, "RelinkClips", clips, directory)
+            except Exception as e:
+                msg += "\n " + str(e)
+                result = False
+            if result:
+                relinked.extend(clips)
+            else:
+                failedDirectories.append(directory)
+        if clipsByDirectory:
+            # The invalidation drops the cached results of all the clips
+            self.invalidateCache(next(iter(clipsByDirectory.values()))[0])
+        if failedDirectories:
+            raise RuntimeError("The clips could not be relinked to the directories '{0}': "
+                               "\n {1}".format(str(failedDirectories), msg))
+
+        logger.info("{0} offline clips: {1} relinked, {2} ambiguous and {3} missing.".format(
+            len(offlineClips), len(relinked), len(ambiguous), len(missing)))
+        self.getPlug("relinked", SDirection.kOut).setValue(relinked)
+        self.getPlug("ambiguous", SDirection.kOut).setValue(ambiguous)
+        self.getPlug("missing", SDirection.kOut).setValue(missing)
+        self.getPlug("stats", SDirection.kOut).setValue({"clips": len(futures),
+                                                        "offline": len(offlineClips),
+                                                        "relinked": len(relinked),
+                                                        "ambiguous": len(ambiguous),
+                                                        "missing": len(missing),
+                                                        "scanSeconds": scanTime,
+                                                        "relinkCalls": len(clipsByDirectory)})
+        super(self.__class__, self).execute()
+
+
+class DVR_MetadataGet(DVR_Base):
+    """Operator to get the metadata of a given clip of the Media Pool.
+    Allows the creation of new plugs. It will pick output plug names like field of the metadata to be read from the given clip and will store the obtained value inside them. Custom input plugs will be ignored.
     Works in Davinci Resolve.
 
     """
@@ -204,680 +3874,1354 @@ class DVR_ClipPropertyGet(DVR_Base):
         self.addPlug(i_clip)
 
     def execute(self, force=False):
-        """Gets the desired properties from the given clip.
+        """Gets the required metadata of the given clip using each custom output plugs like fields to read.
 
         @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
 
         """
         self.checkDvr()
+
         plugsList = [plug for plug in self.getPlugs(SDirection.kOut) if plug.type != SType.kTrigger]
         clip = self.getPlug("clip").value
         self.checkClass(clip, "clip")
+
         if plugsList:
             for p in plugsList:
                 try:
-                    fieldValue = clip.GetClipProperty(p.code)
+                    fieldValue = self.dvrCall(clip, "GetMetadata", p.code)
                     if fieldValue:
                         p.setValue(fieldValue)
                 except Exception as e:
-                    raise ValueError("The property '{0}' could not be read: \n {1}".format(p.code, str(e)))
+                    logger.warning("The metadata of type '{0}' could not be read.".format(p.code))
+
         super(self.__class__, self).execute()
 
 
-class DVR_ClipGet(DVR_Base):
-    """Operator to get a specific Clip from a list of Clips
+class DVR_MetadataSet(DVR_Base):
+    """Operator to edit the metadata of a given clip. You can create custom plugs to set different
+    metadata field in the given clip. The name of each custom plug will be used like the metadata field name,
+    and the value of the plug like the value of the metadata to set fot that field.
     Works in Davinci Resolve.
 
     """
 
     def __init__(self, code, parent):
-        super(self.__class__, self).__init__(code, parent=parent)
-        i_clips = SPlug(
-            code="clips",
+        super(self.__class__, self).__init__(code, editable=True, parent=parent)
+        i_clip = SPlug(
+            code="clip",
             value=None,
             type=SType.kInstance,
             direction=SDirection.kIn,
             parent=self)
-        i_getMethod = SPlug(
-            code="getMethod",
-            value="ByName",
-            type=SType.kEnum,
-            options=["ByName"],
+
+        self.addPlug(i_clip)
+
+    def execute(self, force=False):
+        """Edit the metadata for the given clip using each custom input plugs like fields to edit.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        self.checkDvr()
+
+        plugsList = self.getPlugs(SDirection.kIn)
+        clip = self.getPlug("clip").value
+        self.checkClass(clip, "clip")
+        msg = ""
+        errorPlugs = []
+        if len(plugsList) > 2:
+            for p in plugsList:
+                if not p.type is SType.kTrigger and p.code != "clip":
+                    try:
+                        resAux = self.dvrCall(clip, "SetMetadata", p.code, p.value)
+                    except Exception as e:
+                        msg += "\n " + str(e)
+                        resAux = False
+                    if not resAux:
+                        errorPlugs.append(p.code)
+
+        self.invalidateCache(clip)
+        if errorPlugs:
+            raise RuntimeError("The metadata of the attributes '{0}' "
+                               "could not be set:  \n  {1}".format(str(errorPlugs), msg))
+
+        super(self.__class__, self).execute()
+
+
+class DVR_MetricsFlush(DVR_Base):
+    """Operator to write the execution metrics of the operators, the durations, input sizes and errors by operator
+    class, in a Prometheus text file (like the ones read by the textfile collector of the node exporter) or in a
+    JSON file if the file extension is .json. If no file is given the SHIFT_RESOLVE_METRICS_PATH environment
+    variable is used.
+    This operator doesn't use the Resolve API, so it can be executed outside Davinci Resolve.
+
+    """
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_file = SPlug(
+            code="file",
+            value="",
+            type=SType.kFileOut,
             direction=SDirection.kIn,
             parent=self)
-        i_key = SPlug(
-            code="key",
+        o_metrics = SPlug(
+            code="metrics",
+            value={},
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_file)
+        self.addPlug(o_metrics)
+
+    def execute(self, force=False):
+        """Writes the metrics file and returns the metrics like a dictionary.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        filepath = self.getPlug("file", SDirection.kIn).value
+        self.metrics.flush(filepath or None)
+        self.getPlug("metrics", SDirection.kOut).setValue(self.metrics.toDict())
+        super(self.__class__, self).execute()
+
+
+class DVR_ProjectArchive(DVR_Base):
+    """Operator to archive all the projects from a folder of the Resolve project manager.
+    Each project is exported to a Davinci Resolve Project file (.drp) and packed, one at a time, into a compressed
+    archive inside the archive directory. The content hash of every exported project and the archive holding it are
+    stored in a manifest in the archive directory, so in the next runs the projects without changes are skipped.
+    Only the newest keepArchives archives are kept in the directory, plus the older archives that still hold the
+    latest version of a project.
+    If no folderPath is given the current folder of the project manager will be used. If a folderPath is given, the
+    project manager will stay in that folder after the execution.
+    Works in Davinci Resolve.
+
+    """
+    archivePrefix = "projects_"
+    archiveSuffix = ".tar.gz"
+    manifestName = "project_archive_manifest.json"
+    chunkSize = 1024 * 1024
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+
+        i_folderPath = SPlug(
+            code="folderPath",
             value="",
             type=SType.kString,
             direction=SDirection.kIn,
             parent=self)
-        o_clip = SPlug(
-            code="clip",
+        i_archiveDir = SPlug(
+            code="archiveDir",
+            value="",
+            type=SType.kDir,
+            direction=SDirection.kIn,
+            parent=self)
+        i_keepArchives = SPlug(
+            code="keepArchives",
+            value=7,
+            type=SType.kInt,
+            direction=SDirection.kIn,
+            parent=self)
+        i_withStillsAndLUTs = SPlug(
+            code="withStillsAndLUTs",
+            value=True,
+            type=SType.kBool,
+            direction=SDirection.kIn,
+            parent=self)
+        o_archive = SPlug(
+            code="archive",
+            value="",
+            type=SType.kFileOut,
+            direction=SDirection.kOut,
+            parent=self)
+        o_exported = SPlug(
+            code="exported",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_skipped = SPlug(
+            code="skipped",
             value=None,
             type=SType.kInstance,
             direction=SDirection.kOut,
             parent=self)
 
-        self.addPlug(i_clips)
-        self.addPlug(i_getMethod)
-        self.addPlug(i_key)
-        self.addPlug(o_clip)
+        self.addPlug(i_folderPath)
+        self.addPlug(i_archiveDir)
+        self.addPlug(i_keepArchives)
+        self.addPlug(i_withStillsAndLUTs)
+        self.addPlug(o_archive)
+        self.addPlug(o_exported)
+        self.addPlug(o_skipped)
+
+    def _openProjectFolder(self, folderPath):
+        """Moves the project manager to the given folder path, starting from the root folder.
+
+        @param folderPath str: The path of the folder in the project manager, like "Shows/Episode01".
+
+        """
+        self.dvrCall(projectManager, "GotoRootFolder")
+        for folderName in folderPath.replace("\\", "/").split("/"):
+            if not folderName:
+                continue
+            if not self.dvrCall(projectManager, "OpenFolder", folderName):
+                raise ValueError("The project folder '{0}' could not be found in the path '{1}'.".format(
+                    folderName, folderPath))
+
+    def _hashProjectFile(self, filepath):
+        """Computes a hash of the content of an exported project file.
+        The .drp files are zip files, so when possible only the name and the content of each member are hashed.
+        This way the hash doesn't change due to the timestamps written by the zip format in each export.
+
+        @param filepath str: The path to the .drp file.
+
+        @return str: The hexadecimal digest of the file content.
+
+        """
+        digest = hashlib.sha256()
+        if zipfile.is_zipfile(filepath):
+            with zipfile.ZipFile(filepath) as zipFile:
+                for member in sorted(zipFile.namelist()):
+                    digest.update(member.encode("utf-8"))
+                    with zipFile.open(member) as memberFile:
+                        for chunk in iter(lambda: memberFile.read(self.chunkSize), b""):
+                            digest.update(chunk)
+        else:
+            with open(filepath, "rb") as projectFile:
+                for chunk in iter(lambda: projectFile.read(self.chunkSize), b""):
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+    def _waitExport(self, projectName, exportFuture):
+        """Waits for the export of a project submitted to the API worker and checks the result.
+
+        @param projectName str: The name of the exported project.
+        @param exportFuture concurrent.futures.Future: The future of the ExportProject call.
 
-    def execute(self, force=False):
-        """Gets the desired clip from a list of clips.
+        @raises RuntimeError: Raise an error if the project couldn't be exported.
 
-        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+        """
+        msg = ""
+        try:
+            result = exportFuture.result()
+        except Exception as e:
+            msg = str(e)
+            result = False
+        if not result:
+            raise RuntimeError("The project '{0}' couldn't be exported:  \n  {1}".format(projectName, msg))
+
+    def _readManifest(self, archiveDir):
+        """Reads the manifest with the project entries from the previous run.
+        Entries whose archive is missing from the directory are dropped, so those projects are exported again.
+
+        @param archiveDir str: The directory where the archives are stored.
+
+        @return dict: The {"hash", "archive"} entries by project name. Empty if there is no manifest.
 
         """
-        self.checkDvr()
-        clips = self.getPlug("clips", SDirection.kIn).value
-        getMethod = self.getPlug("getMethod", SDirection.kIn).value
-        clipKey = self.getPlug("key", SDirection.kIn).value
-        targetClip = None
-        # Check list instances
-        self.checkClass(clips, "clip", isList=True)
-        if getMethod == "ByName":
-            for clip in clips:
-                if clip.GetClipProperty("Clip Name") == clipKey:
-                    targetClip = clip
-                    break
-        else:
-            raise ValueError("Get Method '{0}' is not supported. Please choose between: "
-                             "'ByName'.".format(getMethod))
+        manifestPath = os.path.join(archiveDir, self.manifestName)
+        if not os.path.isfile(manifestPath):
+            return {}
+        try:
+            with open(manifestPath, "r") as manifestFile:
+                projects = json.load(manifestFile).get("projects", {})
+        except Exception as e:
+            logger.warning("The archive manifest could not be read, all the projects will be exported: "
+                           "\n {0}".format(str(e)))
+            return {}
+        entries = {}
+        for projectName, entry in projects.items():
+            # Manifests written by older versions only stored the hash, without the archive holding the project
+            if isinstance(entry, dict) and entry.get("archive") and \
+                    os.path.isfile(os.path.join(archiveDir, entry["archive"])):
+                entries[projectName] = entry
+        return entries
+
+    def _writeManifest(self, archiveDir, entries):
+        """Writes the manifest with the project entries. The file is replaced atomically.
+
+        @param archiveDir str: The directory where the archives are stored.
+        @param entries dict: The {"hash", "archive"} entries by project name.
 
-        self.getPlug("clip", SDirection.kOut).setValue(targetClip)
-        super(self.__class__, self).execute()
+        """
+        manifestPath = os.path.join(archiveDir, self.manifestName)
+        with open(manifestPath + ".tmp", "w") as manifestFile:
+            json.dump({"projects": entries}, manifestFile, indent=1, sort_keys=True)
+        os.replace(manifestPath + ".tmp", manifestPath)
 
+    def _newArchiveName(self, archiveDir):
+        """Creates the name of a new archive from the current time. If an archive with the same name already exists,
+        like when the operator runs twice in the same second, a counter is added so it's not overwritten. The names
+        keep their order when they are sorted.
 
-class DVR_ClipsGet(DVR_Base):
-    """Operator to get all the clips from a Resolve folder.
-    Works in Davinci Resolve.
+        @param archiveDir str: The directory where the archives are stored.
 
-    """
+        @return str: The name of the new archive.
 
-    def __init__(self, code, parent):
-        super(self.__class__, self).__init__(code, parent=parent)
-        i_folder = SPlug(
-            code="folder",
-            value=None,
-            type=SType.kInstance,
-            direction=SDirection.kIn,
-            parent=self)
-        o_clips = SPlug(
-            code="clips",
-            value=None,
-            type=SType.kInstance,
-            direction=SDirection.kOut,
-            parent=self)
+        """
+        baseName = "{0}{1}".format(self.archivePrefix, time.strftime("%Y%m%d_%H%M%S"))
+        archiveName = baseName + self.archiveSuffix
+        counter = 0
+        while os.path.exists(os.path.join(archiveDir, archiveName)) or \
+                os.path.exists(os.path.join(archiveDir, archiveName + ".tmp")):
+            counter += 1
+            archiveName = "{0}_{1:03d}{2}".format(baseName, counter, self.archiveSuffix)
+        return archiveName
+
+    def _rotateArchives(self, archiveDir, keepArchives, entries):
+        """Removes the oldest archives of the directory, keeping only the newest ones.
+        The archives referenced by the manifest are never removed, since they hold the only copy of a project.
+
+        @param archiveDir str: The directory where the archives are stored.
+        @param keepArchives int: The number of archives to keep. 0 or less keeps all the archives.
+        @param entries dict: The {"hash", "archive"} entries by project name written in the manifest.
 
-        self.addPlug(i_folder)
-        self.addPlug(o_clips)
+        """
+        if keepArchives <= 0:
+            return
+        referenced = set(entry["archive"] for entry in entries.values())
+        archives = sorted(name for name in os.listdir(archiveDir)
+                          if name.startswith(self.archivePrefix) and name.endswith(self.archiveSuffix))
+        for name in archives[:-keepArchives]:
+            if name in referenced:
+                continue
+            try:
+                os.remove(os.path.join(archiveDir, name))
+            except OSError as e:
+                logger.warning("The archive '{0}' could not be removed: \n {1}".format(name, str(e)))
 
     def execute(self, force=False):
-        """Gets the list of clips from the given folder.
+        """Exports the changed projects of the folder and packs them in a new compressed archive.
 
         @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
 
         """
         self.checkDvr()
-        folder = self.getPlug("folder", SDirection.kIn).value
-        self.checkClass(folder, "folder")
+        folderPath = self.getPlug("folderPath", SDirection.kIn).value
+        archiveDir = self.getPlug("archiveDir", SDirection.kIn).value
+        keepArchives = self.getPlug("keepArchives", SDirection.kIn).value
+        withStillsAndLUTs = self.getPlug("withStillsAndLUTs", SDirection.kIn).value
+        if not archiveDir or not os.path.isdir(archiveDir):
+            raise ValueError("A valid directory is required to store the archives. Got {0}".format(archiveDir))
+        if folderPath:
+            self._openProjectFolder(folderPath)
+        projectNames = self.dvrCall(projectManager, "GetProjectListInCurrentFolder") or []
+
+        previousEntries = self._readManifest(archiveDir)
+        entries = {}
+        exported = []
+        skipped = []
+        archiveName = self._newArchiveName(archiveDir)
+        archivePath = os.path.join(archiveDir, archiveName)
+        tempDir = tempfile.mkdtemp(prefix="dvr_archive_")
+        archive = None
+        pendingExport = None
         try:
-            clips = folder.GetClipList()
-        except Exception as e:
-            raise RuntimeError("The clips couldn't be get from the folder: \n {0}".format(str(e)))
-
-        self.getPlug("clips", SDirection.kOut).setValue(clips)
+            # The export of each project is submitted to the API worker before archiving the previous one,
+            # so Resolve exports the next project while the previous one is hashed and compressed.
+            for idx, projectName in enumerate(projectNames + [None]):
+                nextExport = None
+                if projectName is not None:
+                    filepath = os.path.join(tempDir, "project_{0}.drp".format(idx))
+                    nextExport = (projectName, filepath, self.dvrSubmit(
+                        projectManager, "ExportProject", projectName, filepath, withStillsAndLUTs))
+                if pendingExport is not None:
+                    previousName, previousPath, exportFuture = pendingExport
+                    pendingExport = None
+                    self._waitExport(previousName, exportFuture)
+                    projectHash = self._hashProjectFile(previousPath)
+                    previousEntry = previousEntries.get(previousName)
+                    if previousEntry is not None and previousEntry.get("hash") == projectHash:
+                        # The project is kept in the archive that already holds this version
+                        entries[previousName] = previousEntry
+                        skipped.append(previousName)
+                    else:
+                        entries[previousName] = {"hash": projectHash, "archive": archiveName}
+                        if archive is None:
+                            # The archive is only created once we know that at least one project has changes
+                            archive = tarfile.open(archivePath + ".tmp", "w:gz")
+                        archive.add(previousPath, arcname="{0}.drp".format(previousName))
+                        exported.append(previousName)
+                    os.remove(previousPath)
+                pendingExport = nextExport
+            if archive is not None:
+                archive.close()
+                archive = None
+                os.replace(archivePath + ".tmp", archivePath)
+            else:
+                archivePath = ""
+        finally:
+            if pendingExport is not None:
+                # Wait for the export in progress before removing its directory
+                concurrentWait([pendingExport[2]])
+            if archive is not None:
+                archive.close()
+                os.remove(archivePath + ".tmp")
+            shutil.rmtree(tempDir, ignore_errors=True)
+
+        self._writeManifest(archiveDir, entries)
+        self._rotateArchives(archiveDir, keepArchives, entries)
+        logger.info("{0} projects archived, {1} projects without changes.".format(len(exported), len(skipped)))
+        self.getPlug("archive", SDirection.kOut).setValue(archivePath)
+        self.getPlug("exported", SDirection.kOut).setValue(exported)
+        self.getPlug("skipped", SDirection.kOut).setValue(skipped)
         super(self.__class__, self).execute()
 
 
-class DVR_FolderAdd(DVR_Base):
-    """Operator to create a folder inside other folder with the given name in Resolve.
+class DVR_ProjectExport(DVR_Base):
+    """Operator to get export a given Resolve project in a Davinci Resolve Project file (.drp).
     Works in Davinci Resolve.
 
     """
 
     def __init__(self, code, parent):
         super(self.__class__, self).__init__(code, parent=parent)
+
         i_project = SPlug(
             code="project",
             value=None,
             type=SType.kInstance,
             direction=SDirection.kIn,
             parent=self)
-        i_folder = SPlug(
-            code="folder",
-            value=None,
-            type=SType.kInstance,
-            direction=SDirection.kIn,
-            parent=self)
-        i_name = SPlug(
-            code="name",
+        i_filepath = SPlug(
+            code="filepath",
             value="",
-            type=SType.kString,
+            type=SType.kFileOut,
             direction=SDirection.kIn,
             parent=self)
-        o_folder = SPlug(
-            code="folder",
-            value=None,
-            type=SType.kInstance,
+        o_filepath = SPlug(
+            code="filepath",
+            value="",
+            type=SType.kFileOut,
             direction=SDirection.kOut,
             parent=self)
 
         self.addPlug(i_project)
-        self.addPlug(i_folder)
-        self.addPlug(i_name)
-        self.addPlug(o_folder)
+        self.addPlug(i_filepath)
+        self.addPlug(o_filepath)
 
     def execute(self, force=False):
-        """Add a new subFolder in the given folder with the given name.
+        """Exports a given Resolve project in the Resolve project files format.
 
         @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
 
         """
         self.checkDvr()
-        currentFolder = self.getPlug("folder", SDirection.kIn).value
-        folderName = self.getPlug("name", SDirection.kIn).value
         project = self.getPlug("project", SDirection.kIn).value
-        self.checkClass(currentFolder, "folder")
+        filepath = self.getPlug("filepath", SDirection.kIn).value
         self.checkClass(project, "project")
+        if not filepath or not filepath.endswith(".drp"):
+            raise ValueError("A filepath for a .drp file is required to export the project.")
+        msg = ""
         try:
-            folder = project.GetMediaPool().AddSubFolder(currentFolder, folderName)
+            result = self.dvrCall(projectManager, "ExportProject", self.dvrCall(project, "GetName"), filepath)
         except Exception as e:
-            raise RuntimeError("The folder couldn't be created: \n {0}".format(str(e)))
-
-        self.getPlug("folder", SDirection.kOut).setValue(folder)
+            msg = str(e)
+            result = False
+        if not result:
+            raise RuntimeError("The project couldn't be exported:  \n  {0}".format(msg))
+        self.getPlug("filepath", SDirection.kOut).setValue(filepath)
         super(self.__class__, self).execute()
 
 
-class DVR_FolderGet(DVR_Base):
-    """Operator to get a Folder from the media pool of the project.
-    Select the getMethod to return the current active folder, the root folder or a specific folder
-    by a full path to the folder.
+class DVR_ProjectGet(DVR_Base):
+    """Operator to get the current Resolve project object.
     Works in Davinci Resolve.
 
     """
 
     def __init__(self, code, parent):
         super(self.__class__, self).__init__(code, parent=parent)
-        i_project = SPlug(
+
+        o_project = SPlug(
             code="project",
             value=None,
             type=SType.kInstance,
-            direction=SDirection.kIn,
-            parent=self)
-        i_getMethod = SPlug(
-            code="getMethod",
-            value="Current",
-            type=SType.kEnum,
-            options=["Current", "Root", "FullPath"],
-            direction=SDirection.kIn,
-            parent=self)
-        i_folderPath = SPlug(
-            code="folderPath",
-            value="",
-            type=SType.kString,
-            direction=SDirection.kIn,
-            parent=self)
-        i_createFolders = SPlug(
-            code="createFolders",
-            value=False,
-            type=SType.kBool,
-            direction=SDirection.kIn,
-            parent=self)
-        o_folder = SPlug(
-            code="folder",
-            value=None,
-            type=SType.kInstance,
             direction=SDirection.kOut,
             parent=self)
 
-        self.addPlug(i_project)
-        self.addPlug(i_getMethod)
-        self.addPlug(i_folderPath)
-        self.addPlug(i_createFolders)
-        self.addPlug(o_folder)
-
-    def _recursiveFolderResearch(self, currentFolder, currentPath, targetPath, mediapool, createFolders=False):
-        """Recursive function to find a folder object based in the full path of the folder.
-        The Resolve API doesn't allow to get a folder by name or full path, only allows to get the
-        root, current and subfolders. Because of this, this function is a utility to research over a given folder and subfolders
-        to be able to return a folder given a full path from the root folder.
-
-        @param currentFolder Resolve.Folder: The current folder to check the subFolders from.
-        @param currentPath str: The current status of the path that is being research.
-        @param targetPath str: The target result of the path. The full folder path to get.
-        @param mediapool Resolve.MediaPool: The media pool object from the Resolve API.
-        @param createFolders bool: If it's true, any not found folder, will be created. (Default=False)
-
-        @returns Resolve.Folder: The Folder that match the targetPath.
-
-        """
-        subFolders = currentFolder.GetSubFolderList()
-        for subFolder in subFolders:
-            subFolderName = subFolder.GetName()
-            pathCheck = currentPath + "{0}/".format(subFolderName)
-            if pathCheck == targetPath:
-                return subFolder  # Here we end the recursion
-            elif targetPath.startswith(pathCheck):
-                # The folder is correct, but we still need another recursion level at least
-                return self._recursiveFolderResearch(subFolder, pathCheck, targetPath, mediapool, createFolders=createFolders)
-        if createFolders:
-            newFolderName = targetPath.replace(currentPath, "").partition("/")[0]
-            subFolder = mediapool.AddSubFolder(currentFolder, newFolderName)
-            subFolderName = subFolder.GetName()
-            pathCheck = currentPath + "{0}/".format(subFolderName)
-            if pathCheck == targetPath:
-                return subFolder  # Here we end the recursion
-            elif targetPath.startswith(pathCheck):
-                # The folder is correct, but we still need another recursion level at least
-                return self._recursiveFolderResearch(subFolder, pathCheck, targetPath, mediapool,
-                                                     createFolders=createFolders)
-        return  # If we go to this return means that the folder haven't been found.
+        self.addPlug(o_project)
 
     def execute(self, force=False):
-        """Gets the requested folder object from the media pool.
+        """Returns the current project from Davinci Resolve.
 
         @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
 
         """
         self.checkDvr()
-        project = self.getPlug("project").value
-        getMethod = self.getPlug("getMethod").value
-        folderPath = self.getPlug("folderPath").value
-        createFolders = self.getPlug("createFolders").value
-        self.checkClass(project, "project")
-        mediapool = project.GetMediaPool()
-        if getMethod == "Current":
-            folder = mediapool.GetCurrentFolder()
-        elif getMethod == "Root":
-            folder = mediapool.GetRootFolder()
-        elif getMethod == "FullPath":
-            if not folderPath:
-                raise ValueError("A folder path is required to use the FullPath get method.")
-            folderPath = folderPath.replace("\\", "/")
-            inputFolderPath = folderPath if folderPath.endswith("/") else folderPath + "/"
-            try:
-                folder = self._recursiveFolderResearch(
-                    mediapool.GetRootFolder(), "", inputFolderPath, mediapool, createFolders=createFolders)
-            except Exception as e:
-                raise RuntimeError("The folder couldn't be found using the FullPath get method. "
-                                   "Check that the Folder path is correct: \n {0}".format(str(e)))
-        else:
-            raise ValueError("Get Method '{0}' is not supported. Please choose between: "
-                             "'Current', 'Root', 'FullPath'.".format(getMethod))
-
-
-        self.getPlug("folder", SDirection.kOut).setValue(folder)
+        project = self.dvrCall(projectManager, "GetCurrentProject")
+        self.getPlug("project", SDirection.kOut).setValue(project)
         super(self.__class__, self).execute()
 
 
-class DVR_FolderList(DVR_Base):
-    """Operator to get the list of folders within the given folder.
-    It can return only the folders directly under the input folder or make a recursive research to return all
-    subfolders from the given folder activating the recursiveSearch flag.
+class DVR_ProjectOpen(DVR_Base):
+    """Operator to open a project with the provided name.
     Works in Davinci Resolve.
+
     """
 
     def __init__(self, code, parent):
         super(self.__class__, self).__init__(code, parent=parent)
-        i_folder = SPlug(
-            code="folder",
-            value=None,
-            type=SType.kInstance,
-            direction=SDirection.kIn,
-            parent=self)
-        i_recursiveSearch = SPlug(
-            code="recursiveSearch",
-            value=False,
-            type=SType.kBool,
+
+        i_projectName = SPlug(
+            code="projectName",
+            value="",
+            type=SType.kString,
             direction=SDirection.kIn,
             parent=self)
-        o_folders = SPlug(
-            code="folders",
+        o_project = SPlug(
+            code="project",
             value=None,
             type=SType.kInstance,
             direction=SDirection.kOut,
             parent=self)
 
-        self.addPlug(i_folder)
-        self.addPlug(i_recursiveSearch)
-        self.addPlug(o_folders)
+        self.addPlug(i_projectName)
+        self.addPlug(o_project)
 
-    def getFoldersRecursive(self, folder, folders):
-        """Recursive function that returns the full list of subfolders for a specific folder.
-        @param folder Resolve.Folder: The folder to get all the subfolders from.
-        @param folders list: The list of subfolders already found.
-        @return list: The list of subfolders updated.
-        """
-        subFolders = folder.GetSubFolderList()
-        for subFolder in subFolders:
-            folders.append(subFolder)
-            folders = self.getFoldersRecursive(subFolder, folders)
-        return folders
+    def execute(self, force=False):
+        """Tries to load a project with the given name in Davinci Resolve. If the loading fails, it raises an error.
 
-    def execute(self, force=False):
-        """Gets the list of subfolders from the given folder.
         @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
         """
         self.checkDvr()
-        folder = self.getPlug("folder").value
-        recursiveSearch = self.getPlug("recursiveSearch").value
-
-        # Check inputs
-        self.checkClass(folder, "folder")
-
-        if recursiveSearch:
-            folders = self.getFoldersRecursive(folder, [])
-        else:
-            folders = folder.GetSubFolderList()
-
-        self.getPlug("folders", SDirection.kOut).setValue(folders)
+        projectName = self.getPlug("projectName", SDirection.kIn).value
+        project = self.dvrCall(projectManager, "LoadProject", projectName)
+        self.invalidateCache()
+        if not project:
+            raise RuntimeError("The project could not be opened. Please, check if a project "
+                               "named {0} exists in the current project folder in Resolve.".format(projectName))
+        self.getPlug("project", SDirection.kOut).setValue(project)
         super(self.__class__, self).execute()
 
 
-class DVR_FolderNameGet(DVR_Base):
-    """Operator to get the name of a given folder.
+class DVR_ProjectSnapshot(DVR_Base):
+    """Operator to write a snapshot of the media pool and the timelines of a project in a SQLite database file.
+    The snapshot stores the folders, the clips with all their properties and metadata, the timelines and the
+    timeline items, so the project data can be queried without going through the Resolve API.
+    If the database file already exists and the incremental flag is active, only the rows that have changed
+    since the last snapshot are rewritten. If the incremental flag is not active the database is rebuilt.
     Works in Davinci Resolve.
 
     """
+    schema = [
+        "CREATE TABLE IF NOT EXISTS snapshot (key TEXT PRIMARY KEY, value TEXT)",
+        "CREATE TABLE IF NOT EXISTS folders (id TEXT PRIMARY KEY, parentId TEXT, name TEXT, path TEXT)",
+        "CREATE TABLE IF NOT EXISTS clips (id TEXT PRIMARY KEY, folderId TEXT, name TEXT, filePath TEXT, "
+        "rowHash TEXT)",
+        "CREATE TABLE IF NOT EXISTS clip_properties (clipId TEXT, key TEXT, value TEXT, PRIMARY KEY (clipId, key))",
+        "CREATE TABLE IF NOT EXISTS clip_metadata (clipId TEXT, key TEXT, value TEXT, PRIMARY KEY (clipId, key))",
+        "CREATE TABLE IF NOT EXISTS timelines (id TEXT PRIMARY KEY, name TEXT, idx INTEGER, startFrame INTEGER, "
+        "endFrame INTEGER, rowHash TEXT)",
+        "CREATE TABLE IF NOT EXISTS timeline_items (timelineId TEXT, trackType TEXT, trackIndex INTEGER, "
+        "itemIndex INTEGER, id TEXT, name TEXT, clipId TEXT, start INTEGER, end INTEGER, "
+        "PRIMARY KEY (timelineId, trackType, trackIndex, itemIndex))",
+        "CREATE INDEX IF NOT EXISTS idx_folders_path ON folders (path)",
+        "CREATE INDEX IF NOT EXISTS idx_clips_folder ON clips (folderId)",
+        "CREATE INDEX IF NOT EXISTS idx_clips_filePath ON clips (filePath)",
+        "CREATE INDEX IF NOT EXISTS idx_clip_properties_key ON clip_properties (key, value)",
+        "CREATE INDEX IF NOT EXISTS idx_clip_metadata_key ON clip_metadata (key, value)",
+        "CREATE INDEX IF NOT EXISTS idx_timelines_name ON timelines (name)",
+        "CREATE INDEX IF NOT EXISTS idx_timeline_items_clip ON timeline_items (clipId)",
+    ]
+    trackTypes = ["video", "audio", "subtitle"]
+    itemMethods = ["GetUniqueId", "GetName", "GetMediaPoolItem", "GetStart", "GetEnd"]
 
     def __init__(self, code, parent):
         super(self.__class__, self).__init__(code, parent=parent)
-        i_folder = SPlug(
-            code="folder",
+        i_project = SPlug(
+            code="project",
             value=None,
             type=SType.kInstance,
             direction=SDirection.kIn,
             parent=self)
-        o_name = SPlug(
-            code="name",
+        i_snapshotPath = SPlug(
+            code="snapshotPath",
             value="",
-            type=SType.kString,
+            type=SType.kFileOut,
+            direction=SDirection.kIn,
+            parent=self)
+        i_incremental = SPlug(
+            code="incremental",
+            value=True,
+            type=SType.kBool,
+            direction=SDirection.kIn,
+            parent=self)
+        i_includeTimelines = SPlug(
+            code="includeTimelines",
+            value=True,
+            type=SType.kBool,
+            direction=SDirection.kIn,
+            parent=self)
+        o_snapshotPath = SPlug(
+            code="snapshotPath",
+            value="",
+            type=SType.kFileOut,
             direction=SDirection.kOut,
             parent=self)
 
-        self.addPlug(i_folder)
-        self.addPlug(o_name)
+        self.addPlug(i_project)
+        self.addPlug(i_snapshotPath)
+        self.addPlug(i_incremental)
+        self.addPlug(i_includeTimelines)
+        self.addPlug(o_snapshotPath)
+
+    def _rowHash(self, values):
+        """Computes a hash of the given values, used to find the rows that changed since the last snapshot.
+
+        @param values list: JSON serializable values.
+
+        @return str: The hexadecimal digest of the values.
+
+        """
+        return hashlib.sha1(json.dumps(values, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def _snapshotClips(self, connection, mediapool):
+        """Writes the folders, the clips, the clip properties and the clip metadata of the media pool.
+        Each clip is read with one call for all its properties and one call for all its metadata.
+        The clips are only rewritten when their hash is different from the one stored in the database.
+
+        @param connection sqlite3.Connection: The connection to the snapshot database.
+        @param mediapool Resolve.MediaPool: The media pool of the project.
+
+        @return int: The number of clips written.
+
+        """
+        storedHashes = dict(connection.execute("SELECT id, rowHash FROM clips"))
+        folderRows = []
+        clipRows = []
+        propertyRows = []
+        metadataRows = []
+        changedIds = []
+        seenIds = set()
+        rootFolder = self.dvrCall(mediapool, "GetRootFolder")
+        # The parents are tracked by unique id, since the sibling folders can share the same name and path
+        parentIds = {}
+        for folder, folderPath in self.walkFolders(rootFolder):
+            folderId = self.dvrCall(folder, "GetUniqueId")
+            for subFolder in self.dvrCall(folder, "GetSubFolderList") or []:
+                parentIds[self.dvrCall(subFolder, "GetUniqueId")] = folderId
+            folderRows.append((folderId, parentIds.get(folderId), self.dvrCall(folder, "GetName"), folderPath))
+            # All the calls for the clips of the folder are submitted at once, and the results are hashed
+            # while the API worker is still reading the next clips.
+            clipCalls = [(self.dvrSubmit(clip, "GetUniqueId"), self.dvrSubmit(clip, "GetClipProperty"),
+                          self.dvrSubmit(clip, "GetMetadata"))
+                         for clip in self.dvrCall(folder, "GetClipList") or []]
+            for idFuture, propertiesFuture, metadataFuture in clipCalls:
+                clipId = idFuture.result()
+                properties = propertiesFuture.result() or {}
+                metadata = metadataFuture.result() or {}
+                seenIds.add(clipId)
+                rowHash = self._rowHash([folderId, properties, metadata])
+                if storedHashes.get(clipId) == rowHash:
+                    continue
+                changedIds.append((clipId,))
+                clipRows.append((clipId, folderId, properties.get("Clip Name", ""),
+                                 properties.get("File Path", ""), rowHash))
+                propertyRows.extend((clipId, key, str(value)) for key, value in properties.items())
+                metadataRows.extend((clipId, key, str(value)) for key, value in metadata.items())
+
+        removedIds = [(clipId,) for clipId in storedHashes if clipId not in seenIds]
+        with connection:
+            connection.execute("DELETE FROM folders")
+            connection.executemany("INSERT INTO folders VALUES (?, ?, ?, ?)", folderRows)
+            for table, column in (("clips", "id"), ("clip_properties", "clipId"), ("clip_metadata", "clipId")):
+                connection.executemany("DELETE FROM {0} WHERE {1} = ?".format(table, column), removedIds)
+                connection.executemany("DELETE FROM {0} WHERE {1} = ?".format(table, column), changedIds)
+            connection.executemany("INSERT INTO clips VALUES (?, ?, ?, ?, ?)", clipRows)
+            connection.executemany("INSERT INTO clip_properties VALUES (?, ?, ?)", propertyRows)
+            connection.executemany("INSERT INTO clip_metadata VALUES (?, ?, ?)", metadataRows)
+        return len(clipRows)
+
+    def _snapshotTimelines(self, connection, project):
+        """Writes the timelines and their items. The items of a timeline are only rewritten when the hash of
+        the timeline items is different from the one stored in the database.
+
+        @param connection sqlite3.Connection: The connection to the snapshot database.
+        @param project Resolve.Project: The project to read the timelines from.
+
+        @return int: The number of timelines written.
+
+        """
+        storedHashes = dict(connection.execute("SELECT id, rowHash FROM timelines"))
+        timelineRows = []
+        itemRows = []
+        changedIds = []
+        seenIds = set()
+        for timelineIdx in range(1, self.dvrCall(project, "GetTimelineCount") + 1):
+            timeline = self.dvrCall(project, "GetTimelineByIndex", timelineIdx)
+            timelineId = self.dvrCall(timeline, "GetUniqueId")
+            seenIds.add(timelineId)
+            timelineItemRows = []
+            for trackType in self.trackTypes:
+                for trackIdx in range(1, self.dvrCall(timeline, "GetTrackCount", trackType) + 1):
+                    items = self.dvrCall(timeline, "GetItemListInTrack", trackType, trackIdx) or []
+                    itemCalls = [[self.dvrSubmit(item, method) for method in self.itemMethods] for item in items]
+                    for itemIdx, itemFutures in enumerate(itemCalls, 1):
+                        itemId, itemName, clip, start, end = [future.result() for future in itemFutures]
+                        timelineItemRows.append((
+                            timelineId, trackType, trackIdx, itemIdx, itemId, itemName,
+                            self.dvrCall(clip, "GetUniqueId") if clip else None, start, end))
+            timelineRow = [timelineId, self.dvrCall(timeline, "GetName"), timelineIdx,
+                           self.dvrCall(timeline, "GetStartFrame"), self.dvrCall(timeline, "GetEndFrame")]
+            rowHash = self._rowHash([timelineRow, timelineItemRows])
+            if storedHashes.get(timelineId) == rowHash:
+                continue
+            changedIds.append((timelineId,))
+            timelineRows.append(tuple(timelineRow + [rowHash]))
+            itemRows.extend(timelineItemRows)
+
+        removedIds = [(timelineId,) for timelineId in storedHashes if timelineId not in seenIds]
+        with connection:
+            for table, column in (("timelines", "id"), ("timeline_items", "timelineId")):
+                connection.executemany("DELETE FROM {0} WHERE {1} = ?".format(table, column), removedIds)
+                connection.executemany("DELETE FROM {0} WHERE {1} = ?".format(table, column), changedIds)
+            connection.executemany("INSERT INTO timelines VALUES (?, ?, ?, ?, ?, ?)", timelineRows)
+            connection.executemany("INSERT INTO timeline_items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", itemRows)
+        return len(timelineRows)
 
     def execute(self, force=False):
-        """Gets the name of the given folder object.
+        """Writes the snapshot of the given project in the database file.
 
         @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
 
         """
         self.checkDvr()
-        folder = self.getPlug("folder").value
-        self.checkClass(folder, "folder")
-        folderName = folder.GetName()
-        self.getPlug("name", SDirection.kOut).setValue(folderName)
+        project = self.getPlug("project", SDirection.kIn).value
+        snapshotPath = self.getPlug("snapshotPath", SDirection.kIn).value
+        incremental = self.getPlug("incremental", SDirection.kIn).value
+        includeTimelines = self.getPlug("includeTimelines", SDirection.kIn).value
+        self.checkClass(project, "project")
+        if not snapshotPath:
+            raise ValueError("A filepath is required to write the project snapshot.")
+        if not incremental and os.path.isfile(snapshotPath):
+            os.remove(snapshotPath)
+        connection = sqlite3.connect(snapshotPath)
+        try:
+            with connection:
+                for statement in self.schema:
+                    connection.execute(statement)
+                connection.executemany("INSERT OR REPLACE INTO snapshot VALUES (?, ?)", [
+                    ("project", self.dvrCall(project, "GetName")), ("time", time.strftime("%Y-%m-%d %H:%M:%S"))])
+            clipCount = self._snapshotClips(connection, self.dvrCall(project, "GetMediaPool"))
+            timelineCount = self._snapshotTimelines(connection, project) if includeTimelines else 0
+        except Exception as e:
+            raise RuntimeError("The project snapshot could not be written: \n {0}".format(str(e)))
+        finally:
+            connection.close()
+        logger.info("Project snapshot written: {0} clips and {1} timelines updated.".format(clipCount, timelineCount))
+        self.getPlug("snapshotPath", SDirection.kOut).setValue(snapshotPath)
         super(self.__class__, self).execute()
 
 
-class DVR_FolderSet(DVR_Base):
-    """Operator to set the current active folder in the media pool of the project.
+class DVR_ProxyLink(DVR_Base):
+    """Operator to link the proxy media of a directory tree to the given clips, like the ones of DVR_ClipsGet.
+    The proxy directory is scanned and indexed once. The clips are matched by the stem of their file name or by
+    their reel name, according to matchBy. When several proxies have the same name, the one whose parent
+    directories have the most names in common with the parent directories of the clip file is used, and if there
+    is a tie the clip is not linked. The proxies linked in each execution are recorded in the stateFile, so the
+    next executions skip the clips already linked to the same proxy.
     Works in Davinci Resolve.
 
     """
 
     def __init__(self, code, parent):
         super(self.__class__, self).__init__(code, parent=parent)
-        i_project = SPlug(
-            code="project",
-            value=None,
+        i_clips = SPlug(
+            code="clips",
+            value=[],
             type=SType.kInstance,
             direction=SDirection.kIn,
             parent=self)
-        i_folder = SPlug(
-            code="folder",
-            value=None,
-            type=SType.kInstance,
+        i_proxyDirectory = SPlug(
+            code="proxyDirectory",
+            value="",
+            type=SType.kDir,
+            direction=SDirection.kIn,
+            parent=self)
+        i_matchBy = SPlug(
+            code="matchBy",
+            value="Stem",
+            type=SType.kEnum,
+            options=["Stem", "Reel"],
+            direction=SDirection.kIn,
+            parent=self)
+        i_extensions = SPlug(
+            code="extensions",
+            value="mov,mp4,mxf",
+            type=SType.kString,
+            direction=SDirection.kIn,
+            parent=self)
+        i_stateFile = SPlug(
+            code="stateFile",
+            value="",
+            type=SType.kFileOut,
             direction=SDirection.kIn,
             parent=self)
+        o_linked = SPlug(
+            code="linked",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_unmatched = SPlug(
+            code="unmatched",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_stats = SPlug(
+            code="stats",
+            value={},
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
 
-        self.addPlug(i_project)
-        self.addPlug(i_folder)
+        self.addPlug(i_clips)
+        self.addPlug(i_proxyDirectory)
+        self.addPlug(i_matchBy)
+        self.addPlug(i_extensions)
+        self.addPlug(i_stateFile)
+        self.addPlug(o_linked)
+        self.addPlug(o_unmatched)
+        self.addPlug(o_stats)
+
+    def _readState(self, stateFile):
+        """Reads the proxies linked in the previous executions.
+
+        @param stateFile str: The path of the state file.
+
+        @return dict: The proxy paths by clip unique id. Empty if there is no state.
+
+        """
+        if not stateFile or not os.path.isfile(stateFile):
+            return {}
+        try:
+            with open(stateFile, "r") as proxyStateFile:
+                return json.load(proxyStateFile).get("clips", {})
+        except Exception as e:
+            logger.warning("The proxy state could not be read, all the clips will be linked: \n {0}".format(str(e)))
+            return {}
+
+    def _writeState(self, stateFile, linkedProxies):
+        """Writes the proxies linked to each clip. The file is replaced atomically.
+
+        @param stateFile str: The path of the state file.
+        @param linkedProxies dict: The proxy paths by clip unique id.
+
+        """
+        with open(stateFile + ".tmp", "w") as proxyStateFile:
+            json.dump({"clips": linkedProxies}, proxyStateFile, indent=1, sort_keys=True)
+        os.replace(stateFile + ".tmp", stateFile)
+
+    def _bestProxy(self, candidates, filePath):
+        """Chooses the proxy whose parent directories match best the parent directories of the clip file.
+
+        @param candidates list: The proxy paths with the same name.
+        @param filePath str: The "File Path" of the clip.
+
+        @return str: The chosen proxy path, or None if there is a tie.
+
+        """
+        if len(candidates) == 1:
+            return candidates[0]
+        clipDirectories = os.path.normcase(os.path.dirname(filePath)).replace("\\", "/").split("/")[::-1]
+        scores = []
+        for candidate in candidates:
+            proxyDirectories = os.path.normcase(os.path.dirname(candidate)).replace("\\", "/").split("/")[::-1]
+            score = 0
+            for clipDirectory, proxyDirectory in zip(clipDirectories, proxyDirectories):
+                if clipDirectory != proxyDirectory:
+                    break
+                score += 1
+            scores.append((score, candidate))
+        scores.sort(reverse=True)
+        if scores[0][0] == scores[1][0]:
+            return None
+        return scores[0][1]
 
     def execute(self, force=False):
-        """Sets the current active folder in the media pool of the project.
+        """Matches the proxies of the directory with the clips and links them.
 
         @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
 
         """
         self.checkDvr()
-        folder = self.getPlug("folder", SDirection.kIn).value
-        project = self.getPlug("project", SDirection.kIn).value
+        clips = self.getPlug("clips", SDirection.kIn).value
+        proxyDirectory = self.getPlug("proxyDirectory", SDirection.kIn).value
+        matchBy = self.getPlug("matchBy", SDirection.kIn).value
+        extensions = self.getPlug("extensions", SDirection.kIn).value
+        stateFile = self.getPlug("stateFile", SDirection.kIn).value
+        self.checkClass(clips, "clip", isList=True)
+        if not proxyDirectory or not os.path.isdir(proxyDirectory):
+            raise ValueError("The proxy directory '{0}' does not exist.".format(proxyDirectory))
+
+        index = collections.defaultdict(list)
+        for scannedFile in scanFiles([proxyDirectory], True, extensions.split(",") if extensions else None):
+            stem = os.path.splitext(os.path.basename(scannedFile.path))[0]
+            index[os.path.normcase(stem)].append(scannedFile.path)
+
+        futures = [(clip, self.dvrSubmit(clip, "GetUniqueId"), self.dvrSubmit(clip, "GetClipProperty"))
+                   for clip in clips]
+        linkedProxies = self._readState(stateFile)
+        linkFutures = []
+        unmatched = []
+        skipped = 0
+        for clip, idFuture, propertiesFuture in futures:
+            clipId = idFuture.result()
+            properties = propertiesFuture.result() or {}
+            filePath = properties.get("File Path", "")
+            if matchBy == "Reel":
+                key = properties.get("Reel Name", "")
+            else:
+                key = os.path.splitext(os.path.basename(filePath))[0]
+            candidates = index.get(os.path.normcase(key)) if key else None
+            proxy = self._bestProxy(candidates, filePath) if candidates else None
+            if proxy is None:
+                unmatched.append(clip)
+            elif linkedProxies.get(clipId) == proxy:
+                skipped += 1
+            else:
+                linkFutures.append((clip, clipId, proxy, self.dvrSubmit(clip, "LinkProxyMedia", proxy)))
 
-        self.checkClass(folder, "folder")
-        self.checkClass(project, "project")
+        linked = []
+        failedClips = []
         msg = ""
-        try:
-            result = project.GetMediaPool().SetCurrentFolder(folder)
-        except Exception as e:
-            msg = str(e)
-            result = False
-        if not result:
-            raise RuntimeError("The folder couldn't be set as active: {0}".format(msg))
-
+        for clip, clipId, proxy, future in linkFutures:
+            try:
+                result = future.result()
+            except Exception as e:
+                msg += "\n " + str(e)
+                result = False
+            if result:
+                linked.append(clip)
+                linkedProxies[clipId] = proxy
+            else:
+                failedClips.append(proxy)
+        if linkFutures:
+            # The invalidation drops the cached results of all the clips
+            self.invalidateCache(linkFutures[0][0])
+        if stateFile:
+            self._writeState(stateFile, linkedProxies)
+        if failedClips:
+            raise RuntimeError("The proxies '{0}' could not be linked: \n {1}".format(str(failedClips), msg))
+
+        self.getPlug("linked", SDirection.kOut).setValue(linked)
+        self.getPlug("unmatched", SDirection.kOut).setValue(unmatched)
+        self.getPlug("stats", SDirection.kOut).setValue({"clips": len(clips),
+                                                        "linked": len(linked),
+                                                        "alreadyLinked": skipped,
+                                                        "unmatched": len(unmatched)})
         super(self.__class__, self).execute()
 
 
-class DVR_MetadataGet(DVR_Base):
-    """Operator to get the metadata of a given clip of the Media Pool.
-    Allows the creation of new plugs. It will pick output plug names like field of the metadata to be read from the given clip and will store the obtained value inside them. Custom input plugs will be ignored.
+class DVR_RenderJobAdd(DVR_Base):
+    """Operator to add a render job to the render queue for each timeline of a list.
+    If a preset is given it's loaded once before adding the jobs. Each job renders into the targetDir with the
+    name created with the customName template, where {name} is the name of the timeline and {index} its position
+    in the list. The current timeline of the project is restored after adding the jobs.
     Works in Davinci Resolve.
 
     """
 
     def __init__(self, code, parent):
-        super(self.__class__, self).__init__(code, editable=True, parent=parent)
-        i_clip = SPlug(
-            code="clip",
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_project = SPlug(
+            code="project",
             value=None,
             type=SType.kInstance,
             direction=SDirection.kIn,
             parent=self)
+        i_timelines = SPlug(
+            code="timelines",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_preset = SPlug(
+            code="preset",
+            value="",
+            type=SType.kString,
+            direction=SDirection.kIn,
+            parent=self)
+        i_targetDir = SPlug(
+            code="targetDir",
+            value="",
+            type=SType.kDir,
+            direction=SDirection.kIn,
+            parent=self)
+        i_customName = SPlug(
+            code="customName",
+            value="{name}",
+            type=SType.kString,
+            direction=SDirection.kIn,
+            parent=self)
+        o_jobIds = SPlug(
+            code="jobIds",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
 
-        self.addPlug(i_clip)
+        self.addPlug(i_project)
+        self.addPlug(i_timelines)
+        self.addPlug(i_preset)
+        self.addPlug(i_targetDir)
+        self.addPlug(i_customName)
+        self.addPlug(o_jobIds)
 
     def execute(self, force=False):
-        """Gets the required metadata of the given clip using each custom output plugs like fields to read.
+        """Adds a render job for each timeline.
 
         @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
 
         """
         self.checkDvr()
-
-        plugsList = [plug for plug in self.getPlugs(SDirection.kOut) if plug.type != SType.kTrigger]
-        clip = self.getPlug("clip").value
-        self.checkClass(clip, "clip")
-
-        if plugsList:
-            for p in plugsList:
-                try:
-                    fieldValue = clip.GetMetadata(p.code)
-                    if fieldValue:
-                        p.setValue(fieldValue)
-                except Exception as e:
-                    logger.warning("The metadata of type '{0}' could not be read.".format(p.code))
-
+        project = self.getPlug("project", SDirection.kIn).value
+        timelines = self.getPlug("timelines", SDirection.kIn).value
+        preset = self.getPlug("preset", SDirection.kIn).value
+        targetDir = self.getPlug("targetDir", SDirection.kIn).value
+        customName = self.getPlug("customName", SDirection.kIn).value
+        self.checkClass(project, "project")
+        self.checkClass(timelines, "timeline", isList=True)
+        if targetDir and not os.path.isdir(targetDir):
+            raise ValueError("The target directory '{0}' does not exist.".format(targetDir))
+        if preset and not self.dvrCall(project, "LoadRenderPreset", preset):
+            raise ValueError("The render preset '{0}' could not be loaded.".format(preset))
+
+        jobIds = []
+        previousTimeline = self.dvrCall(project, "GetCurrentTimeline")
+        try:
+            for index, timeline in enumerate(timelines, 1):
+                name = self.dvrCall(timeline, "GetName")
+                settings = {}
+                if targetDir:
+                    settings["TargetDir"] = targetDir
+                if customName:
+                    try:
+                        settings["CustomName"] = customName.format(name=name, index=index)
+                    except (KeyError, IndexError, ValueError) as e:
+                        raise ValueError("The customName template '{0}' is not valid: \n {1}".format(
+                            customName, str(e)))
+                if not self.dvrCall(project, "SetCurrentTimeline", timeline):
+                    raise RuntimeError("The timeline '{0}' could not be set like the current timeline.".format(name))
+                if settings and not self.dvrCall(project, "SetRenderSettings", settings):
+                    raise RuntimeError("The render settings {0} could not be set for the timeline "
+                                       "'{1}'.".format(settings, name))
+                jobId = self.dvrCall(project, "AddRenderJob")
+                if not jobId:
+                    raise RuntimeError("The render job for the timeline '{0}' could not be added.".format(name))
+                jobIds.append(jobId)
+        finally:
+            if previousTimeline:
+                self.dvrCall(project, "SetCurrentTimeline", previousTimeline)
+            self.invalidateCache(project)
+
+        self.getPlug("jobIds", SDirection.kOut).setValue(jobIds)
         super(self.__class__, self).execute()
 
 
-class DVR_MetadataSet(DVR_Base):
-    """Operator to edit the metadata of a given clip. You can create custom plugs to set different
-    metadata field in the given clip. The name of each custom plug will be used like the metadata field name,
-    and the value of the plug like the value of the metadata to set fot that field.
+class DVR_RenderStart(DVR_Base):
+    """Operator to start rendering the given render jobs, or all the jobs of the render queue if the list is
+    empty. It returns without waiting for the render, use DVR_RenderWait to wait for the jobs.
     Works in Davinci Resolve.
 
     """
 
     def __init__(self, code, parent):
-        super(self.__class__, self).__init__(code, editable=True, parent=parent)
-        i_clip = SPlug(
-            code="clip",
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_project = SPlug(
+            code="project",
             value=None,
             type=SType.kInstance,
             direction=SDirection.kIn,
             parent=self)
+        i_jobIds = SPlug(
+            code="jobIds",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_interactive = SPlug(
+            code="interactive",
+            value=False,
+            type=SType.kBool,
+            direction=SDirection.kIn,
+            parent=self)
+        o_jobIds = SPlug(
+            code="jobIds",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
 
-        self.addPlug(i_clip)
+        self.addPlug(i_project)
+        self.addPlug(i_jobIds)
+        self.addPlug(i_interactive)
+        self.addPlug(o_jobIds)
 
     def execute(self, force=False):
-        """Edit the metadata for the given clip using each custom input plugs like fields to edit.
+        """Starts the render of the jobs.
 
         @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
 
         """
         self.checkDvr()
-
-        plugsList = self.getPlugs(SDirection.kIn)
-        clip = self.getPlug("clip").value
-        self.checkClass(clip, "clip")
+        project = self.getPlug("project", SDirection.kIn).value
+        jobIds = self.getPlug("jobIds", SDirection.kIn).value
+        interactive = self.getPlug("interactive", SDirection.kIn).value
+        self.checkClass(project, "project")
+        if not jobIds:
+            jobIds = [job["JobId"] for job in self.dvrCall(project, "GetRenderJobList") or []]
+        if not jobIds:
+            raise ValueError("There are no render jobs to start.")
         msg = ""
-        errorPlugs = []
-        if len(plugsList) > 2:
-            for p in plugsList:
-                if not p.type is SType.kTrigger and p.code != "clip":
-                    try:
-                        resAux = clip.SetMetadata(p.code, p.value)
-                    except Exception as e:
-                        msg += "\n " + str(e)
-                        resAux = False
-                    if not resAux:
-                        errorPlugs.append(p.code)
-
-        if errorPlugs:
-            raise RuntimeError("The metadata of the attributes '{0}' "
-                               "could not be set:  \n  {1}".format(str(errorPlugs), msg))
+        try:
+            result = self.dvrCall(project, "StartRendering", list(jobIds), bool(interactive))
+        except Exception as e:
+            msg = str(e)
+            result = False
+        if not result:
+            raise RuntimeError("The render could not be started: \n {0}".format(msg))
 
+        self.getPlug("jobIds", SDirection.kOut).setValue(list(jobIds))
         super(self.__class__, self).execute()
 
 
-class DVR_ProjectExport(DVR_Base):
-    """Operator to get export a given Resolve project in a Davinci Resolve Project file (.drp).
+class DVR_RenderWait(DVR_Base):
+    """Operator to wait until the given render jobs, or all the jobs of the render queue, are finished.
+    The status of the jobs is polled with an adaptive interval: it starts at minInterval milliseconds, it's
+    doubled after each poll without progress up to maxInterval milliseconds, and it goes back to minInterval when
+    the progress changes. If the jobs are not finished after timeout seconds (0 means no limit), the render is stopped if
+    stopOnTimeout is enabled and an error is raised. An error is also raised if Resolve is not rendering anymore while
+    some of the jobs are not finished, like jobs that were never started and stay Ready.
+    The jobs output has a dictionary for each job with its id, timeline name, status, progress percentage,
+    render duration in seconds, number of frames and frames per second.
     Works in Davinci Resolve.
 
     """
+    finishedStatus = ("Complete", "Failed", "Cancelled")
 
     def __init__(self, code, parent):
         super(self.__class__, self).__init__(code, parent=parent)
-
         i_project = SPlug(
             code="project",
             value=None,
             type=SType.kInstance,
             direction=SDirection.kIn,
             parent=self)
-        i_filepath = SPlug(
-            code="filepath",
-            value="",
-            type=SType.kFileOut,
+        i_jobIds = SPlug(
+            code="jobIds",
+            value=[],
+            type=SType.kInstance,
             direction=SDirection.kIn,
             parent=self)
-        o_filepath = SPlug(
-            code="filepath",
-            value="",
-            type=SType.kFileOut,
+        i_timeout = SPlug(
+            code="timeout",
+            value=0,
+            type=SType.kInt,
+            direction=SDirection.kIn,
+            parent=self)
+        i_minInterval = SPlug(
+            code="minInterval",
+            value=500,
+            type=SType.kInt,
+            direction=SDirection.kIn,
+            parent=self)
+        i_maxInterval = SPlug(
+            code="maxInterval",
+            value=10000,
+            type=SType.kInt,
+            direction=SDirection.kIn,
+            parent=self)
+        i_stopOnTimeout = SPlug(
+            code="stopOnTimeout",
+            value=True,
+            type=SType.kBool,
+            direction=SDirection.kIn,
+            parent=self)
+        o_jobs = SPlug(
+            code="jobs",
+            value=[],
+            type=SType.kInstance,
             direction=SDirection.kOut,
             parent=self)
 
         self.addPlug(i_project)
-        self.addPlug(i_filepath)
-        self.addPlug(o_filepath)
+        self.addPlug(i_jobIds)
+        self.addPlug(i_timeout)
+        self.addPlug(i_minInterval)
+        self.addPlug(i_maxInterval)
+        self.addPlug(i_stopOnTimeout)
+        self.addPlug(o_jobs)
+
+    def _jobMetrics(self, job, status):
+        """Creates the metrics of a render job.
+
+        @param job dict: The job from GetRenderJobList.
+        @param status dict: The status of the job from GetRenderJobStatus.
+
+        @return dict: The metrics of the job.
+
+        """
+        try:
+            frames = int(job.get("MarkOut", 0)) - int(job.get("MarkIn", 0)) + 1
+        except (TypeError, ValueError):
+            frames = 0
+        seconds = (status.get("TimeTakenToRenderInMs") or 0) / 1000.0
+        progress = status.get("CompletionPercentage") or 0
+        renderedFrames = frames * progress / 100.0
+        return {"jobId": job.get("JobId"),
+                "timeline": job.get("TimelineName", ""),
+                "status": status.get("JobStatus", ""),
+                "progress": progress,
+                "seconds": seconds,
+                "frames": frames,
+                "fps": renderedFrames / seconds if seconds > 0 else 0.0}
 
     def execute(self, force=False):
-        """Exports a given Resolve project in the Resolve project files format.
+        """Polls the status of the jobs until all of them are finished or the timeout is reached.
 
         @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
 
         """
         self.checkDvr()
         project = self.getPlug("project", SDirection.kIn).value
-        filepath = self.getPlug("filepath", SDirection.kIn).value
+        jobIds = self.getPlug("jobIds", SDirection.kIn).value
+        timeout = self.getPlug("timeout", SDirection.kIn).value
+        stopOnTimeout = self.getPlug("stopOnTimeout", SDirection.kIn).value
         self.checkClass(project, "project")
-        if not filepath or not filepath.endswith(".drp"):
-            raise ValueError("A filepath for a .drp file is required to export the project.")
-        msg = ""
-        try:
-            result = projectManager.ExportProject(project.GetName(), filepath)
-        except Exception as e:
-            msg = str(e)
-            result = False
-        if not result:
-            raise RuntimeError("The project couldn't be exported:  \n  {0}".format(msg))
-        self.getPlug("filepath", SDirection.kOut).setValue(filepath)
+        minInterval = self.getPlug("minInterval", SDirection.kIn).value / 1000.0
+        maxInterval = self.getPlug("maxInterval", SDirection.kIn).value / 1000.0
+        if minInterval <= 0 or maxInterval < minInterval:
+            raise ValueError("The minInterval has to be greater than 0 and lower than the maxInterval.")
+        jobsById = {job["JobId"]: job for job in self.dvrCall(project, "GetRenderJobList") or []}
+        if not jobIds:
+            jobIds = list(jobsById)
+        missingIds = [jobId for jobId in jobIds if jobId not in jobsById]
+        if missingIds:
+            raise ValueError("The render jobs {0} are not in the render queue.".format(missingIds))
+
+        deadline = time.time() + timeout if timeout and timeout > 0 else None
+        interval = minInterval
+        statuses = {}
+        lastProgress = None
+        while True:
+            # Checked before the statuses so a render that ends between both calls is seen as finished.
+            rendering = self.dvrCall(project, "IsRenderingInProgress")
+            futures = [(jobId, self.dvrSubmit(project, "GetRenderJobStatus", jobId)) for jobId in jobIds]
+            statuses = {jobId: future.result() or {} for jobId, future in futures}
+            if all(status.get("JobStatus") in self.finishedStatus for status in statuses.values()):
+                break
+            if not rendering:
+                raise RuntimeError("Resolve is not rendering but the render jobs are not finished: \n {0}".format(
+                    [self._jobMetrics(jobsById[jobId], statuses[jobId]) for jobId in jobIds]))
+            progress = sum(status.get("CompletionPercentage") or 0 for status in statuses.values())
+            if progress != lastProgress:
+                interval = minInterval
+                lastProgress = progress
+            else:
+                interval = min(interval * 2, maxInterval)
+            sleep = interval
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    if stopOnTimeout:
+                        self.dvrCall(project, "StopRendering")
+                    raise RuntimeError("The render jobs were not finished after {0} seconds: \n {1}".format(
+                        timeout, [self._jobMetrics(jobsById[jobId], statuses[jobId]) for jobId in jobIds]))
+                # The last sleep ends at the deadline so the jobs are polled once more before giving up.
+                sleep = min(interval, remaining)
+            time.sleep(sleep)
+
+        jobs = [self._jobMetrics(jobsById[jobId], statuses[jobId]) for jobId in jobIds]
+        for job in jobs:
+            logger.info("Render job {0} ({1}): {2}, {3} frames in {4:.1f}s, {5:.1f} fps.".format(
+                job["jobId"], job["timeline"], job["status"], job["frames"], job["seconds"], job["fps"]))
+        failedJobs = [job for job in jobs if job["status"] != "Complete"]
+        if failedJobs:
+            raise RuntimeError("The render jobs were not completed: \n {0}".format(failedJobs))
+
+        self.getPlug("jobs", SDirection.kOut).setValue(jobs)
         super(self.__class__, self).execute()
 
 
-class DVR_ProjectGet(DVR_Base):
-    """Operator to get the current Resolve project object.
+class DVR_SessionEnd(DVR_Base):
+    """Operator to end the execution session started with DVR_SessionStart.
+    The hit rates of the session cache are logged and returned in the stats output.
     Works in Davinci Resolve.
 
     """
 
     def __init__(self, code, parent):
         super(self.__class__, self).__init__(code, parent=parent)
-
-        o_project = SPlug(
-            code="project",
+        o_stats = SPlug(
+            code="stats",
             value=None,
             type=SType.kInstance,
             direction=SDirection.kOut,
             parent=self)
 
-        self.addPlug(o_project)
+        self.addPlug(o_stats)
 
     def execute(self, force=False):
-        """Returns the current project from Davinci Resolve.
+        """Ends the execution session and reports the cache statistics.
 
         @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
 
         """
-        self.checkDvr()
-        project = projectManager.GetCurrentProject()
-        self.getPlug("project", SDirection.kOut).setValue(project)
+        callCache = DVR_Base.callCache
+        stats = {}
+        if callCache is None:
+            logger.warning("There is no execution session to end.")
+        else:
+            DVR_Base.callCache = None
+            stats = callCache.stats()
+            for method, methodStats in sorted(stats.items()):
+                logger.info("Session cache {0}: {1} hits, {2} misses ({3:.1%}).".format(
+                    method, methodStats["hits"], methodStats["misses"], methodStats["hitRate"]))
+        self.getPlug("stats", SDirection.kOut).setValue(stats)
         super(self.__class__, self).execute()
 
 
-class DVR_ProjectOpen(DVR_Base):
-    """Operator to open a project with the provided name.
+class DVR_SessionStart(DVR_Base):
+    """Operator to start an execution session. While the session is active, the results of the read-only
+    Resolve API getters used by the operators of the catalog, like GetName or GetSubFolderList, are cached by
+    object. The operators that modify Resolve objects drop the cached results of the objects they modify.
+    The cache keeps up to maxEntries results, discarding the least recently used ones.
+    Use it only while the project is not modified outside the workflow, and end the session with DVR_SessionEnd.
     Works in Davinci Resolve.
 
     """
 
     def __init__(self, code, parent):
         super(self.__class__, self).__init__(code, parent=parent)
-
-        i_projectName = SPlug(
-            code="projectName",
-            value="",
-            type=SType.kString,
+        i_maxEntries = SPlug(
+            code="maxEntries",
+            value=10000,
+            type=SType.kInt,
             direction=SDirection.kIn,
             parent=self)
-        o_project = SPlug(
-            code="project",
-            value=None,
-            type=SType.kInstance,
-            direction=SDirection.kOut,
-            parent=self)
 
-        self.addPlug(i_projectName)
-        self.addPlug(o_project)
+        self.addPlug(i_maxEntries)
 
     def execute(self, force=False):
-        """Tries to load a project with the given name in Davinci Resolve. If the loading fails, it raises an error.
+        """Starts a new execution session, replacing the active one if any.
 
         @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
 
         """
-        self.checkDvr()
-        projectName = self.getPlug("projectName", SDirection.kIn).value
-        project = projectManager.LoadProject(projectName)
-        if not project:
-            raise RuntimeError("The project could not be opened. Please, check if a project "
-                               "named {0} exists in the current project folder in Resolve.".format(projectName))
-        self.getPlug("project", SDirection.kOut).setValue(project)
+        maxEntries = self.getPlug("maxEntries", SDirection.kIn).value
+        if maxEntries < 1:
+            raise ValueError("The session cache needs at least 1 entry. Got {0}".format(maxEntries))
+        if DVR_Base.callCache is not None:
+            logger.warning("An execution session was already active. Its cache will be discarded.")
+        DVR_Base.callCache = DvrCallCache(maxEntries)
         super(self.__class__, self).execute()
 
 
@@ -886,6 +5230,8 @@ class DVR_TakeAdd(DVR_Base):
     The clip input will be added to the take selector of the item input.
     If you don't specify any start and end frame, or the frame are the same,
     the frame range will be ignored and the take will be added with the full range.
+    The range can be given with the startTimecode and endTimecode inputs too, in the fps frame rate. The
+    timecodes are source timecodes of the clip, so they are converted to frames relative to its "Start TC".
     Works in Davinci Resolve.
 
     """
@@ -917,11 +5263,33 @@ class DVR_TakeAdd(DVR_Base):
             type=SType.kInt,
             direction=SDirection.kIn,
             parent=self)
+        i_startTimecode = SPlug(
+            code="startTimecode",
+            value="",
+            type=SType.kString,
+            direction=SDirection.kIn,
+            parent=self)
+        i_endTimecode = SPlug(
+            code="endTimecode",
+            value="",
+            type=SType.kString,
+            direction=SDirection.kIn,
+            parent=self)
+        i_fps = SPlug(
+            code="fps",
+            value="24",
+            type=SType.kEnum,
+            options=timecodeRates,
+            direction=SDirection.kIn,
+            parent=self)
 
         self.addPlug(i_item)
         self.addPlug(i_clip)
         self.addPlug(i_startFrame)
         self.addPlug(i_endFrame)
+        self.addPlug(i_startTimecode)
+        self.addPlug(i_endTimecode)
+        self.addPlug(i_fps)
 
     def execute(self, force=False):
         """Adds a given clip to a given item like a take.
@@ -934,20 +5302,30 @@ class DVR_TakeAdd(DVR_Base):
         clip = self.getPlug("clip", SDirection.kIn).value
         startFrame = self.getPlug("startFrame", SDirection.kIn).value
         endFrame = self.getPlug("endFrame", SDirection.kIn).value
+        startTimecode = self.getPlug("startTimecode", SDirection.kIn).value
+        endTimecode = self.getPlug("endTimecode", SDirection.kIn).value
+        fps = self.getPlug("fps", SDirection.kIn).value
         # Check input values
         self.checkClass(item, "item")
         self.checkClass(clip, "clip")
+        if startTimecode or endTimecode:
+            clipStart = timecodeToFrames(self.dvrCall(clip, "GetClipProperty", "Start TC") or "00:00:00:00", fps)
+            if startTimecode:
+                startFrame = timecodeToFrames(startTimecode, fps) - clipStart
+            if endTimecode:
+                endFrame = timecodeToFrames(endTimecode, fps) - clipStart
         if startFrame > endFrame:
             raise ValueError("The given frame range is not valid: {0}-{1}".format(startFrame, endFrame))
         msg = "No error provided"
         try:
             if startFrame == endFrame:  # We use the equal condition like flag to ignore the frame range.
-                result = item.AddTake(clip)
+                result = self.dvrCall(item, "AddTake", clip)
             else:
-                result = item.AddTake(clip, startFrame, endFrame)
+                result = self.dvrCall(item, "AddTake", clip, startFrame, endFrame)
         except Exception as e:
             result = False
             msg = str(e)
+        self.invalidateCache(item)
         if not result:
             raise RuntimeError("The take could not be added: {0}".format(msg))
         super(self.__class__, self).execute()
@@ -1019,13 +5397,13 @@ class DVR_TakeGet(DVR_Base):
 
         if getMethod == "ByName":
             take = None
-            for idx in range(1, item.GetTakesCount() + 1):
-                takeAux = item.GetTakeByIndex(idx)
+            for idx in range(1, self.dvrCall(item, "GetTakesCount") + 1):
+                takeAux = self.dvrCall(item, "GetTakeByIndex", idx)
                 clipAux = takeAux.get("mediaPoolItem")
                 if not clipAux:
                     logger.warning("The take with index {0} doesn't have a mediaPoolItem associated.".format(idx))
                     continue
-                if clipAux.GetClipProperty("Clip Name") == takeKey:
+                if self.dvrCall(clipAux, "GetClipProperty", "Clip Name") == takeKey:
                     take = [idx, clipAux]
                     break
             if take is None:
@@ -1033,17 +5411,17 @@ class DVR_TakeGet(DVR_Base):
                 logger.debug("Take with a clip name '{0}' not found.".format(takeKey))
         elif getMethod == "ByIndex":
             # Index sanity checks
-            takeIdx = self.getDrvIdx(takeKey, "Take", item.GetTakesCount())
+            takeIdx = self.getDrvIdx(takeKey, "Take", self.dvrCall(item, "GetTakesCount"))
             # Get the take for the given index
             try:
-                takeClip = item.GetTakeByIndex(takeIdx).get("mediaPoolItem")
+                takeClip = self.dvrCall(item, "GetTakeByIndex", takeIdx).get("mediaPoolItem")
             except Exception as e:
                 raise RuntimeError("The take at index {0} could not be get.".format(takeIdx))
             take = [takeIdx, takeClip]
         elif getMethod == "Current":
             try:
-                takeIdx = item.GetSelectedTakeIndex()
-                takeClip = item.GetTakeByIndex(takeIdx).get("mediaPoolItem")
+                takeIdx = self.dvrCall(item, "GetSelectedTakeIndex")
+                takeClip = self.dvrCall(item, "GetTakeByIndex", takeIdx).get("mediaPoolItem")
             except Exception as e:
                 raise RuntimeError("The current take could not be get.")
             take = [takeIdx, takeClip]
@@ -1098,19 +5476,20 @@ class DVR_TakeSet(DVR_Base):
         takeIndex = self.getPlug("index", SDirection.kIn).value
         # Check input values
         self.checkClass(item, "item")
-        takeMax = item.GetTakesCount()
+        takeMax = self.dvrCall(item, "GetTakesCount")
         if takeIndex < 1 or takeIndex > takeMax:
             raise ValueError("Index out of range. The item have only {0} takes.".format(takeMax))
         # Set the take for the given index
         msg = "No error provided."
         try:
-            result = item.SelectTakeByIndex(takeIndex)
+            result = self.dvrCall(item, "SelectTakeByIndex", takeIndex)
         except Exception as e:
             msg = str(e)
             result = False
+        self.invalidateCache(item)
         if not result:
             raise RuntimeError("The take with index {0} could not be set: {1}".format(takeIndex, msg))
-        clip = item.GetTakeByIndex(takeIndex).get("mediaPoolItem")
+        clip = self.dvrCall(item, "GetTakeByIndex", takeIndex).get("mediaPoolItem")
         self.getPlug("clip", SDirection.kOut).setValue(clip)
         super(self.__class__, self).execute()
 
@@ -1131,26 +5510,522 @@ class DVR_ProjectImport(DVR_Base):
             direction=SDirection.kIn,
             parent=self)
 
-        self.addPlug(i_filepath)
+        self.addPlug(i_filepath)
+
+    def execute(self, force=False):
+        """Imports a given project in Davinci Resolve.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        self.checkDvr()
+        filepath = self.getPlug("filepath", SDirection.kIn).value
+        if not filepath or not filepath.endswith(".drp"):
+            raise ValueError("The filepath to the project have to be a .drp format.")
+        msg = ""
+        try:
+            result = self.dvrCall(projectManager, "ImportProject", filepath)
+        except Exception as e:
+            msg = str(e)
+            result = False
+        self.invalidateCache()
+        if not result:
+            raise RuntimeError("The project couldn't be imported: {0}".format(msg))
+        super(self.__class__, self).execute()
+
+
+class DVR_TimelineCreate(DVR_Base):
+    """Operator to create a timeline with the given name and append a list of clips to it, like a stringout.
+    Each element of the clips list can be a clip, or a dictionary with the clip and the optional
+    "startFrame", "endFrame", "trackIndex", "recordFrame" and "mediaType" (1 for video only, 2 for audio only)
+    values of the Resolve AppendToTimeline clip info. Instead of the clip, the dictionary can have the "id" of
+    the clip, like the clip records of a project snapshot, and its "folderPath" to find it faster.
+    The clips are appended with one AppendToTimeline call for each batchSize clips. If any batch can't be
+    appended, or only some of its clips are appended, the half built timeline is deleted before raising the error.
+    Works in Davinci Resolve.
+
+    """
+    clipInfoKeys = ["startFrame", "endFrame", "trackIndex", "recordFrame", "mediaType"]
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_project = SPlug(
+            code="project",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_name = SPlug(
+            code="name",
+            value="",
+            type=SType.kString,
+            direction=SDirection.kIn,
+            parent=self)
+        i_clips = SPlug(
+            code="clips",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_batchSize = SPlug(
+            code="batchSize",
+            value=500,
+            type=SType.kInt,
+            direction=SDirection.kIn,
+            parent=self)
+        o_timeline = SPlug(
+            code="timeline",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_items = SPlug(
+            code="items",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_project)
+        self.addPlug(i_name)
+        self.addPlug(i_clips)
+        self.addPlug(i_batchSize)
+        self.addPlug(o_timeline)
+        self.addPlug(o_items)
+
+    def _buildClipInfos(self, mediapool, clips):
+        """Converts the clips input to the clip info dictionaries of AppendToTimeline.
+        The clips given by id are searched in the media pool with a single walk.
+
+        @param mediapool Resolve.MediaPool: The media pool of the project.
+        @param clips list: The clips or clip dictionaries.
+
+        @return list: The clip info dictionaries.
+
+        @raises ValueError: Raise an error if an element is not valid or a clip id is not found.
+
+        """
+        clipIds = set()
+        folderPaths = set()
+        for element in clips:
+            if isinstance(element, dict) and element.get("clip") is None:
+                if not element.get("id"):
+                    raise ValueError("The clip dictionaries require a clip or a clip id. Got {0}".format(element))
+                clipIds.add(element["id"])
+                folderPaths.add(element.get("folderPath"))
+        clipsById = {}
+        if clipIds:
+            clipsById = self.getClipsById(mediapool, clipIds, None if None in folderPaths else folderPaths)
+            missingIds = clipIds - set(clipsById)
+            if missingIds:
+                raise ValueError("The clips with ids {0} were not found in the media pool.".format(
+                    sorted(missingIds)))
+
+        clipInfos = []
+        for element in clips:
+            if isinstance(element, dict):
+                clip = element.get("clip")
+                if clip is None:
+                    clip = clipsById[element["id"]]
+                clipInfo = {key: element[key] for key in self.clipInfoKeys if element.get(key) is not None}
+            else:
+                clip = element
+                clipInfo = {}
+            self.checkClass(clip, "clip")
+            clipInfo["mediaPoolItem"] = clip
+            clipInfos.append(clipInfo)
+        return clipInfos
+
+    def _deleteTimeline(self, mediapool, project, timeline, name):
+        """Deletes a timeline that could not be completed, logging a warning if it can't be deleted.
+
+        @param mediapool Resolve.MediaPool: The media pool of the project.
+        @param project Resolve.Project: The project of the timeline.
+        @param timeline Resolve.Timeline: The timeline to delete.
+        @param name str: The name of the timeline.
+
+        """
+        msg = ""
+        try:
+            result = self.dvrCall(mediapool, "DeleteTimelines", [timeline])
+        except Exception as e:
+            msg = str(e)
+            result = False
+        if not result:
+            logger.warning("The incomplete timeline '{0}' could not be deleted: \n {1}".format(name, msg))
+        self.invalidateCache(project)
+        self.invalidateCache(self.dvrCall(mediapool, "GetCurrentFolder"))
+
+    def execute(self, force=False):
+        """Creates the timeline and appends the clips to it in batches.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        self.checkDvr()
+        project = self.getPlug("project", SDirection.kIn).value
+        name = self.getPlug("name", SDirection.kIn).value
+        clips = self.getPlug("clips", SDirection.kIn).value
+        batchSize = self.getPlug("batchSize", SDirection.kIn).value
+        self.checkClass(project, "project")
+        if not name:
+            raise ValueError("A name is required to create the timeline.")
+        if not isinstance(clips, list):
+            raise ValueError("The clips input has to be a list of clips or clip dictionaries.")
+        if batchSize < 1:
+            raise ValueError("The batchSize value has to be greater than 0.")
+        mediapool = self.dvrCall(project, "GetMediaPool")
+        clipInfos = self._buildClipInfos(mediapool, clips)
+
+        msg = ""
+        try:
+            timeline = self.dvrCall(mediapool, "CreateEmptyTimeline", name)
+        except Exception as e:
+            msg = str(e)
+            timeline = None
+        if not timeline:
+            raise RuntimeError("The timeline '{0}' could not be created. Check that there is no other timeline "
+                               "with the same name: \n {1}".format(name, msg))
+        # The timeline is also added like a clip to the current folder of the media pool
+        self.invalidateCache(project)
+        self.invalidateCache(self.dvrCall(mediapool, "GetCurrentFolder"))
+        self.dvrCall(project, "SetCurrentTimeline", timeline)
+
+        items = []
+        for start in range(0, len(clipInfos), batchSize):
+            batch = clipInfos[start:start + batchSize]
+            try:
+                result = self.dvrCall(mediapool, "AppendToTimeline", batch)
+            except Exception as e:
+                msg = str(e)
+                result = None
+            if result and len(result) < len(batch):
+                msg = "Only {0} of the {1} clips were appended.".format(len(result), len(batch))
+                result = None
+            if not result:
+                self._deleteTimeline(mediapool, project, timeline, name)
+                raise RuntimeError("The clips {0} to {1} could not be appended to the timeline: \n {2}".format(
+                    start + 1, start + len(batch), msg))
+            items.extend(result)
+        self.invalidateCache(timeline)
+
+        self.getPlug("timeline", SDirection.kOut).setValue(timeline)
+        self.getPlug("items", SDirection.kOut).setValue(items)
+        super(self.__class__, self).execute()
+
+
+class DVR_TimelineDiff(DVR_Base):
+    """Operator to compare two exported timeline files (EDL, FCP7 XML, FCPXML, CSV or Tabbed Text), like the ones
+    created by DVR_TimelineExport, and get the changes from the old timeline to the new one.
+    The events are matched by source clip and source range:
+    moved: Events with the same clip and source range but a different record position or track.
+    trimmed: Events of the same clip with a different source range that overlaps the old one.
+    added and removed: Events without a match in the other timeline.
+    The moved and trimmed outputs are lists of (oldEvent, newEvent) pairs.
+    This operator doesn't use the Resolve API, so it can be executed outside Davinci Resolve.
+
+    """
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_oldFilepath = SPlug(
+            code="oldFilepath",
+            value="",
+            type=SType.kFileIn,
+            direction=SDirection.kIn,
+            parent=self)
+        i_newFilepath = SPlug(
+            code="newFilepath",
+            value="",
+            type=SType.kFileIn,
+            direction=SDirection.kIn,
+            parent=self)
+        i_fps = SPlug(
+            code="fps",
+            value="24",
+            type=SType.kEnum,
+            options=timecodeRates,
+            direction=SDirection.kIn,
+            parent=self)
+        o_added = SPlug(
+            code="added",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_removed = SPlug(
+            code="removed",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_moved = SPlug(
+            code="moved",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_trimmed = SPlug(
+            code="trimmed",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_unchanged = SPlug(
+            code="unchanged",
+            value=0,
+            type=SType.kInt,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_oldFilepath)
+        self.addPlug(i_newFilepath)
+        self.addPlug(i_fps)
+        self.addPlug(o_added)
+        self.addPlug(o_removed)
+        self.addPlug(o_moved)
+        self.addPlug(o_trimmed)
+        self.addPlug(o_unchanged)
+
+    def _matchExact(self, oldEvents, newEvents):
+        """Matches the events with the same clip and source range.
+        The events sharing the same key are paired in record order.
+
+        @param oldEvents list: The TimelineEvent records of the old timeline.
+        @param newEvents list: The TimelineEvent records of the new timeline.
+
+        @return list: The (oldEvent, newEvent) matched pairs.
+        @return list: The old events without a match.
+        @return list: The new events without a match.
+
+        """
+        oldByKey = collections.defaultdict(list)
+        for event in sorted(oldEvents, key=lambda e: (e.recIn, e.track), reverse=True):
+            oldByKey[(event.clip, event.srcIn, event.srcOut)].append(event)
+        pairs = []
+        newPending = []
+        for event in sorted(newEvents, key=lambda e: (e.recIn, e.track)):
+            candidates = oldByKey.get((event.clip, event.srcIn, event.srcOut))
+            if candidates:
+                pairs.append((candidates.pop(), event))
+            else:
+                newPending.append(event)
+        oldPending = [event for candidates in oldByKey.values() for event in candidates]
+        return pairs, oldPending, newPending
+
+    def _matchOverlaps(self, oldEvents, newEvents):
+        """Matches the events of the same clip with overlapping source ranges.
+        The events of each clip are sorted by source in and paired walking both lists at the same time.
+
+        @param oldEvents list: The TimelineEvent records of the old timeline.
+        @param newEvents list: The TimelineEvent records of the new timeline.
+
+        @return list: The (oldEvent, newEvent) matched pairs.
+        @return list: The old events without a match.
+        @return list: The new events without a match.
+
+        """
+        oldByClip = collections.defaultdict(list)
+        newByClip = collections.defaultdict(list)
+        for event in oldEvents:
+            oldByClip[event.clip].append(event)
+        for event in newEvents:
+            newByClip[event.clip].append(event)
+        pairs = []
+        oldPending = []
+        newPending = []
+        for clip, oldClipEvents in oldByClip.items():
+            newClipEvents = newByClip.pop(clip, [])
+            oldClipEvents.sort(key=lambda e: (e.srcIn, e.srcOut))
+            newClipEvents.sort(key=lambda e: (e.srcIn, e.srcOut))
+            oldIdx = newIdx = 0
+            while oldIdx < len(oldClipEvents) and newIdx < len(newClipEvents):
+                oldEvent = oldClipEvents[oldIdx]
+                newEvent = newClipEvents[newIdx]
+                if oldEvent.srcIn < newEvent.srcOut and newEvent.srcIn < oldEvent.srcOut:
+                    pairs.append((oldEvent, newEvent))
+                    oldIdx += 1
+                    newIdx += 1
+                elif oldEvent.srcOut <= newEvent.srcIn:
+                    oldPending.append(oldEvent)
+                    oldIdx += 1
+                else:
+                    newPending.append(newEvent)
+                    newIdx += 1
+            oldPending.extend(oldClipEvents[oldIdx:])
+            newPending.extend(newClipEvents[newIdx:])
+        for newClipEvents in newByClip.values():
+            newPending.extend(newClipEvents)
+        return pairs, oldPending, newPending
+
+    def execute(self, force=False):
+        """Compares the given timeline files.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        oldFilepath = self.getPlug("oldFilepath", SDirection.kIn).value
+        newFilepath = self.getPlug("newFilepath", SDirection.kIn).value
+        fps = self.getPlug("fps", SDirection.kIn).value
+        for filepath in (oldFilepath, newFilepath):
+            if not os.path.isfile(filepath):
+                raise ValueError("A valid filepath to a timeline file is required. Got {0}".format(filepath))
+        if fps not in timecodeRates:
+            raise ValueError("The frame rate '{0}' is not supported. Please choose between: "
+                             "{1}.".format(fps, ", ".join(timecodeRates)))
+        try:
+            oldEvents = list(iterTimelineEvents(oldFilepath, fps))
+            newEvents = list(iterTimelineEvents(newFilepath, fps))
+        except Exception as e:
+            raise RuntimeError("The timeline files could not be read: \n {0}".format(str(e)))
+
+        exactPairs, oldPending, newPending = self._matchExact(oldEvents, newEvents)
+        trimmed, removed, added = self._matchOverlaps(oldPending, newPending)
+        moved = []
+        unchanged = 0
+        for oldEvent, newEvent in exactPairs:
+            if oldEvent.recIn == newEvent.recIn and oldEvent.track == newEvent.track:
+                unchanged += 1
+            else:
+                moved.append((oldEvent, newEvent))
+        logger.info("Timeline diff: {0} added, {1} removed, {2} moved, {3} trimmed, {4} unchanged.".format(
+            len(added), len(removed), len(moved), len(trimmed), unchanged))
+        self.getPlug("added", SDirection.kOut).setValue(sorted(added, key=lambda e: e.recIn))
+        self.getPlug("removed", SDirection.kOut).setValue(sorted(removed, key=lambda e: e.recIn))
+        self.getPlug("moved", SDirection.kOut).setValue(moved)
+        self.getPlug("trimmed", SDirection.kOut).setValue(trimmed)
+        self.getPlug("unchanged", SDirection.kOut).setValue(unchanged)
+        super(self.__class__, self).execute()
+
+
+class DVR_TimelineDuplicate(DVR_Base):
+    """Operator to duplicate a list of timelines like versioned backups.
+    The name of each duplicate is created with the template (see DVR_TimelineNamesSet), by default the name of the
+    timeline with the next version suffix, like "EP101_cut_v003" for "EP101_cut_v002". The names of the project
+    timelines are read once to check the collisions, and onCollision selects what to do when a name is used:
+    "Increment" the version until the name is free, "Skip" the timeline or raise an "Error" before duplicating any
+    timeline.
+    If the archiveFolder is given, the duplicates are created in that folder of the media pool.
+    Works in Davinci Resolve.
+
+    """
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_project = SPlug(
+            code="project",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_timelines = SPlug(
+            code="timelines",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_template = SPlug(
+            code="template",
+            value="{base}_v{version:03d}",
+            type=SType.kString,
+            direction=SDirection.kIn,
+            parent=self)
+        i_onCollision = SPlug(
+            code="onCollision",
+            value="Increment",
+            type=SType.kEnum,
+            options=["Error", "Skip", "Increment"],
+            direction=SDirection.kIn,
+            parent=self)
+        i_archiveFolder = SPlug(
+            code="archiveFolder",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        o_timelines = SPlug(
+            code="timelines",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_names = SPlug(
+            code="names",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_project)
+        self.addPlug(i_timelines)
+        self.addPlug(i_template)
+        self.addPlug(i_onCollision)
+        self.addPlug(i_archiveFolder)
+        self.addPlug(o_timelines)
+        self.addPlug(o_names)
 
     def execute(self, force=False):
-        """Imports a given project in Davinci Resolve.
+        """Computes the names of the duplicates and duplicates the timelines.
 
         @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
 
         """
         self.checkDvr()
-        filepath = self.getPlug("filepath", SDirection.kIn).value
-        if not filepath or not filepath.endswith(".drp"):
-            raise ValueError("The filepath to the project have to be a .drp format.")
+        project = self.getPlug("project", SDirection.kIn).value
+        timelines = self.getPlug("timelines", SDirection.kIn).value
+        template = self.getPlug("template", SDirection.kIn).value
+        onCollision = self.getPlug("onCollision", SDirection.kIn).value
+        archiveFolder = self.getPlug("archiveFolder", SDirection.kIn).value
+        self.checkClass(project, "project")
+        self.checkClass(timelines, "timeline", isList=True)
+        if archiveFolder is not None:
+            self.checkClass(archiveFolder, "folder")
+        if not template:
+            raise ValueError("A name template is required.")
+
+        date = time.strftime("%Y%m%d")
+        usedNames = set(self.getTimelineNames(project))
+        duplicates = []
+        for index, timeline in enumerate(timelines, 1):
+            name = self.dvrCall(timeline, "GetName")
+            newName = self.getUniqueTimelineName(template, name, index, date, usedNames, onCollision)
+            if newName is not None:
+                usedNames.add(newName)
+                duplicates.append((timeline, name, newName))
+
+        mediapool = self.dvrCall(project, "GetMediaPool")
+        previousFolder = None
+        if archiveFolder is not None:
+            previousFolder = self.dvrCall(mediapool, "GetCurrentFolder")
+            if not self.dvrCall(mediapool, "SetCurrentFolder", archiveFolder):
+                raise RuntimeError("The archive folder could not be set like the current folder of the media pool.")
+        newTimelines = []
+        names = []
         msg = ""
+        failedNames = []
         try:
-            result = projectManager.ImportProject(filepath)
-        except Exception as e:
-            msg = str(e)
-            result = False
-        if not result:
-            raise RuntimeError("The project couldn't be imported: {0}".format(msg))
+            for timeline, name, newName in duplicates:
+                try:
+                    newTimeline = self.dvrCall(timeline, "DuplicateTimeline", newName)
+                except Exception as e:
+                    msg += "\n " + str(e)
+                    newTimeline = None
+                if newTimeline:
+                    newTimelines.append(newTimeline)
+                    names.append(newName)
+                else:
+                    failedNames.append(name)
+        finally:
+            # The duplicates are also added like clips to the archive folder, or to the current folder
+            self.invalidateCache(project)
+            self.invalidateCache(self.dvrCall(mediapool, "GetCurrentFolder"))
+            if previousFolder is not None:
+                self.dvrCall(mediapool, "SetCurrentFolder", previousFolder)
+        if failedNames:
+            raise RuntimeError("The timelines '{0}' could not be duplicated: {1}".format(str(failedNames), msg))
+
+        self.getPlug("timelines", SDirection.kOut).setValue(newTimelines)
+        self.getPlug("names", SDirection.kOut).setValue(names)
         super(self.__class__, self).execute()
 
 
@@ -1220,9 +6095,10 @@ class DVR_TimelineExport(DVR_Base):
         msg = ""
         try:
             if type(timelineType.get("type")) is list:
-                result = timeline.Export(filepath, timelineType.get("type")[0], timelineType.get("type")[1])
+                result = self.dvrCall(timeline, "Export", filepath, timelineType.get("type")[0],
+                                      timelineType.get("type")[1])
             else:
-                result = timeline.Export(filepath, timelineType.get("type"))
+                result = self.dvrCall(timeline, "Export", filepath, timelineType.get("type"))
         except Exception as e:
             msg = str(e)
             result = False
@@ -1233,11 +6109,159 @@ class DVR_TimelineExport(DVR_Base):
         super(self.__class__, self).execute()
 
 
+class DVR_TimelineGaps(DVR_Base):
+    """Operator to find the gaps, the overlaps and the short items (flash frames) of the tracks of a timeline.
+    The start and end of the items of each track of the trackType are read once and sorted, and a single sweep
+    over each track finds the gaps between items and the items that overlap. The gaps of each track start at its
+    first item, activate leadingGaps to report the range from the start of the timeline to the first item of
+    each track like a gap too. The items shorter than minDuration frames are returned in the shortItems output.
+    The uncovered output has the frame ranges without items in any track of the trackType, from the start of the
+    timeline to its last item.
+    The gaps, overlaps and uncovered ranges are dictionaries with the track index, start and end frames (end
+    exclusive), and the overlaps and short items have the timeline items too.
+    Works in Davinci Resolve.
+
+    """
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_timeline = SPlug(
+            code="timeline",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_trackType = SPlug(
+            code="trackType",
+            value="video",
+            type=SType.kEnum,
+            options=["video", "audio", "subtitle"],
+            direction=SDirection.kIn,
+            parent=self)
+        i_minDuration = SPlug(
+            code="minDuration",
+            value=2,
+            type=SType.kInt,
+            direction=SDirection.kIn,
+            parent=self)
+        i_leadingGaps = SPlug(
+            code="leadingGaps",
+            value=False,
+            type=SType.kBool,
+            direction=SDirection.kIn,
+            parent=self)
+        o_gaps = SPlug(
+            code="gaps",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_overlaps = SPlug(
+            code="overlaps",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_shortItems = SPlug(
+            code="shortItems",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_uncovered = SPlug(
+            code="uncovered",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_timeline)
+        self.addPlug(i_trackType)
+        self.addPlug(i_minDuration)
+        self.addPlug(i_leadingGaps)
+        self.addPlug(o_gaps)
+        self.addPlug(o_overlaps)
+        self.addPlug(o_shortItems)
+        self.addPlug(o_uncovered)
+
+    def _readTrack(self, timeline, trackType, trackIdx):
+        """Reads the ranges of the items of a track, sorted by start and end.
+
+        @param timeline Resolve.Timeline: The timeline.
+        @param trackType str: The type of the track.
+        @param trackIdx int: The index of the track.
+
+        @return tuple: The items, and the starts and ends like arrays, all in the same order.
+
+        """
+        items = self.dvrCall(timeline, "GetItemListInTrack", trackType, trackIdx) or []
+        calls = [(self.dvrSubmit(item, "GetStart"), self.dvrSubmit(item, "GetEnd")) for item in items]
+        ranges = sorted((startFuture.result(), endFuture.result(), idx)
+                        for idx, (startFuture, endFuture) in enumerate(calls))
+        return ([items[idx] for _, _, idx in ranges], array.array("q", [start for start, _, _ in ranges]),
+                array.array("q", [end for _, end, _ in ranges]))
+
+    def execute(self, force=False):
+        """Reads the item ranges of each track and reports the gaps, overlaps, short items and uncovered ranges.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        self.checkDvr()
+        timeline = self.getPlug("timeline", SDirection.kIn).value
+        trackType = self.getPlug("trackType", SDirection.kIn).value
+        minDuration = self.getPlug("minDuration", SDirection.kIn).value
+        leadingGaps = self.getPlug("leadingGaps", SDirection.kIn).value
+        self.checkClass(timeline, "timeline")
+        timelineStart = self.dvrCall(timeline, "GetStartFrame")
+
+        gaps = []
+        overlaps = []
+        shortItems = []
+        allRanges = []
+        for trackIdx in range(1, self.dvrCall(timeline, "GetTrackCount", trackType) + 1):
+            items, starts, ends = self._readTrack(timeline, trackType, trackIdx)
+            if not items:
+                continue
+            coveredEnd = timelineStart if leadingGaps else starts[0]
+            coveredIdx = None
+            for idx, (start, end) in enumerate(zip(starts, ends)):
+                if end - start < minDuration:
+                    shortItems.append({"track": trackIdx, "start": start, "end": end, "item": items[idx]})
+                if start > coveredEnd:
+                    gaps.append({"track": trackIdx, "start": coveredEnd, "end": start})
+                elif start < coveredEnd and coveredIdx is not None:
+                    overlaps.append({"track": trackIdx, "start": start, "end": min(end, coveredEnd),
+                                     "items": [items[coveredIdx], items[idx]]})
+                if end > coveredEnd:
+                    coveredEnd = end
+                    coveredIdx = idx
+            allRanges.extend(zip(starts, ends))
+
+        # The union of the ranges of all the tracks
+        uncovered = []
+        coveredEnd = timelineStart
+        for start, end in sorted(allRanges):
+            if start > coveredEnd:
+                uncovered.append({"track": 0, "start": coveredEnd, "end": start})
+            coveredEnd = max(coveredEnd, end)
+
+        self.getPlug("gaps", SDirection.kOut).setValue(gaps)
+        self.getPlug("overlaps", SDirection.kOut).setValue(overlaps)
+        self.getPlug("shortItems", SDirection.kOut).setValue(shortItems)
+        self.getPlug("uncovered", SDirection.kOut).setValue(uncovered)
+        super(self.__class__, self).execute()
+
+
 class DVR_TimelineGet(DVR_Base):
     """Operator to get a Davinci Resolve Timeline object.
     Select the getMethod to be able to retrieve a timeline by name, by index number or
     get the current open timeline. For the ByName and ByIndex methods you can specify the value
     in the key input plug.
+    The ByName research can be split in several executions with the timeBudget input, in milliseconds.
+    When the budget runs out before finding the timeline, a cursor output is returned. Connect the cursor
+    output to the cursor input of the next execution to continue the research. The cursor output is None once
+    the research is completed.
     Works in Davinci Resolve.
 
     """
@@ -1263,17 +6287,38 @@ class DVR_TimelineGet(DVR_Base):
             type=SType.kString,
             direction=SDirection.kIn,
             parent=self)
+        i_timeBudget = SPlug(
+            code="timeBudget",
+            value=0,
+            type=SType.kInt,
+            direction=SDirection.kIn,
+            parent=self)
+        i_cursor = SPlug(
+            code="cursor",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
         o_timeline = SPlug(
             code="timeline",
             value=None,
             type=SType.kInstance,
             direction=SDirection.kOut,
             parent=self)
+        o_cursor = SPlug(
+            code="cursor",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
 
         self.addPlug(i_project)
         self.addPlug(i_getMethod)
         self.addPlug(i_key)
+        self.addPlug(i_timeBudget)
+        self.addPlug(i_cursor)
         self.addPlug(o_timeline)
+        self.addPlug(o_cursor)
 
     def execute(self, force=False):
         """Returns the specified timeline obj from Resolve.
@@ -1285,34 +6330,48 @@ class DVR_TimelineGet(DVR_Base):
         project = self.getPlug("project", SDirection.kIn).value
         getMethod = self.getPlug("getMethod", SDirection.kIn).value
         timeKey = self.getPlug("key", SDirection.kIn).value
+        timeBudget = self.getPlug("timeBudget", SDirection.kIn).value
+        cursor = self.getPlug("cursor", SDirection.kIn).value
         self.checkClass(project, "project")
 
+        outCursor = None
         if getMethod == "ByName":
             timeline = None
-            for index in range(1, project.GetTimelineCount() + 1):
-                timelineAux = project.GetTimelineByIndex(index)
-                if timelineAux.GetName() == timeKey:
+            deadline = self.getDeadline(timeBudget)
+            timelineCount = self.dvrCall(project, "GetTimelineCount")
+            cursorKey = (self.dvrCall(project, "GetUniqueId"), timeKey)
+            index = self.readCursor(cursor, cursorKey) or 1
+            while index <= timelineCount:
+                timelineAux = self.dvrCall(project, "GetTimelineByIndex", index)
+                if self.dvrCall(timelineAux, "GetName") == timeKey:
                     timeline = timelineAux
                     break
-            if timeline is None:
+                index += 1
+                if index <= timelineCount and self.isExpired(deadline):
+                    outCursor = self.makeCursor(cursorKey, index)
+                    logger.info("Timeline research paused after {0} of {1} timelines.".format(
+                        index - 1, timelineCount))
+                    break
+            if timeline is None and outCursor is None:
                 logger.warning("Timeline with name '{0}' not found.".format(timeKey))
         elif getMethod == "ByIndex":
             # Index sanity checks
-            timeIdx = self.getDrvIdx(timeKey, "Timeline", project.GetTimelineCount())
+            timeIdx = self.getDrvIdx(timeKey, "Timeline", self.dvrCall(project, "GetTimelineCount"))
             # Get the timeline for the given index
             try:
-                timeline = project.GetTimelineByIndex(timeIdx)
+                timeline = self.dvrCall(project, "GetTimelineByIndex", timeIdx)
             except Exception as e:
                 raise RuntimeError("The timeline at index {0} could not be get.".format(timeIdx))
         elif getMethod == "Current":
             try:
-                timeline = project.GetCurrentTimeline()
+                timeline = self.dvrCall(project, "GetCurrentTimeline")
             except Exception as e:
                 raise RuntimeError("The current timeline could not be get.")
         else:
             raise ValueError("Get Method '{0}' is not supported. Please choose between: "
                              "'ByName', 'ByIndex', 'Current'.".format(getMethod))
         self.getPlug("timeline", SDirection.kOut).setValue(timeline)
+        self.getPlug("cursor", SDirection.kOut).setValue(outCursor)
         super(self.__class__, self).execute()
 
 
@@ -1355,10 +6414,11 @@ class DVR_TimelineSet(DVR_Base):
 
         msg = ""
         try:
-            result = project.SetCurrentTimeline(timeline)
+            result = self.dvrCall(project, "SetCurrentTimeline", timeline)
         except Exception as e:
             msg = str(e)
             result = False
+        self.invalidateCache(project)
         if not result:
             raise RuntimeError("The current timeline could not be set: \n {0}".format(msg))
 
@@ -1462,17 +6522,20 @@ class DVR_TimelineImport(DVR_Base):
                 importOptions["sourceClipsFolders"] = sourceClipsFolders
         # Import the timeline
         try:
-            timeline = project.GetMediaPool().ImportTimelineFromFile(filepath, importOptions)
+            mediapool = self.dvrCall(project, "GetMediaPool")
+            timeline = self.dvrCall(mediapool, "ImportTimelineFromFile", filepath, importOptions)
         except Exception as e:
             raise RuntimeError("Timeline import process has failed: {0}".format(str(e)))
+        self.invalidateCache()
 
         if timelineName and isDrt:  # To allow renaming of DRT files, rename the file after import
             msg = ""
             try:
-                result = timeline.SetName(timelineName)
+                result = self.dvrCall(timeline, "SetName", timelineName)
             except Exception as e:
                 msg = str(e)
                 result = False
+            self.invalidateCache(timeline)
             if not result:
                 logger.warning("The timeline could not be renamed after the import: \n{0}".format(msg))
         self.getPlug("timeline", SDirection.kOut).setValue(timeline)
@@ -1546,12 +6609,12 @@ class DVR_TimelineItemGet(DVR_Base):
         resultItem = None
         for item in items:
             if nameSource == "TimelineItem":
-                itemName = item.GetName()
+                itemName = self.dvrCall(item, "GetName")
             elif nameSource == "MediaPoolClip":
-                mediaPoolItemObj = item.GetMediaPoolItem()
+                mediaPoolItemObj = self.dvrCall(item, "GetMediaPoolItem")
                 if not mediaPoolItemObj:
                     continue
-                itemName = mediaPoolItemObj.GetClipProperty("Clip Name")
+                itemName = self.dvrCall(mediaPoolItemObj, "GetClipProperty", "Clip Name")
             else:
                 raise ValueError("Name source {0} is nor valid. Please choose between 'TimelineItem' or 'MediaPoolClip'.".format(nameSource))
 
@@ -1562,7 +6625,7 @@ class DVR_TimelineItemGet(DVR_Base):
 
         if resultItem:
             try:
-                mediaPoolItem = resultItem.GetMediaPoolItem()
+                mediaPoolItem = self.dvrCall(resultItem, "GetMediaPoolItem")
             except Exception as e:
                 logger.warning(e)
                 logger.warning("The MediaPool Item could not be get from the timeline item. Returning None.")
@@ -1579,6 +6642,10 @@ class DVR_TimelineItemsGet(DVR_Base):
     You can use different methods: 'All' to get the clips from all the tracks of the given trackType,
     'ByTrackIdx' to get only the items from the give track index or 'ByTrackName' to get the clips from the
     given track Name.
+    The 'All' method can be split in several executions with the timeBudget input, in milliseconds.
+    When the budget runs out, the items of the tracks read so far are returned with a cursor output. Connect the
+    cursor output to the cursor input of the next execution to continue with the next tracks. The cursor output
+    is None once all the tracks are read.
     Works in Davinci Resolve.
 
     """
@@ -1611,18 +6678,39 @@ class DVR_TimelineItemsGet(DVR_Base):
             type=SType.kString,
             direction=SDirection.kIn,
             parent=self)
+        i_timeBudget = SPlug(
+            code="timeBudget",
+            value=0,
+            type=SType.kInt,
+            direction=SDirection.kIn,
+            parent=self)
+        i_cursor = SPlug(
+            code="cursor",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
         o_items = SPlug(
             code="items",
             value=None,
             type=SType.kInstance,
             direction=SDirection.kOut,
             parent=self)
+        o_cursor = SPlug(
+            code="cursor",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
 
         self.addPlug(i_timeline)
         self.addPlug(i_trackType)
         self.addPlug(i_getMethod)
         self.addPlug(i_key)
+        self.addPlug(i_timeBudget)
+        self.addPlug(i_cursor)
         self.addPlug(o_items)
+        self.addPlug(o_cursor)
 
     def _getItemsFromTrack(self, timeline, trackType, trackIdx):
         """Gets the timeline items list for the given track type and index from the given timeline.
@@ -1636,7 +6724,7 @@ class DVR_TimelineItemsGet(DVR_Base):
 
         """
         try:
-            items = timeline.GetItemListInTrack(trackType, trackIdx)
+            items = self.dvrCall(timeline, "GetItemListInTrack", trackType, trackIdx)
         except Exception as e:
             raise RuntimeError("The clips could not be read from the timeline: \n{0}".format(str(e)))
         return items
@@ -1653,22 +6741,35 @@ class DVR_TimelineItemsGet(DVR_Base):
         trackType = self.getPlug("trackType", SDirection.kIn).value
         getMethod = self.getPlug("getMethod", SDirection.kIn).value
         trackKey = self.getPlug("key", SDirection.kIn).value
+        timeBudget = self.getPlug("timeBudget", SDirection.kIn).value
+        cursor = self.getPlug("cursor", SDirection.kIn).value
         # Check the input values
         self.checkClass(timeline, "timeline")
         # Get the items with the selected method
+        outCursor = None
         if getMethod == "All":
             items = []
-            for trackIdx in range(1, timeline.GetTrackCount(trackType) + 1):
+            deadline = self.getDeadline(timeBudget)
+            trackCount = self.dvrCall(timeline, "GetTrackCount", trackType)
+            cursorKey = (self.dvrCall(timeline, "GetUniqueId"), trackType)
+            trackIdx = self.readCursor(cursor, cursorKey) or 1
+            while trackIdx <= trackCount:
                 items.extend(self._getItemsFromTrack(timeline, trackType, trackIdx))
-            if not items:
+                trackIdx += 1
+                if trackIdx <= trackCount and self.isExpired(deadline):
+                    outCursor = self.makeCursor(cursorKey, trackIdx)
+                    logger.info("Timeline items reading paused after {0} of {1} {2} tracks.".format(
+                        trackIdx - 1, trackCount, trackType))
+                    break
+            if not items and outCursor is None and not cursor:
                 logger.warning("No Timeline Items found.")
         elif getMethod == "ByTrackIdx":
-            trackIdx = self.getDrvIdx(trackKey, "Timeline", timeline.GetTrackCount(trackType))
+            trackIdx = self.getDrvIdx(trackKey, "Timeline", self.dvrCall(timeline, "GetTrackCount", trackType))
             items = self._getItemsFromTrack(timeline, trackType, trackIdx)
         elif getMethod == "ByTrackName":
             items = []
-            for trackIdx in range(1, timeline.GetTrackCount(trackType) + 1):
-                if timeline.GetTrackName(trackType, trackIdx) == trackKey:
+            for trackIdx in range(1, self.dvrCall(timeline, "GetTrackCount", trackType) + 1):
+                if self.dvrCall(timeline, "GetTrackName", trackType, trackIdx) == trackKey:
                     items = self._getItemsFromTrack(timeline, trackType, trackIdx)
                     break
             if not items:
@@ -1679,6 +6780,7 @@ class DVR_TimelineItemsGet(DVR_Base):
 
 
         self.getPlug("items", SDirection.kOut).setValue(items)
+        self.getPlug("cursor", SDirection.kOut).setValue(outCursor)
         super(self.__class__, self).execute()
 
 
@@ -1721,7 +6823,7 @@ class DVR_TimelineNameGet(DVR_Base):
 
         # Export the timeline
         try:
-            name = timeline.GetName()
+            name = self.dvrCall(timeline, "GetName")
         except Exception as e:
             raise RuntimeError("The timeline name could not be get: \n{0}".format(str(e)))
         self.getPlug("name", SDirection.kOut).setValue(name)
@@ -1730,6 +6832,8 @@ class DVR_TimelineNameGet(DVR_Base):
 
 class DVR_TimelineNameSet(DVR_Base):
     """Operator to set the name of a timeline.
+    If the project is given, the names of its timelines are checked first and a warning is logged if the name is
+    already used by another timeline.
     Works in Davinci Resolve.
 
     """
@@ -1748,9 +6852,16 @@ class DVR_TimelineNameSet(DVR_Base):
             type=SType.kString,
             direction=SDirection.kIn,
             parent=self)
+        i_project = SPlug(
+            code="project",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
 
         self.addPlug(i_timeline)
         self.addPlug(i_name)
+        self.addPlug(i_project)
 
     def execute(self, force=False):
         """Returns the specified timeline obj from Resolve.
@@ -1761,21 +6872,297 @@ class DVR_TimelineNameSet(DVR_Base):
         self.checkDvr()
         timeline = self.getPlug("timeline", SDirection.kIn).value
         name = self.getPlug("name", SDirection.kIn).value
+        project = self.getPlug("project", SDirection.kIn).value
         # Check the input values
         self.checkClass(timeline, "timeline")
+        if project is not None:
+            self.checkClass(project, "project")
+            timelineNames = self.getTimelineNames(project)
+            if name in timelineNames and self.dvrCall(timeline, "GetName") != name:
+                logger.warning("The name '{0}' is already used by another timeline.".format(name))
 
         # Export the timeline
         msg = ""
         try:
-            result = timeline.SetName(name)
+            result = self.dvrCall(timeline, "SetName", name)
         except Exception as e:
             msg = str(e)
             result = False
+        # The clip of the timeline in the media pool is renamed too, so all the results are dropped
+        self.invalidateCache()
 
         if not result:
-            raise RuntimeError("The timeline name could not be set:  \n  {0}".format(msg))
+            raise RuntimeError("The timeline name could not be set. Check that the name is not used by another "
+                               "timeline:  \n  {0}".format(msg))
+        super(self.__class__, self).execute()
+
+
+class DVR_TimelineNamesSet(DVR_Base):
+    """Operator to rename a list of timelines with a name template. If the timelines list is empty, all the
+    timelines of the project are renamed.
+    The template is a Python format string with these tokens (see formatTimelineName):
+    {name}: The current name of the timeline.
+    {base}: The current name without the version suffix, like "EP101_cut" for "EP101_cut_v002".
+    {version}: The version of the current name plus one, or 1 if the name has no version suffix.
+    {index}: The position of the timeline in the list, starting at 1.
+    {date}: The current date, like "20240131".
+    The tokens accept format specifications, like "{base}_v{version:03d}".
+    The names of all the timelines of the project are read once to check the collisions. onCollision selects what
+    to do when the new name is already used: "Error" to raise an error before renaming any timeline, "Skip" to
+    keep the current name, or "Increment" to increment the version (or to add a number to the name if the template
+    has no {version} token) until the name is free.
+    Works in Davinci Resolve.
+
+    """
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_project = SPlug(
+            code="project",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_timelines = SPlug(
+            code="timelines",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kIn,
+            parent=self)
+        i_template = SPlug(
+            code="template",
+            value="{base}_v{version:03d}",
+            type=SType.kString,
+            direction=SDirection.kIn,
+            parent=self)
+        i_onCollision = SPlug(
+            code="onCollision",
+            value="Error",
+            type=SType.kEnum,
+            options=["Error", "Skip", "Increment"],
+            direction=SDirection.kIn,
+            parent=self)
+        o_timelines = SPlug(
+            code="timelines",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_names = SPlug(
+            code="names",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_skipped = SPlug(
+            code="skipped",
+            value=[],
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_project)
+        self.addPlug(i_timelines)
+        self.addPlug(i_template)
+        self.addPlug(i_onCollision)
+        self.addPlug(o_timelines)
+        self.addPlug(o_names)
+        self.addPlug(o_skipped)
+
+    def execute(self, force=False):
+        """Computes the new names, checks the collisions and renames the timelines.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        self.checkDvr()
+        project = self.getPlug("project", SDirection.kIn).value
+        timelines = self.getPlug("timelines", SDirection.kIn).value
+        template = self.getPlug("template", SDirection.kIn).value
+        onCollision = self.getPlug("onCollision", SDirection.kIn).value
+        self.checkClass(project, "project")
+        if not template:
+            raise ValueError("A name template is required.")
+        timelineNames = self.getTimelineNames(project)
+        if not timelines:
+            timelines = list(timelineNames.values())
+        self.checkClass(timelines, "timeline", isList=True)
+
+        # Compute all the names before renaming, so the Error policy doesn't leave the timelines half renamed
+        date = time.strftime("%Y%m%d")
+        usedNames = set(timelineNames)
+        renames = []
+        skipped = []
+        for index, timeline in enumerate(timelines, 1):
+            currentName = self.dvrCall(timeline, "GetName")
+            if self.formatTimelineName(template, currentName, index, date) == currentName:
+                continue
+            newName = self.getUniqueTimelineName(template, currentName, index, date, usedNames, onCollision)
+            if newName is None:
+                skipped.append(timeline)
+                continue
+            usedNames.discard(currentName)
+            usedNames.add(newName)
+            renames.append((timeline, currentName, newName))
+
+        renamed = []
+        names = []
+        msg = ""
+        failedNames = []
+        for timeline, currentName, newName in renames:
+            try:
+                result = self.dvrCall(timeline, "SetName", newName)
+            except Exception as e:
+                msg += "\n " + str(e)
+                result = False
+            if result:
+                renamed.append(timeline)
+                names.append(newName)
+            else:
+                failedNames.append(currentName)
+        if renames:
+            # The clips of the timelines in the media pool are renamed too, so all the results are dropped
+            self.invalidateCache()
+        if failedNames:
+            raise RuntimeError("The timelines '{0}' could not be renamed: {1}".format(str(failedNames), msg))
+
+        self.getPlug("timelines", SDirection.kOut).setValue(renamed)
+        self.getPlug("names", SDirection.kOut).setValue(names)
+        self.getPlug("skipped", SDirection.kOut).setValue(skipped)
+        super(self.__class__, self).execute()
+
+
+class DVR_TimelineTableRead(DVR_Base):
+    """Operator to read a CSV or Tabbed Text timeline file, like the ones created by DVR_TimelineExport,
+    into a table of columns. The table is a dictionary with the values of each column by the column name.
+    The timecode columns are converted to frame numbers and the known frame and count columns to integers, the
+    name, reel and clip columns are kept like text.
+    If NumPy is available the columns are numpy arrays, ready to be filtered, grouped or used to compute
+    statistics. If not, the numeric columns are array.array and the text columns lists.
+    This operator doesn't use the Resolve API, so it can be executed outside Davinci Resolve.
+
+    """
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_filepath = SPlug(
+            code="filepath",
+            value="",
+            type=SType.kFileIn,
+            direction=SDirection.kIn,
+            parent=self)
+        i_fps = SPlug(
+            code="fps",
+            value="24",
+            type=SType.kEnum,
+            options=timecodeRates,
+            direction=SDirection.kIn,
+            parent=self)
+        o_table = SPlug(
+            code="table",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_timecodeColumns = SPlug(
+            code="timecodeColumns",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+        o_rowCount = SPlug(
+            code="rowCount",
+            value=0,
+            type=SType.kInt,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_filepath)
+        self.addPlug(i_fps)
+        self.addPlug(o_table)
+        self.addPlug(o_timecodeColumns)
+        self.addPlug(o_rowCount)
+
+    def execute(self, force=False):
+        """Reads the given CSV or Tabbed Text timeline file into columns.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        filepath = self.getPlug("filepath", SDirection.kIn).value
+        fps = self.getPlug("fps", SDirection.kIn).value
+        if not os.path.isfile(filepath):
+            raise ValueError("A valid filepath to a CSV or Tabbed Text file is required. Got {0}".format(filepath))
+        if fps not in timecodeRates:
+            raise ValueError("The frame rate '{0}' is not supported. Please choose between: "
+                             "{1}.".format(fps, ", ".join(timecodeRates)))
+        try:
+            table, timecodeColumns = readTimelineTable(filepath, fps)
+        except Exception as e:
+            raise RuntimeError("The timeline table file could not be read: \n {0}".format(str(e)))
+        rowCount = len(next(iter(table.values()))) if table else 0
+        self.getPlug("table", SDirection.kOut).setValue(table)
+        self.getPlug("timecodeColumns", SDirection.kOut).setValue(timecodeColumns)
+        self.getPlug("rowCount", SDirection.kOut).setValue(rowCount)
+        super(self.__class__, self).execute()
+
+
+class DVR_TimelineXmlRead(DVR_Base):
+    """Operator to read the clips of a FCP7 XML or FCPXML (1.3 to 1.8) file, like the ones created by
+    DVR_TimelineExport. The file is parsed incrementally, so it can be used with big timeline files.
+    It returns a list of TimelineXmlClip records with the name, track, record and source in and out like frame
+    numbers and the asset id, name and media path of each clip.
+    Activate the stream flag to get a generator instead of a list, so the clips are read from the file
+    while they are consumed.
+    This operator doesn't use the Resolve API, so it can be executed outside Davinci Resolve.
+
+    """
+
+    def __init__(self, code, parent):
+        super(self.__class__, self).__init__(code, parent=parent)
+        i_filepath = SPlug(
+            code="filepath",
+            value="",
+            type=SType.kFileIn,
+            direction=SDirection.kIn,
+            parent=self)
+        i_stream = SPlug(
+            code="stream",
+            value=False,
+            type=SType.kBool,
+            direction=SDirection.kIn,
+            parent=self)
+        o_clips = SPlug(
+            code="clips",
+            value=None,
+            type=SType.kInstance,
+            direction=SDirection.kOut,
+            parent=self)
+
+        self.addPlug(i_filepath)
+        self.addPlug(i_stream)
+        self.addPlug(o_clips)
+
+    def execute(self, force=False):
+        """Reads the clips from the given timeline XML file.
+
+        @param force Bool: Sets the flag for forcing the execution even on clean nodes. (Default = False)
+
+        """
+        filepath = self.getPlug("filepath", SDirection.kIn).value
+        stream = self.getPlug("stream", SDirection.kIn).value
+        if not os.path.isfile(filepath):
+            raise ValueError("A valid filepath to a timeline XML file is required. Got {0}".format(filepath))
+        try:
+            clips = iterTimelineXmlClips(filepath)
+            if not stream:
+                clips = list(clips)
+        except Exception as e:
+            raise RuntimeError("The timeline XML file could not be read: \n {0}".format(str(e)))
+        self.getPlug("clips", SDirection.kOut).setValue(clips)
         super(self.__class__, self).execute()
 
+
 # TODO Issue #5 - Define Resolve DCC, create a Resolve method to launch Shift, ...
 catalog = {
     "Description": "A catalog to use Davinci Resolve in Shift. "
@@ -1786,28 +7173,52 @@ catalog = {
     "Operators": [
         [DVR_ClipPropertyGet, []],
         [DVR_ClipGet, []],
+        [DVR_ClipQuery, []],
+        [DVR_ClipUsageIndex, []],
         [DVR_ClipsGet, []],
+        [DVR_EdlRead, []],
         [DVR_FolderAdd, []],
         [DVR_FolderGet, []],
         [DVR_FolderList, []],
         [DVR_FolderNameGet, []],
         [DVR_FolderSet, []],
+        [DVR_MarkersGet, []],
+        [DVR_MarkersSet, []],
+        [DVR_MediaDuplicates, []],
+        [DVR_MediaImport, []],
+        [DVR_MediaRelink, []],
         [DVR_MetadataGet, []],
         [DVR_MetadataSet, []],
+        [DVR_MetricsFlush, []],
+        [DVR_ProjectArchive, []],
         [DVR_ProjectExport, []],
         [DVR_ProjectGet, []],
         [DVR_ProjectImport, []],
         [DVR_ProjectOpen, []],
+        [DVR_ProjectSnapshot, []],
+        [DVR_ProxyLink, []],
+        [DVR_RenderJobAdd, []],
+        [DVR_RenderStart, []],
+        [DVR_RenderWait, []],
+        [DVR_SessionEnd, []],
+        [DVR_SessionStart, []],
         [DVR_TakeAdd, []],
         [DVR_TakeGet, []],
         [DVR_TakeSet, []],
+        [DVR_TimelineCreate, []],
+        [DVR_TimelineDiff, []],
+        [DVR_TimelineDuplicate, []],
         [DVR_TimelineExport, []],
+        [DVR_TimelineGaps, []],
         [DVR_TimelineGet, []],
         [DVR_TimelineSet, []],
         [DVR_TimelineImport, []],
         [DVR_TimelineItemGet, []],
         [DVR_TimelineItemsGet, []],
         [DVR_TimelineNameGet, []],
-        [DVR_TimelineNameSet, []]
+        [DVR_TimelineNameSet, []],
+        [DVR_TimelineNamesSet, []],
+        [DVR_TimelineTableRead, []],
+        [DVR_TimelineXmlRead, []]
     ]
 }
@@ -0,0 +1,64 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("shift.core.workflow")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shift_resolve import iterEdlEvents  # noqa: E402
+
+
+EDL = """TITLE: Edit
+FCM: NON-DROP FRAME
+* HEADER COMMENT
+| HEADER NOTE
+
+001  A001     V     C        01:00:10:00 01:00:12:00 01:00:00:00 01:00:02:00
+* FROM CLIP NAME: Shot 1.mov
+*ASC_SOP (1.1 1.0 0.9)(0.01 0.0 -0.01)(1.0 1.0 1.0)
+*ASC_SAT 0.8
+002  B001     AA/V  D    012 00:00:00:00 00:00:01:00 01:00:02:00 01:00:03:00
+ |C:ResolveColorBlue |M:Note |D:1
+"""
+
+
+def writeEdl(tmp_path, content):
+    filepath = tmp_path / "edit.edl"
+    filepath.write_text(content)
+    return str(filepath)
+
+
+def test_edl_events(tmp_path):
+    events = list(iterEdlEvents(writeEdl(tmp_path, EDL), "24"))
+    assert len(events) == 2
+    first, second = events
+    # The comments before the first event belong to the header
+    assert (first.event, first.reel, first.track, first.transition) == (1, "A001", "V", "C")
+    assert (first.srcIn, first.srcOut, first.recIn, first.recOut) == (86640, 86688, 86400, 86448)
+    assert first.clipName == "Shot 1.mov"
+    assert first.comments == ("FROM CLIP NAME: Shot 1.mov", "ASC_SOP (1.1 1.0 0.9)(0.01 0.0 -0.01)(1.0 1.0 1.0)",
+                              "ASC_SAT 0.8")
+    assert first.cdl == {"slope": (1.1, 1.0, 0.9), "offset": (0.01, 0.0, -0.01), "power": (1.0, 1.0, 1.0),
+                         "saturation": 0.8}
+    assert (second.event, second.reel, second.track, second.transition) == (2, "B001", "AA/V", "D 012")
+    assert (second.srcIn, second.srcOut, second.recIn, second.recOut) == (0, 24, 86448, 86472)
+    assert second.clipName == ""
+    assert second.comments == ("|C:ResolveColorBlue |M:Note |D:1",)
+    assert second.cdl is None
+
+
+def test_drop_frame_edl(tmp_path):
+    content = "TITLE: Edit\nFCM: DROP FRAME\n001  A001 V C 00:01:00:02 00:01:00:04 00:00:00:00 00:00:00:02\n"
+    event, = iterEdlEvents(writeEdl(tmp_path, content), "29.97")
+    # The frames 00 and 01 of the minute 1 are dropped
+    assert (event.srcIn, event.srcOut) == (1800, 1802)
+
+
+@pytest.mark.parametrize("content, lineNumber", [
+    ("TITLE: Edit\n\n001  A001 V C 01:00:0a:00 01:00:01:00 01:00:00:00 01:00:01:00\n", 3),
+    ("TITLE: Edit\n001  A001 V C 01:00:00:00 01:00:01:00 01:00:00:00 01:00:01:00\n*ASC_SAT high\n", 3),
+])
+def test_invalid_lines_report_the_line_number(tmp_path, content, lineNumber):
+    with pytest.raises(ValueError, match="line {0}:".format(lineNumber)):
+        list(iterEdlEvents(writeEdl(tmp_path, content), "24"))
@@ -0,0 +1,89 @@
+import os
+import random
+import sys
+
+import pytest
+
+pytest.importorskip("shift.core.workflow")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import shift_resolve  # noqa: E402
+from shift_resolve import framesToTimecode, framesToTimecodes, timecodeToFrames, timecodesToFrames  # noqa: E402
+
+
+@pytest.mark.parametrize("fps", shift_resolve.timecodeRates)
+def test_non_drop_frame_round_trip(fps):
+    frames = list(range(0, 3 * 60 * 60, 7)) + [24 * 60 * 60 * shift_resolve.timecodeNominalFps[fps] - 1]
+    for frame in frames:
+        assert timecodeToFrames(framesToTimecode(frame, fps), fps) == frame
+
+
+@pytest.mark.parametrize("fps", ["29.97", "59.94"])
+def test_drop_frame_round_trip(fps):
+    for frame in range(0, 20 * 60 * 60, 3):
+        timecode = framesToTimecode(frame, fps, dropFrame=True)
+        assert ";" in timecode
+        assert timecodeToFrames(timecode, fps) == frame
+
+
+@pytest.mark.parametrize("fps, timecode, frame", [
+    ("29.97", "00:00:59;29", 1799),
+    ("29.97", "00:01:00;02", 1800),
+    ("29.97", "00:09:59;29", 17981),
+    ("29.97", "00:10:00;00", 17982),
+    ("29.97", "01:00:00;00", 107892),
+    ("59.94", "00:00:59;59", 3599),
+    ("59.94", "00:01:00;04", 3600),
+    ("59.94", "00:09:59;59", 35963),
+    ("59.94", "00:10:00;00", 35964),
+    ("59.94", "01:00:00;00", 215784),
+])
+def test_drop_frame_boundaries(fps, timecode, frame):
+    assert timecodeToFrames(timecode, fps) == frame
+    assert framesToTimecode(frame, fps, dropFrame=True) == timecode
+
+
+def test_drop_frame_skips_the_first_frames_of_each_minute():
+    assert framesToTimecode(1799, "29.97", dropFrame=True) == "00:00:59;29"
+    assert framesToTimecode(1800, "29.97", dropFrame=True) == "00:01:00;02"
+    assert framesToTimecode(3599, "59.94", dropFrame=True) == "00:00:59;59"
+    assert framesToTimecode(3600, "59.94", dropFrame=True) == "00:01:00;04"
+
+
+@pytest.mark.parametrize("fps", shift_resolve.timecodeRates)
+def test_vectorised_matches_scalar(fps):
+    generator = random.Random(fps)
+    dropFrame = fps in ("29.97", "59.94")
+    dayFrames = 24 * 60 * 60 * shift_resolve.timecodeNominalFps[fps]
+    if dropFrame:
+        dayFrames = timecodeToFrames("23:59:59;00", fps)
+    frames = [generator.randrange(0, dayFrames) for _ in range(2000)]
+    timecodes = framesToTimecodes(frames, fps, dropFrame)
+    assert list(timecodes) == [framesToTimecode(frame, fps, dropFrame) for frame in frames]
+    # Mixed layouts, empty values and timecodes with a single digit hour go through the scalar fallback
+    timecodes = list(timecodes) + ["", "1:00:00:00", " 01:00:00:00 ", "00:00:01.10"]
+    expected = [timecodeToFrames(timecode, fps) if timecode else -1 for timecode in timecodes]
+    assert list(timecodesToFrames(timecodes, fps)) == expected
+
+
+def test_vectorised_matches_scalar_without_numpy(monkeypatch):
+    timecodes = ["00:00:00:00", "01:00:00:00", "00:01:00;02", ""]
+    expected = list(timecodesToFrames(timecodes, "29.97"))
+    monkeypatch.setattr(shift_resolve, "numpy", None)
+    assert list(timecodesToFrames(timecodes, "29.97")) == expected
+
+
+@pytest.mark.parametrize("timecode", ["01x00y00z00", "01:00:00x00", "0a:00:00:00", "01:00:00"])
+def test_invalid_timecodes_are_rejected(timecode):
+    with pytest.raises(ValueError):
+        timecodeToFrames(timecode, "24")
+    with pytest.raises(ValueError):
+        timecodesToFrames([timecode, "01:00:00:00"], "24")
+
+
+@pytest.mark.parametrize("timecodes", [["01:00:00:00"], ["1:00:00:00"], []])
+def test_invalid_frame_rates_are_rejected(timecodes):
+    with pytest.raises(ValueError):
+        timecodeToFrames("01:00:00:00", "12")
+    with pytest.raises(ValueError):
+        timecodesToFrames(timecodes, "12")
@@ -0,0 +1,83 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("shift.core.workflow")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shift.core.constants import SDirection  # noqa: E402
+from shift_resolve import DVR_TimelineDiff, TimelineEvent, iterTimelineEvents  # noqa: E402
+
+
+OLD_EDL = """TITLE: Edit v1
+FCM: NON-DROP FRAME
+
+001  A001     V     C        01:00:00:00 01:00:02:00 01:00:00:00 01:00:02:00
+002  B001     V     C        00:00:00:00 00:00:02:00 01:00:02:00 01:00:04:00
+003  C001     V     C        00:00:10:00 00:00:12:00 01:00:04:00 01:00:06:00
+004  D001     V     C        00:00:00:00 00:00:01:00 01:00:06:00 01:00:07:00
+"""
+
+NEW_EDL = """TITLE: Edit v2
+FCM: NON-DROP FRAME
+
+001  A001     V     C        01:00:00:00 01:00:02:00 01:00:00:00 01:00:02:00
+002  C001     V     C        00:00:11:00 00:00:12:00 01:00:04:00 01:00:05:00
+003  B001     V     C        00:00:00:00 00:00:02:00 01:00:06:00 01:00:08:00
+004  E001     V     C        00:00:00:00 00:00:01:00 01:00:08:00 01:00:09:00
+"""
+
+
+def writeFile(tmp_path, name, content):
+    filepath = tmp_path / name
+    filepath.write_text(content)
+    return str(filepath)
+
+
+def runDiff(oldFilepath, newFilepath):
+    operator = DVR_TimelineDiff("diff", None)
+    operator.getPlug("oldFilepath", SDirection.kIn).setValue(oldFilepath)
+    operator.getPlug("newFilepath", SDirection.kIn).setValue(newFilepath)
+    operator.getPlug("fps", SDirection.kIn).setValue("24")
+    operator.execute()
+    return {name: operator.getPlug(name, SDirection.kOut).value
+            for name in ("added", "removed", "moved", "trimmed", "unchanged")}
+
+
+def test_timeline_diff(tmp_path):
+    diff = runDiff(writeFile(tmp_path, "old.edl", OLD_EDL), writeFile(tmp_path, "new.edl", NEW_EDL))
+    assert diff["unchanged"] == 1
+    assert [(old.clip, old.recIn, new.recIn) for old, new in diff["moved"]] == [("B001", 86448, 86544)]
+    assert [(old.clip, old.srcIn, new.srcIn, new.srcOut) for old, new in diff["trimmed"]] == [
+        ("C001", 240, 264, 288)]
+    assert [event.clip for event in diff["removed"]] == ["D001"]
+    assert [event.clip for event in diff["added"]] == ["E001"]
+
+
+def test_identical_timelines(tmp_path):
+    diff = runDiff(writeFile(tmp_path, "old.edl", OLD_EDL), writeFile(tmp_path, "new.edl", OLD_EDL))
+    assert diff["unchanged"] == 4
+    assert not (diff["added"] or diff["removed"] or diff["moved"] or diff["trimmed"])
+
+
+def test_repeated_clips_are_paired_in_record_order(tmp_path):
+    old = OLD_EDL + "005  A001     V     C        01:00:00:00 01:00:02:00 01:00:07:00 01:00:09:00\n"
+    new = OLD_EDL + "005  A001     V     C        01:00:00:00 01:00:02:00 01:00:09:00 01:00:11:00\n"
+    diff = runDiff(writeFile(tmp_path, "old.edl", old), writeFile(tmp_path, "new.edl", new))
+    assert diff["unchanged"] == 4
+    assert [(oldEvent.recIn, newEvent.recIn) for oldEvent, newEvent in diff["moved"]] == [(86568, 86616)]
+
+
+def test_table_events(tmp_path):
+    content = ("Name,V,Source In,Source Out,Record In,Record Out\n"
+               "A001,1,00:00:00:00,00:00:01:00,01:00:00:00,01:00:01:00\n")
+    events = list(iterTimelineEvents(writeFile(tmp_path, "edit.csv", content), "24"))
+    assert events == [TimelineEvent("A001", "1", 0, 24, 86400, 86424)]
+
+
+def test_unsupported_files_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        list(iterTimelineEvents(writeFile(tmp_path, "edit.otio", "{}")))
+    with pytest.raises(ValueError):
+        list(iterTimelineEvents(writeFile(tmp_path, "edit.csv", "Name,Notes\nA001,First\n")))
@@ -0,0 +1,51 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("shift.core.workflow")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import shift_resolve  # noqa: E402
+from shift_resolve import readTimelineTable  # noqa: E402
+
+
+ROWS = [
+    ["#", "Reel", "Name", "Record In", "Record Out", "Source In", "Frames", "Notes"],
+    ["1", "001", "0042", "01:00:00:00", "01:00:01:00", "00:00:10:00", "24", "First"],
+    ["2", "002", "0043", "01:00:01:00", "01:00:01:12", "", "12", "007"],
+    ["3", "003", "0044", "01:00:01:12", "01:00:02:00"],
+]
+
+
+def writeTable(tmp_path, name, delimiter):
+    filepath = tmp_path / name
+    # The BOM of the files exported by Resolve is skipped
+    filepath.write_text("\ufeff" + "\n".join(delimiter.join(row) for row in ROWS) + "\n", encoding="utf-8")
+    return str(filepath)
+
+
+@pytest.mark.parametrize("name, delimiter", [("edit.csv", ","), ("edit.txt", "\t")])
+@pytest.mark.parametrize("withNumpy", [True, False])
+def test_timeline_table(tmp_path, monkeypatch, name, delimiter, withNumpy):
+    if not withNumpy:
+        monkeypatch.setattr(shift_resolve, "numpy", None)
+    table, timecodeColumns = readTimelineTable(writeTable(tmp_path, name, delimiter), "24")
+    assert list(table) == ROWS[0]
+    assert timecodeColumns == ["Record In", "Record Out", "Source In"]
+    assert list(table["#"]) == [1, 2, 3]
+    # The name and reel columns keep the leading zeros
+    assert list(table["Reel"]) == ["001", "002", "003"]
+    assert list(table["Name"]) == ["0042", "0043", "0044"]
+    assert list(table["Record In"]) == [86400, 86424, 86436]
+    assert list(table["Record Out"]) == [86424, 86436, 86448]
+    # The empty and missing values are converted to -1
+    assert list(table["Source In"]) == [240, -1, -1]
+    assert list(table["Frames"]) == [24, 12, -1]
+    assert list(table["Notes"]) == ["First", "007", ""]
+
+
+def test_empty_table(tmp_path):
+    filepath = tmp_path / "empty.csv"
+    filepath.write_text("")
+    assert readTimelineTable(str(filepath)) == ({}, [])
@@ -0,0 +1,117 @@
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("shift.core.workflow")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from shift_resolve import TimelineXmlClip, iterTimelineXmlClips  # noqa: E402
+
+
+FCPXML = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE fcpxml>
+<fcpxml version="1.8">
+  <resources>
+    <format id="r1" frameDuration="1/24s"/>
+    <asset id="r2" name="A001" src="file:///Volumes/Media/A001.mov"/>
+    <asset id="r3" name="B001">
+      <media-rep src="file:///Volumes/Media/B%20001.mov"/>
+    </asset>
+    <media id="r4" name="Compound">
+      <sequence format="r1">
+        <spine>
+          <asset-clip name="Inside" ref="r2" offset="0s" start="0s" duration="1s"/>
+        </spine>
+      </sequence>
+    </media>
+  </resources>
+  <library>
+    <event name="Day 1">
+      <project name="Edit">
+        <sequence format="r1">
+          <spine>
+            <asset-clip name="Shot 1" ref="r2" offset="0s" start="10s" duration="2s">
+              <asset-clip ref="r3" lane="1" offset="11s" start="0s" duration="1s"/>
+            </asset-clip>
+            <clip name="Shot 2" offset="2s" duration="3s">
+              <video ref="r3" offset="0s" start="20s" duration="3s"/>
+            </clip>
+            <ref-clip ref="r4" offset="5s" duration="1s"/>
+          </spine>
+        </sequence>
+      </project>
+    </event>
+  </library>
+</fcpxml>
+"""
+
+XMEML = """<?xml version="1.0" encoding="UTF-8"?>
+<xmeml version="5">
+  <sequence>
+    <name>Edit</name>
+    <media>
+      <video>
+        <track>
+          <clipitem id="c1">
+            <name>Shot 1</name>
+            <start>0</start><end>48</end><in>240</in><out>288</out>
+            <file id="f1">
+              <name>A001.mov</name>
+              <pathurl>file://localhost/Volumes/Media/A001.mov</pathurl>
+            </file>
+          </clipitem>
+          <clipitem id="c2">
+            <name>Shot 2</name>
+            <start>48</start><end>72</end><in>0</in><out>24</out>
+            <file id="f1"/>
+          </clipitem>
+        </track>
+      </video>
+      <audio>
+        <track>
+          <clipitem id="c3">
+            <name>Shot 1</name>
+            <start>0</start><end>48</end><in>240</in><out>288</out>
+            <file id="f1"/>
+          </clipitem>
+        </track>
+      </audio>
+    </media>
+  </sequence>
+</xmeml>
+"""
+
+
+def writeFile(tmp_path, name, content):
+    filepath = tmp_path / name
+    filepath.write_text(content)
+    return str(filepath)
+
+
+def test_fcpxml_clips(tmp_path):
+    clips = list(iterTimelineXmlClips(writeFile(tmp_path, "edit.fcpxml", FCPXML)))
+    assert clips == [
+        TimelineXmlClip("Shot 1", "L0", 0, 48, 240, 288, "r2", "A001", "/Volumes/Media/A001.mov"),
+        # The connected clip is placed in the timeline from the start of its parent clip
+        TimelineXmlClip("B001", "L1", 24, 48, 0, 24, "r3", "B001", "/Volumes/Media/B 001.mov"),
+        # The clips take the media and its start from their video child
+        TimelineXmlClip("Shot 2", "L0", 48, 120, 480, 552, "r3", "B001", "/Volumes/Media/B 001.mov"),
+        # The compound clips have no media path and their inner sequence is skipped
+        TimelineXmlClip("Compound", "L0", 120, 144, 0, 24, "r4", "Compound", ""),
+    ]
+
+
+def test_fcp7_xml_clips(tmp_path):
+    clips = list(iterTimelineXmlClips(writeFile(tmp_path, "edit.xml", XMEML)))
+    assert clips == [
+        TimelineXmlClip("Shot 1", "V1", 0, 48, 240, 288, "f1", "A001.mov", "/Volumes/Media/A001.mov"),
+        # The file defined by the first clip is resolved by its id
+        TimelineXmlClip("Shot 2", "V1", 48, 72, 0, 24, "f1", "A001.mov", "/Volumes/Media/A001.mov"),
+        TimelineXmlClip("Shot 1", "A1", 0, 48, 240, 288, "f1", "A001.mov", "/Volumes/Media/A001.mov"),
+    ]
+
+
+def test_unknown_xml_root_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        iterTimelineXmlClips(writeFile(tmp_path, "edit.xml", "<project><clip/></project>"))